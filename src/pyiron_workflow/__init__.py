@@ -8,10 +8,14 @@ except importlib.metadata.PackageNotFoundError:
     __version__ = "0.0.0+unknown"
 
 # Public API
+from pyiron_workflow.api import ConstantCache as ConstantCache
+from pyiron_workflow.api import DurationHistory as DurationHistory
 from pyiron_workflow.api import (
     ExecutorInstructions as ExecutorInstructions,
 )
 from pyiron_workflow.api import ProgressHook as ProgressHook
+from pyiron_workflow.api import Resources as Resources
+from pyiron_workflow.api import RetryPolicy as RetryPolicy
 from pyiron_workflow.api import RunConfig as RunConfig
 from pyiron_workflow.api import Workflow as Workflow
 from pyiron_workflow.api import node as node
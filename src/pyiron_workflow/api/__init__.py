@@ -1,9 +1,13 @@
 from pyiron_workflow.api import schemas as schemas
 from pyiron_workflow.api import tools as tools
+from pyiron_workflow.api.schemas import ConstantCache as ConstantCache
+from pyiron_workflow.api.schemas import DurationHistory as DurationHistory
 from pyiron_workflow.api.schemas import (
     ExecutorInstructions as ExecutorInstructions,
 )
 from pyiron_workflow.api.schemas import ProgressHook as ProgressHook
+from pyiron_workflow.api.schemas import Resources as Resources
+from pyiron_workflow.api.schemas import RetryPolicy as RetryPolicy
 from pyiron_workflow.api.schemas import RunConfig as RunConfig
 from pyiron_workflow.api.schemas import Workflow as Workflow
 from pyiron_workflow.api.tools import node as node
@@ -4,6 +4,7 @@ from pyiron_workflow.dag import Macro as Macro
 from pyiron_workflow.datatypes import EdgeTuple as EdgeTuple
 from pyiron_workflow.execution import ExecutorInstructions as ExecutorInstructions
 from pyiron_workflow.execution import ProgressHook as ProgressHook
+from pyiron_workflow.execution import RetryPolicy as RetryPolicy
 from pyiron_workflow.execution import Run as Run
 from pyiron_workflow.execution import RunConfig as RunConfig
 from pyiron_workflow.execution import RunStatus as RunStatus
@@ -14,6 +15,9 @@ from pyiron_workflow.flowcontrollers.tryflow import (
     UnmatchedExceptionError as UnmatchedExceptionError,
 )
 from pyiron_workflow.flowcontrollers.whileflow import While as While
+from pyiron_workflow.folding import ConstantCache as ConstantCache
+from pyiron_workflow.history import DurationHistory as DurationHistory
+from pyiron_workflow.resources import Resources as Resources
 from pyiron_workflow.transformers import Transform1toN as Transform1toN
 from pyiron_workflow.transformers import TransformNto1 as TransformNto1
 from pyiron_workflow.validation import (
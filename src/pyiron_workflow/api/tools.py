@@ -1,11 +1,20 @@
 from pyiron_workflow.constructors import atomictype2node as atomictype2node
 from pyiron_workflow.constructors import node as node
 from pyiron_workflow.constructors import recipe2node as recipe2node
+from pyiron_workflow.dag import estimate_runtime as estimate_runtime
 from pyiron_workflow.execution import run as run
 from pyiron_workflow.executorlib import NodeSingleExecutor as NodeSingleExecutor
 from pyiron_workflow.executorlib import NodeSlurmExecutor as NodeSlurmExecutor
+from pyiron_workflow.executorlib import (
+    NodeSlurmPackingExecutor as NodeSlurmPackingExecutor,
+)
 from pyiron_workflow.executorlib import _CacheTestExecutor as _CacheTestExecutor
+from pyiron_workflow.executorlib import (
+    _PackingCacheTestExecutor as _PackingCacheTestExecutor,
+)
+from pyiron_workflow.injection import fused_expressions as fused_expressions
 from pyiron_workflow.pull import pull as pull
 from pyiron_workflow.pull import pulled_inputs as pulled_inputs
 from pyiron_workflow.pull import pulled_workflow as pulled_workflow
 from pyiron_workflow.validation import validate_plan as validate_plan
+from pyiron_workflow.workqueue import QueueExecutor as QueueExecutor
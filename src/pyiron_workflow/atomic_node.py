@@ -31,8 +31,7 @@ class Atomic(datatypes.StaticNode[fr.schemas.AtomicRecipe, fr.schemas.AtomicData
         run: execution.Run[execution.ResultType],
         config: execution.RunConfig,
     ) -> execution.Run[execution.ResultType]:
-        output = _call_atomic(run.result)
-        _store_atomic_outputs(run.result, output)
+        evaluate_live(run.result)
         return run
 
     @property
@@ -40,6 +39,11 @@ class Atomic(datatypes.StaticNode[fr.schemas.AtomicRecipe, fr.schemas.AtomicData
         return self._function_metadata
 
 
+def evaluate_live(node: fr.schemas.AtomicData) -> None:
+    """Call the function on the live node's inputs, and store its outputs there."""
+    _store_atomic_outputs(node, _call_atomic(node))
+
+
 def _call_atomic(node: fr.schemas.AtomicData) -> Any:
     """
     Invoke the underlying function, respecting positional-only parameter kinds.
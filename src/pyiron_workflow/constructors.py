@@ -220,21 +220,21 @@ def _copy_port_annotations(
         )
 
 
-def _copy_executors(src: datatypes.Node, dst: datatypes.Node) -> None:
-    """Recursively copy `executor` from `src` to `dst`. If both are graphs,
-    descend by matching child label."""
-    dst.executor = src.executor
+def _copy_node_state(src: datatypes.Node, dst: datatypes.Node) -> None:
+    """Recursively copy node-state (e.g. `executor`) from `src` to `dst`. If both are
+    graphs, descend by matching child label."""
+    datatypes.Node._copy_data(src, dst)
     if isinstance(src, datatypes.Graph) and isinstance(dst, datatypes.Graph):
         for label, child in src.nodes.items():
             if label in dst.nodes:
-                _copy_executors(child, dst.nodes[label])
+                _copy_node_state(child, dst.nodes[label])
 
 
 def workflow2macro(wf: workflow_node.Workflow) -> dag.Macro:
     macro = dag.Macro(wf.recipe, wf.label)
     _copy_port_annotations(wf.inputs, macro.inputs)
     _copy_port_annotations(wf.outputs, macro.outputs)
-    _copy_executors(wf, macro)
+    _copy_node_state(wf, macro)
     return macro
 
 
@@ -256,5 +256,5 @@ def macro2workflow(macro: dag.Macro) -> workflow_node.Workflow:
 
     _copy_port_annotations(wf.inputs, macro.inputs)
     _copy_port_annotations(wf.outputs, macro.outputs)
-    _copy_executors(macro, wf)
+    _copy_node_state(macro, wf)
     return wf
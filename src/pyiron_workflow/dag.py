@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+import datetime
+import statistics
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from concurrent import futures
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
 
 import flowrep as fr
 import semantikon
 from pyiron_snippets import retrieve
 
-from pyiron_workflow import constructors, datatypes, execution, lexical, validation
+from pyiron_workflow import (
+    atomic_node,
+    constructors,
+    datatypes,
+    execution,
+    executorlib,
+    folding,
+    fusion,
+    history,
+    lexical,
+    merging,
+    validation,
+)
 
 if TYPE_CHECKING:
     import rdflib
@@ -39,8 +57,7 @@ class Macro(datatypes.ImmutableDag):
         run: execution.Run[execution.ResultType],
         config: execution.RunConfig,
     ) -> execution.Run[execution.ResultType]:
-        evaluate_dag_by_layer(self.nodes, run, config)
-        populate_outputs(run.result)
+        evaluate_graph(self, self.nodes, run, config)
         return run
 
     def validate(
@@ -69,46 +86,307 @@ class Macro(datatypes.ImmutableDag):
         return None
 
 
+def evaluate_graph(
+    graph: datatypes.Node,
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    run: execution.Run[fr.schemas.CompositeData],
+    config: execution.RunConfig,
+) -> None:
+    """
+    Evaluate a graph's children and populate its outputs, pruning children that
+    cannot reach the outputs, folding constant ones, and then either inlining child
+    graphs or merging duplicates, fusing chains and chaining executor futures, as the
+    configuration asks.
+    """
+    nodes = prune_to_outputs(graph, nodes, run, config)
+    cache = config.constant_cache
+    keys = {} if cache is None else folding.constant_keys(run.result)
+    try:
+        if cache is not None:
+            nodes = fold_constants(nodes, keys, run, cache)
+        if config.dag_inline_subgraphs:
+            InlinedSchedule(nodes, run, config).evaluate()
+        else:
+            if config.dag_merge_duplicates:
+                run.aliases = merging.duplicate_aliases(
+                    run.result,
+                    nodes,
+                    {
+                        label: (node.executor, node.retry, node.timeout, node.resources)
+                        for label, node in nodes.items()
+                    },
+                )
+            if config.dag_fuse_chains:
+                run.fused = fusion.linear_chains(
+                    run.result, _fusible(nodes, run.aliases)
+                )
+            evaluate_dag_by_layer(
+                nodes,
+                run,
+                config,
+                EvaluationPlan(
+                    aliases=run.aliases,
+                    chains={chain[0]: chain for chain in run.fused},
+                    chained_futures=(
+                        ChainedFutures(nodes, run, config, run.aliases)
+                        if config.dag_chain_futures
+                        else None
+                    ),
+                ),
+            )
+    finally:
+        if cache is not None:
+            remember_constants(keys, run, cache)
+    populate_outputs(run.result)
+
+
+class EvaluationPlan(NamedTuple):
+    """
+    How to evaluate children other than one by one: `aliases` map duplicates to
+    the child whose results they copy, `chains` map the head of each fused chain to
+    the whole chain, and `chained_futures` (if any) submits children on executorlib
+    executors without waiting for them.
+    """
+
+    aliases: Mapping[fr.schemas.Label, fr.schemas.Label] = {}
+    chains: Mapping[fr.schemas.Label, Sequence[fr.schemas.Label]] = {}
+    chained_futures: ChainedFutures | None = None
+
+
+def _fusible(
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    aliases: Mapping[fr.schemas.Label, fr.schemas.Label],
+) -> list[fr.schemas.Label]:
+    """Children with no special execution needs and no part in merging."""
+    merged = set(aliases).union(aliases.values())
+    return [
+        label
+        for label, node in nodes.items()
+        if label not in merged and _is_plain(node)
+    ]
+
+
+def _is_plain(node: datatypes.Node) -> bool:
+    """Whether a node has no executor, retry policy, timeout, or resource needs."""
+    return (
+        node.executor is None
+        and node.retry is None
+        and node.timeout is None
+        and node.resources is None
+    )
+
+
+def prune_to_outputs(
+    graph: datatypes.Node,
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    run: execution.Run[fr.schemas.CompositeData],
+    config: execution.RunConfig,
+) -> Mapping[fr.schemas.Label, datatypes.Node]:
+    """
+    The nodes that can reach the graph's outputs, recording the rest in
+    :attr:`Run.pruned`.
+
+    Applies to every graph when :attr:`RunConfig.dag_prune_to_outputs` is set, and
+    :attr:`RunConfig.requested_outputs` further narrows the outputs of `graph` to the
+    named subset (the rest are then left empty), if it is the prime mover. Otherwise,
+    nothing is pruned.
+    """
+    requested = config.requested_outputs if config.is_prime_mover(graph) else None
+    if not config.dag_prune_to_outputs and requested is None:
+        return nodes
+    cone = output_cone(run.result, requested)
+    run.pruned = [label for label in nodes if label not in cone]
+    return {label: node for label, node in nodes.items() if label in cone}
+
+
+def fold_constants(
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    keys: Mapping[fr.schemas.Label, str],
+    run: execution.Run[fr.schemas.CompositeData],
+    cache: folding.ConstantCache,
+) -> Mapping[fr.schemas.Label, datatypes.Node]:
+    """
+    The nodes still to evaluate once cached constant children (see
+    :mod:`pyiron_workflow.folding`) have their outputs filled in, recording those
+    skipped in :attr:`Run.folded`.
+
+    Constant children that only feed skipped ones are skipped too.
+    """
+    skipped: set[fr.schemas.Label] = set()
+    for label, key in keys.items():
+        if label not in nodes or isinstance(
+            run.result.nodes[label].recipe, fr.schemas.ConstantRecipe
+        ):
+            continue
+        outputs = cache.get(key)
+        if outputs is None:
+            continue
+        for port, value in outputs.items():
+            run.result.nodes[label].output_ports[port].value = value
+        skipped.add(label)
+    if not skipped:
+        return nodes
+
+    consumers: dict[fr.schemas.Label, set[fr.schemas.Label]] = {}
+    for target, source in run.result.edges.items():
+        consumers.setdefault(source.node, set()).add(target.node)
+    graph_outputs = {
+        source.node
+        for source in run.result.output_edges.values()
+        if isinstance(source, fr.schemas.SourceHandle)
+    }
+    for layer in reversed(topo_sort_nodes(nodes, run.result.edges)):
+        for label in layer:
+            feeds = consumers.get(label)
+            if (
+                label in keys
+                and label not in graph_outputs
+                and feeds
+                and feeds <= skipped
+            ):
+                skipped.add(label)
+    run.folded = [label for label in nodes if label in skipped]
+    return {label: node for label, node in nodes.items() if label not in skipped}
+
+
+def remember_constants(
+    keys: Mapping[fr.schemas.Label, str],
+    run: execution.Run[fr.schemas.CompositeData],
+    cache: folding.ConstantCache,
+) -> None:
+    """Cache the outputs of constant, non-:class:`Constant` children that finished."""
+    for step in run.steps:
+        label = step.label
+        if (
+            label in keys
+            and step.status == execution.RunStatus.FINISHED
+            and not isinstance(step.result.recipe, fr.schemas.ConstantRecipe)
+        ):
+            cache.put(
+                keys[label],
+                {name: port.value for name, port in step.result.output_ports.items()},
+            )
+
+
+def output_cone(
+    data: fr.schemas.CompositeData, outputs: Iterable[str] | None = None
+) -> set[fr.schemas.Label]:
+    """
+    Labels of the child nodes that any of `outputs` (default: all) depend on.
+    """
+    if outputs is not None:
+        outputs = set(outputs)
+        if unknown := outputs.difference(data.output_ports):
+            raise ValueError(
+                f"Requested outputs {sorted(unknown)} not found -- please select "
+                f"among {list(data.output_ports)}"
+            )
+    predecessors: dict[fr.schemas.Label, list[fr.schemas.Label]] = {}
+    for target, source in data.edges.items():
+        predecessors.setdefault(target.node, []).append(source.node)
+    frontier = [
+        source.node
+        for target, source in data.output_edges.items()
+        if isinstance(source, fr.schemas.SourceHandle)
+        and (outputs is None or target.port in outputs)
+    ]
+    cone: set[fr.schemas.Label] = set()
+    while frontier:
+        label = frontier.pop()
+        if label not in cone:
+            cone.add(label)
+            frontier.extend(predecessors.get(label, []))
+    return cone
+
+
 def evaluate_dag_by_layer(
-    nodes: datatypes.NodeMap,
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
     run: execution.Run[fr.schemas.CompositeData],
     config: execution.RunConfig,
+    plan: EvaluationPlan | None = None,
 ) -> None:
+    """
+    Evaluate `nodes` layer by layer, following the `plan` for aliases (which wait
+    for the child they duplicate), chains (each scheduled as a single node, in place
+    of its head) and chained futures (all collected before returning).
+    """
     result = run.result
-    layers = topo_sort_nodes(nodes, result.edges)
+    plan = EvaluationPlan() if plan is None else plan
+    layers = topo_sort_nodes(
+        nodes,
+        result.edges,
+        plan.aliases,
+        {label: head for head, chain in plan.chains.items() for label in chain[1:]},
+    )
 
-    if config.dag_layers_multithreaded:
-        _multithreaded_layers(layers, nodes, run, config)
-    else:
-        for layer in layers:
-            for label in layer:
-                evaluate_node(nodes[label], label, run, config)
+    with _collecting(plan.chained_futures):
+        if config.dag_layers_multithreaded:
+            if config.dag_layers_critical_path:
+                ranks = critical_path_ranks(
+                    nodes, result.edges, config.duration_history, known_inputs(result)
+                )
+                layers = [
+                    sorted(layer, key=lambda label: (-ranks[label], label))
+                    for layer in layers
+                ]
+            _multithreaded_layers(layers, nodes, run, config, plan)
+        else:
+            for layer in layers:
+                for label in layer:
+                    _evaluate_planned(label, nodes, run, config, plan)
+
+
+@contextlib.contextmanager
+def _collecting(chained_futures: ChainedFutures | None) -> Iterator[None]:
+    """Collect every chained child on the way out, or abandon them on failure."""
+    if chained_futures is None:
+        yield
+        return
+    try:
+        yield
+        chained_futures.collect_all()
+    except BaseException:
+        chained_futures.abandon()
+        raise
 
 
 def _multithreaded_layers(
     layers: list[list[fr.schemas.Label]],
-    nodes: datatypes.NodeMap,
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
     run: execution.Run[fr.schemas.CompositeData],
     config: execution.RunConfig,
+    plan: EvaluationPlan,
 ):
+    scope = execution.CancellationScope(config._cancellation)
+    config = dataclasses.replace(config, _cancellation=scope)
     with futures.ThreadPoolExecutor(
         max_workers=config.dag_layers_max_threads
     ) as executor:
         for layer in layers:
             pending = {
-                executor.submit(evaluate_node, nodes[label], label, run, config): label
+                executor.submit(
+                    _evaluate_planned, label, nodes, run, config, plan
+                ): label
                 for label in layer
             }
             errors: dict[str, Exception] = {}
-            for future in futures.as_completed(pending):
-                exc = future.exception()
-                if exc is None:
-                    continue
-                if not isinstance(exc, Exception):
-                    raise exc  # don't defer KeyboardInterrupt / SystemExit
-                if config.dag_layers_fail_fast:
-                    raise exc
-                errors[pending[future]] = exc
+            try:
+                for future in futures.as_completed(pending):
+                    exc = future.exception()
+                    if exc is None:
+                        continue
+                    if not isinstance(exc, Exception):
+                        raise exc  # don't defer KeyboardInterrupt / SystemExit
+                    if config.dag_layers_fail_fast:
+                        raise exc
+                    errors[pending[future]] = exc
+            except BaseException:
+                # Don't let the pool's exit wait on siblings we no longer need
+                scope.cancel()
+                for future, label in pending.items():
+                    if future.cancel():
+                        _record_cancelled(nodes[label], label, run, config)
+                raise
             if errors:
                 if len(errors) == 1:
                     raise errors.popitem()[1]
@@ -118,28 +396,442 @@ def _multithreaded_layers(
                     )
 
 
+GraphPath: TypeAlias = tuple[fr.schemas.Label, ...]
+
+
+class InlinedSchedule:
+    """
+    The children of a graph and of all its descendant graphs that can be inlined
+    (:class:`Macro` and workflow children with no executor, retry policy, timeout,
+    or resource requirement), evaluated as a single DAG of their non-inlined
+    *leaves*.
+
+    Leaves depend on whichever leaves actually produce their input, looking through
+    the ports of inlined graphs, and start as soon as those are done -- so nobody
+    waits on a whole child graph just for one early output. Each inlined graph still
+    gets its own run step, nested as usual, which starts with its first leaf and
+    finishes once its leaves and everything feeding it have.
+
+    An inlined graph missing an input is skipped, like any other child: it gets no
+    step, and none of its leaves start once the missing input is known. (Should
+    leaves not needing that input have started before then, the graph is closed as
+    cancelled instead.)
+
+    Each inlined graph is pruned to its outputs and has its constant children
+    folded and remembered just as if it were evaluated on its own. Duplicate
+    merging, chain fusion, and future chaining do not apply to inlined schedules.
+    """
+
+    def __init__(
+        self,
+        nodes: Mapping[fr.schemas.Label, datatypes.Node],
+        run: execution.Run[fr.schemas.CompositeData],
+        config: execution.RunConfig,
+    ) -> None:
+        self.config = config
+        self.graphs: dict[GraphPath, execution.Run[fr.schemas.CompositeData]] = {
+            (): run
+        }
+        self.leaves: dict[GraphPath, datatypes.Node] = {}
+        self.constant_keys: dict[GraphPath, Mapping[fr.schemas.Label, str]] = {}
+        self._add_children((), nodes)
+        self.dependencies = {leaf: self._leaf_producers(leaf) for leaf in self.leaves}
+        self._awaited = {
+            path: self._graph_producers(path) for path in self.graphs if path
+        }
+        self._done: set[GraphPath] = set()
+        self._skipped: set[GraphPath] = set()
+        self._lock = threading.Lock()
+
+    def _add_children(
+        self, graph: GraphPath, nodes: Mapping[fr.schemas.Label, datatypes.Node]
+    ) -> None:
+        run = self.graphs[graph]
+        for label, node in nodes.items():
+            path = (*graph, label)
+            if isinstance(node, datatypes.ImmutableDag | datatypes.MutableDag) and (
+                _is_plain(node)
+            ):
+                sub_run = execution.Run[fr.schemas.CompositeData](
+                    lexical_path=lexical.lexical_path(run.lexical_path, label),
+                    result=node.generate_flowrep_live_node(),
+                    status=execution.RunStatus.PENDING,
+                    run_dir=self.config.run_dir,
+                )
+                run.result.nodes[label] = sub_run.result
+                self.graphs[path] = sub_run
+                self._add_children(path, self._prepare(path, node))
+            else:
+                self.leaves[path] = node
+
+    def _prepare(
+        self, path: GraphPath, graph: datatypes.ImmutableDag | datatypes.MutableDag
+    ) -> Mapping[fr.schemas.Label, datatypes.Node]:
+        """
+        The children of an inlined graph still to evaluate once pruned and folded, as
+        in :func:`evaluate_graph`.
+        """
+        run = self.graphs[path]
+        nodes = prune_to_outputs(graph, graph.nodes, run, self.config)
+        cache = self.config.constant_cache
+        if cache is None:
+            return nodes
+        self.constant_keys[path] = folding.constant_keys(run.result)
+        return fold_constants(nodes, self.constant_keys[path], run, cache)
+
+    def remember_constants(self) -> None:
+        """Cache the outputs of the constant children of every inlined graph."""
+        cache = self.config.constant_cache
+        if cache is None:
+            return
+        for path, keys in self.constant_keys.items():
+            remember_constants(keys, self.graphs[path], cache)
+
+    def _producers(
+        self, graph: GraphPath, target: fr.schemas.TargetHandle
+    ) -> set[GraphPath]:
+        data = self.graphs[graph].result
+        if target in data.input_edges:
+            return self._input_producers(graph, data.input_edges[target].port)
+        if target in data.edges:
+            source = data.edges[target]
+            return self._output_producers((*graph, source.node), source.port)
+        return set()
+
+    def _input_producers(self, graph: GraphPath, port: str) -> set[GraphPath]:
+        if not graph:
+            return set()
+        return self._producers(
+            graph[:-1], fr.schemas.TargetHandle(node=graph[-1], port=port)
+        )
+
+    def _output_producers(self, path: GraphPath, port: str) -> set[GraphPath]:
+        if path in self.leaves:
+            return {path}
+        if path not in self.graphs:
+            return set()  # Folded away, so the value is already there
+        source = _output_source(self.graphs[path].result, port)
+        if isinstance(source, fr.schemas.SourceHandle):
+            return self._output_producers((*path, source.node), source.port)
+        if isinstance(source, fr.schemas.InputSource):
+            return self._input_producers(path, source.port)
+        return set()
+
+    def _leaf_producers(self, leaf: GraphPath) -> set[GraphPath]:
+        graph, label = leaf[:-1], leaf[-1]
+        producers: set[GraphPath] = set()
+        for port in self.graphs[graph].result.nodes[label].recipe.inputs:
+            producers |= self._producers(
+                graph, fr.schemas.TargetHandle(node=label, port=port)
+            )
+        return producers
+
+    def _graph_producers(self, graph: GraphPath) -> set[GraphPath]:
+        producers = {leaf for leaf in self.leaves if leaf[: len(graph)] == graph}
+        for port in self.graphs[graph].result.input_ports:
+            producers |= self._input_producers(graph, port)
+        return producers
+
+    def _pull(self, graph: GraphPath, target: fr.schemas.TargetHandle) -> None:
+        """Bring the value feeding `target` in through any inlined graph ports."""
+        data = self.graphs[graph].result
+        if target in data.input_edges:
+            self._pull_input(graph, data.input_edges[target].port)
+        elif target in data.edges:
+            source = data.edges[target]
+            self._pull_output((*graph, source.node), source.port)
+
+    def _pull_input(self, graph: GraphPath, port: str) -> None:
+        if not graph:
+            return
+        parent, label = graph[:-1], graph[-1]
+        target = fr.schemas.TargetHandle(node=label, port=port)
+        self._pull(parent, target)
+        values = gather_target_inputs(label, self.graphs[parent].result)
+        if port in values:
+            self.graphs[graph].result.input_ports[port].value = values[port]
+
+    def _pull_output(self, path: GraphPath, port: str) -> None:
+        if path not in self.graphs:
+            return
+        data = self.graphs[path].result
+        source = _output_source(data, port)
+        if isinstance(source, fr.schemas.SourceHandle):
+            self._pull_output((*path, source.node), source.port)
+            value = data.nodes[source.node].output_ports[source.port].value
+        elif isinstance(source, fr.schemas.InputSource):
+            self._pull_input(path, source.port)
+            value = data.input_ports[source.port].get_data()
+        else:
+            return
+        data.output_ports[port].value = value
+
+    def evaluate(self) -> None:
+        try:
+            self._evaluate()
+        finally:
+            self.remember_constants()
+
+    def _evaluate(self) -> None:
+        self._settle()
+        if self.config.dag_layers_multithreaded:
+            self._evaluate_multithreaded()
+            return
+        for leaf in self._order():
+            try:
+                self._evaluate_leaf(leaf, self.config)
+            except BaseException as e:
+                self._fail(leaf, e)
+                self._abandon()
+                raise
+            self._settle(leaf)
+
+    def _order(self) -> list[GraphPath]:
+        """Leaves in an order that respects their dependencies."""
+        order: list[GraphPath] = []
+        done: set[GraphPath] = set()
+        remaining = sorted(self.leaves)
+        while remaining:
+            ready = [leaf for leaf in remaining if self.dependencies[leaf] <= done]
+            order.extend(ready)
+            done.update(ready)
+            remaining = [leaf for leaf in remaining if leaf not in done]
+        return order
+
+    def _evaluate_multithreaded(self) -> None:
+        scope = execution.CancellationScope(self.config._cancellation)
+        config = dataclasses.replace(self.config, _cancellation=scope)
+        remaining = {leaf: set(deps) for leaf, deps in self.dependencies.items()}
+        dependents: dict[GraphPath, list[GraphPath]] = {leaf: [] for leaf in remaining}
+        for leaf, producers in self.dependencies.items():
+            for producer in producers:
+                dependents[producer].append(leaf)
+        ranks = self._ranks() if config.dag_layers_critical_path else None
+        errors: dict[GraphPath, Exception] = {}
+        with futures.ThreadPoolExecutor(
+            max_workers=config.dag_layers_max_threads
+        ) as executor:
+            running: dict[futures.Future, GraphPath] = {}
+
+            def submit(ready: Iterable[GraphPath]) -> None:
+                key = (
+                    (lambda leaf: leaf)
+                    if ranks is None
+                    else (lambda leaf: (-ranks[leaf], leaf))
+                )
+                for leaf in sorted(ready, key=key):
+                    running[executor.submit(self._evaluate_leaf, leaf, config)] = leaf
+
+            submit(leaf for leaf, deps in remaining.items() if not deps)
+            try:
+                while running:
+                    done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        leaf = running.pop(future)
+                        exc = future.exception()
+                        if exc is None:
+                            self._settle(leaf)
+                            ready = []
+                            for dependent in dependents[leaf]:
+                                remaining[dependent].discard(leaf)
+                                if not remaining[dependent]:
+                                    ready.append(dependent)
+                            submit(ready)
+                            continue
+                        self._fail(leaf, exc)
+                        if (
+                            not isinstance(exc, Exception)
+                            or config.dag_layers_fail_fast
+                        ):
+                            raise exc
+                        errors[leaf] = exc
+            except BaseException:
+                # Don't let the pool's exit wait on leaves we no longer need
+                scope.cancel()
+                for future, leaf in running.items():
+                    if future.cancel():
+                        _record_cancelled(
+                            self.leaves[leaf], leaf[-1], self.graphs[leaf[:-1]], config
+                        )
+                self._abandon()
+                raise
+        if errors:
+            self._abandon()
+            if len(errors) == 1:
+                raise errors.popitem()[1]
+            raise ExceptionGroup(
+                f"{len(errors)} node(s) failed in inlined schedule",
+                list(errors.values()),
+            )
+
+    def _ranks(self) -> dict[GraphPath, float]:
+        """Critical-path ranks of the leaves (see :func:`critical_path_ranks`)."""
+        estimates = (
+            dict.fromkeys(self.leaves)
+            if self.config.duration_history is None
+            else _estimate_durations(
+                self.leaves, self.config.duration_history, descend=False
+            )
+        )
+        durations = _fill_unknown(estimates)
+        ranks: dict[GraphPath, float] = {}
+        for leaf in reversed(self._order()):
+            ranks[leaf] = durations[leaf] + max(
+                (
+                    ranks[other]
+                    for other, producers in self.dependencies.items()
+                    if leaf in producers
+                ),
+                default=0.0,
+            )
+        return ranks
+
+    def _evaluate_leaf(self, leaf: GraphPath, config: execution.RunConfig) -> None:
+        graph, label = leaf[:-1], leaf[-1]
+        if self._is_skipped(graph):
+            return
+        self._start(graph)
+        for port in self.graphs[graph].result.nodes[label].recipe.inputs:
+            self._pull(graph, fr.schemas.TargetHandle(node=label, port=port))
+        evaluate_node(self.leaves[leaf], label, self.graphs[graph], config)
+
+    def _start(self, graph: GraphPath) -> None:
+        started = []
+        with self._lock:
+            for depth in range(1, len(graph) + 1):
+                path = graph[:depth]
+                sub_run = self.graphs[path]
+                if sub_run.status == execution.RunStatus.PENDING:
+                    started_at = datetime.datetime.now()
+                    sub_run.status = execution.RunStatus.RUNNING
+                    sub_run.started_at = started_at
+                    self.graphs[path[:-1]].steps.append(sub_run)
+                    started.append((sub_run, started_at))
+        for sub_run, started_at in started:
+            self.config.emit_progress(started_at, sub_run.lexical_path, sub_run.status)
+
+    def _is_skipped(self, graph: GraphPath) -> bool:
+        """
+        Whether `graph`, or an inlined graph around it, is known to be missing an
+        input.
+        """
+        with self._lock:
+            for depth in range(1, len(graph) + 1):
+                path = graph[:depth]
+                if path in self._skipped or self._missing_input(path):
+                    self._skipped.add(path)
+                    return True
+        return False
+
+    def _missing_input(self, graph: GraphPath) -> bool:
+        """Whether any input of `graph` whose producers are done is missing."""
+        parent, label = graph[:-1], graph[-1]
+        resolved = [
+            port
+            for port in self.graphs[graph].result.input_ports
+            if self._input_producers(graph, port) <= self._done
+        ]
+        for port in resolved:
+            self._pull(parent, fr.schemas.TargetHandle(node=label, port=port))
+        values = gather_target_inputs(label, self.graphs[parent].result)
+        return any_missing({port: values[port] for port in resolved if port in values})
+
+    def _settle(self, leaf: GraphPath | None = None) -> None:
+        """Finish every inlined graph that is no longer waiting on anything."""
+        finished = []
+        if leaf is not None:
+            with self._lock:
+                self._done.add(leaf)
+        for graph, awaited in self._awaited.items():
+            awaited.discard(leaf)
+            if (
+                not awaited
+                and graph not in self._skipped
+                and self.graphs[graph].status
+                in (execution.RunStatus.PENDING, execution.RunStatus.RUNNING)
+            ):
+                finished.append(graph)
+        for graph in sorted(finished, key=len, reverse=True):
+            if self._is_skipped(graph):
+                self._skipped.add(graph)
+                if self.graphs[graph].status == execution.RunStatus.RUNNING:
+                    self._close(graph, execution.RunStatus.CANCELLED)
+                continue
+            self._start(graph)
+            data = self.graphs[graph].result
+            for port in data.input_ports:
+                self._pull_input(graph, port)
+            populate_outputs(data)
+            self._close(graph, execution.RunStatus.FINISHED)
+
+    def _fail(self, leaf: GraphPath, exception: BaseException) -> None:
+        for depth in range(len(leaf) - 1, 0, -1):
+            graph = leaf[:depth]
+            if self.graphs[graph].status == execution.RunStatus.RUNNING:
+                self.graphs[graph].exception = exception
+                self._close(graph, execution.RunStatus.FAILED)
+
+    def _abandon(self) -> None:
+        for graph, sub_run in self.graphs.items():
+            if graph and sub_run.status == execution.RunStatus.RUNNING:
+                self._close(graph, execution.RunStatus.CANCELLED)
+
+    def _close(self, graph: GraphPath, status: execution.RunStatus) -> None:
+        sub_run = self.graphs[graph]
+        finished_at = datetime.datetime.now()
+        with self._lock:
+            sub_run.status = status
+            sub_run.finished_at = finished_at
+        self.config.emit_progress(finished_at, sub_run.lexical_path, status)
+
+
+def _output_source(
+    data: fr.schemas.CompositeData, port: str
+) -> fr.schemas.SourceHandle | fr.schemas.InputSource | None:
+    return next(
+        (source for target, source in data.output_edges.items() if target.port == port),
+        None,
+    )
+
+
 def topo_sort_nodes(
-    nodes: datatypes.NodeMap, edges: fr.schemas.Edges
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    edges: fr.schemas.Edges,
+    after: Mapping[fr.schemas.Label, fr.schemas.Label] | None = None,
+    merged_into: Mapping[fr.schemas.Label, fr.schemas.Label] | None = None,
 ) -> list[list[fr.schemas.Label]]:
     """
     Kahn's algorithm over sibling edges, grouped into independent layers.
 
     Each layer contains nodes whose dependencies all live in earlier layers, so
     members of a layer may be executed concurrently. Deterministic tie-breaking
-    by label within each layer.
+    by label within each layer. Each key of `after` is additionally placed in a
+    later layer than its value. Each key of `merged_into` gets no layer of its own,
+    but is scheduled as part of its value: whatever depends on it depends on its
+    value instead.
     """
-    in_degree: dict[fr.schemas.Label, int] = dict.fromkeys(nodes, 0)
+    merged_into = {} if merged_into is None else merged_into
+    in_degree: dict[fr.schemas.Label, int] = {
+        label: 0 for label in nodes if label not in merged_into
+    }
     successors: dict[fr.schemas.Label, list[fr.schemas.Label]] = {
-        label: [] for label in nodes
+        label: [] for label in in_degree
     }
 
     for target, source in edges.items():
-        if target.node not in in_degree or source.node not in successors:
+        target_node = merged_into.get(target.node, target.node)
+        source_node = merged_into.get(source.node, source.node)
+        if target_node not in in_degree or source_node not in successors:
             continue  # Skip edges that cross batch boundaries (e.g. While iterations)
-        in_degree[target.node] += 1
-        successors[source.node].append(target.node)
+        if target_node == source_node:
+            continue  # Within a merged group
+        in_degree[target_node] += 1
+        successors[source_node].append(target_node)
+    for later, earlier in (after or {}).items():
+        in_degree[later] += 1
+        successors[earlier].append(later)
 
-    current_layer = sorted(label for label in nodes if in_degree[label] == 0)
+    current_layer = sorted(label for label in in_degree if in_degree[label] == 0)
     layers: list[list[fr.schemas.Label]] = []
     processed = 0
     while current_layer:
@@ -153,7 +845,7 @@ def topo_sort_nodes(
                     next_layer.append(succ)
         current_layer = sorted(next_layer)
 
-    if processed != len(nodes):  # pragma: no cover
+    if processed != len(in_degree):  # pragma: no cover
         raise ValueError(
             "Cycle detected in workflow edges. This should have been caught by the "
             "underlying recipe validation. Please raise a GitHub issue reporting "
@@ -162,17 +854,487 @@ def topo_sort_nodes(
     return layers
 
 
+class RuntimeEstimate(NamedTuple):
+    """
+    A plan for evaluating a graph's children, in seconds.
+
+    `total` is the summed duration of every child (i.e. the serial runtime), and
+    `critical_path` the duration of the longest chain, `path`, through the graph
+    (i.e. the runtime with unlimited workers). `durations` and `ranks` hold the
+    per-child weights and remaining critical path lengths these were built from,
+    and `unknown` the children that had no history and so got a fallback weight.
+    """
+
+    total: float
+    critical_path: float
+    path: list[fr.schemas.Label]
+    unknown: list[fr.schemas.Label]
+    durations: dict[fr.schemas.Label, float]
+    ranks: dict[fr.schemas.Label, float]
+
+
+def estimate_runtime(
+    node: datatypes.Node,
+    duration_history: history.DurationHistory,
+    input_data: Mapping[str, Any] | None = None,
+) -> RuntimeEstimate:
+    """
+    Estimate how long a node will take to evaluate, before evaluating it.
+
+    Graph nodes are planned child by child, descending into child graphs that have
+    no history of their own; any other node is treated as a graph of one. Children
+    whose input is known from `input_data` (and defaults) up front are estimated for
+    the size of that input.
+    """
+    live = node.generate_flowrep_live_node()
+    execution.populate_input_ports(
+        live, {k: v for k, v in (input_data or {}).items() if k in live.input_ports}
+    )
+    nodes: Mapping[fr.schemas.Label, datatypes.Node]
+    if isinstance(node, datatypes.ImmutableDag | datatypes.MutableDag):
+        nodes, edges = node.nodes, node.recipe.edges
+        known = known_inputs(live)
+    else:
+        nodes, edges = {node.label: node}, {}
+        values = {name: port.get_data() for name, port in live.input_ports.items()}
+        known = {} if any_missing(values) else {node.label: values}
+    estimates = _estimate_durations(nodes, duration_history, known=known)
+    durations = _fill_unknown(estimates)
+    ranks = _ranks(nodes, edges, durations)
+    successors = _successors(nodes, edges)
+    path: list[fr.schemas.Label] = []
+    candidates = list(nodes)
+    while candidates:
+        label = max(candidates, key=lambda c: (ranks[c], c))
+        path.append(label)
+        candidates = successors[label]
+    return RuntimeEstimate(
+        total=sum(durations.values()),
+        critical_path=max(ranks.values(), default=0.0),
+        path=path,
+        unknown=sorted(label for label, e in estimates.items() if e is None),
+        durations=durations,
+        ranks=ranks,
+    )
+
+
+def critical_path_ranks(
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    edges: fr.schemas.Edges,
+    duration_history: history.DurationHistory | None = None,
+    known: Mapping[fr.schemas.Label, Mapping[str, Any]] | None = None,
+) -> dict[fr.schemas.Label, float]:
+    """
+    The longest duration-weighted path from each node to the end of the graph,
+    including the node itself.
+
+    Nodes are weighted by their historical duration, for the size of their input
+    where it is `known` (see :func:`known_inputs`). Those without history weigh the
+    median of those with, and if nobody has history every node weighs one -- so the
+    rank is then the length of the longest chain of nodes still to come.
+    """
+    estimates = (
+        dict.fromkeys(nodes)
+        if duration_history is None
+        else _estimate_durations(nodes, duration_history, descend=False, known=known)
+    )
+    return _ranks(nodes, edges, _fill_unknown(estimates))
+
+
+def known_inputs(
+    data: fr.schemas.CompositeData,
+) -> dict[fr.schemas.Label, dict[str, Any]]:
+    """
+    The input of each child of `data` that is complete before any sibling has been
+    evaluated, i.e. that comes from the graph's own input and defaults alone.
+    """
+    known: dict[fr.schemas.Label, dict[str, Any]] = {}
+    for label, child in data.nodes.items():
+        values = {name: port.get_data() for name, port in child.input_ports.items()}
+        values.update(gather_target_inputs(label, data))
+        if not any_missing(values):
+            known[label] = values
+    return known
+
+
+def any_missing(values: Mapping[str, Any]) -> bool:
+    """Whether any of the `values` is missing, i.e. `NOT_DATA`."""
+    return any(value is fr.schemas.NOT_DATA for value in values.values())
+
+
+def _estimate_durations(
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    duration_history: history.DurationHistory,
+    descend: bool = True,
+    known: Mapping[fr.schemas.Label, Mapping[str, Any]] | None = None,
+) -> dict[fr.schemas.Label, float | None]:
+    known = {} if known is None else known
+    estimates: dict[fr.schemas.Label, float | None] = {}
+    for label, node in nodes.items():
+        inputs = known.get(label)
+        estimate = duration_history.estimate(
+            history.recipe_key(node.recipe),
+            None if inputs is None else history.input_size(inputs.values()),
+        )
+        if (
+            estimate is None
+            and descend
+            and isinstance(node, datatypes.ImmutableDag | datatypes.MutableDag)
+            and len(node.nodes) > 0
+        ):
+            inner = estimate_runtime(node, duration_history, inputs)
+            if len(inner.unknown) < len(node.nodes):
+                estimate = inner.critical_path
+        estimates[label] = estimate
+    return estimates
+
+
+def _fill_unknown(
+    estimates: Mapping[fr.schemas.Label, float | None],
+) -> dict[fr.schemas.Label, float]:
+    known = [e for e in estimates.values() if e is not None]
+    fallback = statistics.median(known) if known else 1.0
+    return {
+        label: fallback if estimate is None else estimate
+        for label, estimate in estimates.items()
+    }
+
+
+def _successors(
+    nodes: Mapping[fr.schemas.Label, Any], edges: fr.schemas.Edges
+) -> dict[fr.schemas.Label, list[fr.schemas.Label]]:
+    successors: dict[fr.schemas.Label, list[fr.schemas.Label]] = {
+        label: [] for label in nodes
+    }
+    for target, source in edges.items():
+        if target.node in successors and source.node in successors:
+            successors[source.node].append(target.node)
+    return successors
+
+
+def _ranks(
+    nodes: Mapping[fr.schemas.Label, Any],
+    edges: fr.schemas.Edges,
+    durations: Mapping[fr.schemas.Label, float],
+) -> dict[fr.schemas.Label, float]:
+    successors = _successors(nodes, edges)
+    ranks: dict[fr.schemas.Label, float] = {}
+    for layer in reversed(topo_sort_nodes(nodes, edges)):
+        for label in layer:
+            ranks[label] = durations[label] + max(
+                (ranks[succ] for succ in successors[label]), default=0.0
+            )
+    return ranks
+
+
 def evaluate_node(
     node: datatypes.Node[Any, execution.ResultType],
     label_in_run: fr.schemas.Label,
     run: execution.Run[fr.schemas.CompositeData],
     config: execution.RunConfig,
+    alias_of: fr.schemas.Label | None = None,
 ):
-    result = run.result
-    input_data = gather_target_inputs(label_in_run, result)
+    input_data = gather_target_inputs(label_in_run, run.result)
     if any(val is fr.schemas.NOT_DATA for val in input_data.values()):
         # Possible development: raise a warning or optionally an exception here
         return
+    if alias_of is not None:
+        _mirror_node(node, label_in_run, alias_of, input_data, run, config)
+        return
+    sub_run = add_step(node, label_in_run, run, config)
+    execution.run(node, config, sub_run, **input_data)
+
+
+def _evaluate_planned(
+    label: fr.schemas.Label,
+    nodes: Mapping[fr.schemas.Label, datatypes.Node],
+    run: execution.Run[fr.schemas.CompositeData],
+    config: execution.RunConfig,
+    plan: EvaluationPlan,
+) -> None:
+    if (chained_futures := plan.chained_futures) is not None:
+        if label not in plan.aliases and chained_futures.accepts(nodes[label]):
+            chained_futures.submit(label, nodes[label])
+            return
+        # Anything else reads its sources here, so wait for them
+        readers = set(plan.chains.get(label, [label]))
+        sources = {
+            source.node
+            for target, source in run.result.edges.items()
+            if target.node in readers
+        }
+        if label in plan.aliases:
+            sources.add(plan.aliases[label])
+        chained_futures.collect(sources)
+    if label in plan.chains:
+        evaluate_chain(plan.chains[label], run, config)
+    else:
+        evaluate_node(nodes[label], label, run, config, plan.aliases.get(label))
+
+
+def evaluate_chain(
+    chain: Sequence[fr.schemas.Label],
+    run: execution.Run[fr.schemas.CompositeData],
+    config: execution.RunConfig,
+) -> None:
+    """
+    Evaluate a fused chain of atomic children (see :mod:`pyiron_workflow.fusion`)
+    as a single task, calling each member's function in turn directly on the graph's
+    live data.
+
+    Members skip the bookkeeping of :func:`evaluate_node`: they get no run step, live
+    node, or duration record of their own, and only their completion is reported as
+    progress. A failing member is recorded as a step, so the failure is reported just
+    as it would be without fusion. Like any other child, a member missing input is
+    skipped, and so is the rest of the chain.
+    """
+    result = run.result
+    sources: dict[
+        fr.schemas.Label,
+        list[tuple[str, fr.schemas.InputSource | fr.schemas.SourceHandle]],
+    ] = {label: [] for label in chain}
+    for edges in (result.input_edges, result.edges):
+        for target, source in edges.items():
+            if target.node in sources:
+                sources[target.node].append((target.port, source))
+
+    with config._fleche_cache_context():
+        for label in chain:
+            lexical_path = lexical.lexical_path(run.lexical_path, label)
+            config.raise_if_cancelled(lexical_path)
+            input_data = {
+                port: (
+                    result.input_ports[source.port].get_data()
+                    if isinstance(source, fr.schemas.InputSource)
+                    else result.nodes[source.node].output_ports[source.port].value
+                )
+                for port, source in sources[label]
+            }
+            if any_missing(input_data):
+                return
+            live = result.nodes[label]
+            started_at = datetime.datetime.now()
+            try:
+                execution.populate_input_ports(live, input_data)
+                atomic_node.evaluate_live(live)
+            except Exception as e:
+                finished_at = datetime.datetime.now()
+                run.steps.append(
+                    execution.Run(
+                        lexical_path=lexical_path,
+                        result=live,
+                        status=execution.RunStatus.FAILED,
+                        exception=e,
+                        started_at=started_at,
+                        finished_at=finished_at,
+                        run_dir=config.run_dir,
+                    )
+                )
+                config.emit_progress(
+                    finished_at, lexical_path, execution.RunStatus.FAILED
+                )
+                raise
+            config.emit_progress(
+                datetime.datetime.now(), lexical_path, execution.RunStatus.FINISHED
+            )
+
+
+class ChainedFutures:
+    """
+    Children on executorlib executors, submitted without waiting for them (see
+    :attr:`RunConfig.dag_chain_futures`).
+
+    Chained children that consume another's output are handed the executorlib future
+    of the child they read from, which the executor resolves for them -- a
+    file-based one remotely, from the upstream cache file -- so consecutive remote
+    nodes run back to back without their data passing through this graph. Every
+    other reader (other children, duplicates, and the graph outputs) first collects
+    the chained children it reads from. Chained children that only other chained
+    children read from spill their outputs into a file for those readers instead of
+    sending them back, so their runs don't keep their output values; nor do the
+    runs of chained readers keep the inputs they read that way.
+
+    Only children with no retry policy, timeout, or resource requirement are chained.
+    """
+
+    def __init__(
+        self,
+        nodes: Mapping[fr.schemas.Label, datatypes.Node],
+        run: execution.Run[fr.schemas.CompositeData],
+        config: execution.RunConfig,
+        aliases: Mapping[fr.schemas.Label, fr.schemas.Label],
+    ) -> None:
+        self.run = run
+        self.config = config
+        self._read_here = (
+            {source.node for source in run.result.output_edges.values()}
+            | set(aliases.values())
+            | {
+                source.node
+                for target, source in run.result.edges.items()
+                if target.node in nodes
+                and (target.node in aliases or not self.accepts(nodes[target.node]))
+            }
+        )
+        self._submitted: dict[fr.schemas.Label, _ChainedSubmission] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def accepts(node: datatypes.Node) -> bool:
+        return (
+            executorlib.accepts_futures(node.executor)
+            and node.retry is None
+            and node.timeout is None
+            and node.resources is None
+        )
+
+    def submit(self, label: fr.schemas.Label, node: datatypes.Node) -> None:
+        input_data = gather_target_inputs(label, self.run.result)
+        chained_inputs: dict[str, execution.ChainedInput] = {}
+        upstream: list[_ChainedSubmission] = []
+        with self._lock:
+            for port in list(input_data):
+                source = self.run.result.edges.get(
+                    fr.schemas.TargetHandle(node=label, port=port)
+                )
+                if source is not None and source.node in self._submitted:
+                    submission = self._submitted[source.node]
+                    if submission not in upstream:
+                        upstream.append(submission)
+                    chained_inputs[port] = execution.ChainedInput(
+                        upstream=upstream.index(submission),
+                        port=source.port,
+                        spilled=submission.spilled,
+                    )
+                    del input_data[port]
+        if any(val is fr.schemas.NOT_DATA for val in input_data.values()):
+            return
+        sub_run = add_step(node, label, self.run, self.config)
+        spill = label not in self._read_here
+        future = execution.submit_chained(
+            node,
+            self.config,
+            sub_run,
+            execution.Chaining(inputs=chained_inputs, spill=spill),
+            [submission.future for submission in upstream],
+            **input_data,
+        )
+        with self._lock:
+            self._submitted[label] = _ChainedSubmission(
+                node, sub_run, future, upstream, spill
+            )
+
+    def collect(self, labels: Iterable[fr.schemas.Label]) -> None:
+        """Wait for the chained children among `labels`, raising any failure."""
+        with self._lock:
+            submissions = [
+                self._submitted[label] for label in labels if label in self._submitted
+            ]
+        for submission in submissions:
+            submission.collect(self.config)
+
+    def collect_all(self) -> None:
+        with self._lock:
+            submissions = list(self._submitted.values())
+        for submission in submissions:
+            submission.collect(self.config)
+
+    def abandon(self) -> None:
+        """Stop waiting on whatever was not collected, recording it as cancelled."""
+        with self._lock:
+            submissions = list(self._submitted.values())
+        for submission in submissions:
+            submission.abandon(self.config)
+
+
+class _ChainedSubmission:
+    def __init__(
+        self,
+        node: datatypes.Node,
+        run: execution.Run[Any],
+        future: futures.Future,
+        upstream: list[_ChainedSubmission],
+        spilled: bool,
+    ) -> None:
+        self.node = node
+        self.run = run
+        self.future = future
+        self.upstream = upstream
+        self.spilled = spilled
+        self._collected = False
+        self._exception: BaseException | None = None
+        self._lock = threading.Lock()
+
+    def collect(self, config: execution.RunConfig) -> None:
+        # Upstream failures cancel us remotely, so surface those failures first
+        for submission in self.upstream:
+            submission.collect(config)
+        with self._lock:
+            if not self._collected:
+                self._collected = True
+                try:
+                    execution.collect_chained(self.node, config, self.run, self.future)
+                except BaseException as e:
+                    self._exception = e
+        if self._exception is not None:
+            raise self._exception
+
+    def abandon(self, config: execution.RunConfig) -> None:
+        with self._lock:
+            if self._collected:
+                return
+            self._collected = True
+            self.future.cancel()
+            self.run.status = execution.RunStatus.CANCELLED
+            self.run.finished_at = datetime.datetime.now()
+        config.emit_progress(
+            self.run.finished_at, self.run.lexical_path, self.run.status
+        )
+
+
+def _mirror_node(
+    node: datatypes.Node[Any, execution.ResultType],
+    label_in_run: fr.schemas.Label,
+    alias_of: fr.schemas.Label,
+    input_data: dict[str, Any],
+    run: execution.Run[fr.schemas.CompositeData],
+    config: execution.RunConfig,
+) -> None:
+    original = next((step for step in run.steps if step.label == alias_of), None)
+    if original is None:  # pragma: no cover
+        # Duplicates get the same input, so the original can't have been skipped
+        return
+    sub_run = add_step(node, label_in_run, run, config)
+    execution.populate_input_ports(sub_run.result, input_data)
+    for port, value in original.outputs.items():
+        sub_run.result.output_ports[port].value = value
+    sub_run.status = original.status
+    sub_run.started_at = original.started_at
+    sub_run.finished_at = original.finished_at or datetime.datetime.now()
+    config.emit_progress(sub_run.finished_at, sub_run.lexical_path, sub_run.status)
+
+
+def _record_cancelled(
+    node: datatypes.Node[Any, execution.ResultType],
+    label_in_run: fr.schemas.Label,
+    run: execution.Run[fr.schemas.CompositeData],
+    config: execution.RunConfig,
+) -> None:
+    sub_run = add_step(node, label_in_run, run, config)
+    sub_run.status = execution.RunStatus.CANCELLED
+    sub_run.finished_at = datetime.datetime.now()
+    config.emit_progress(sub_run.finished_at, sub_run.lexical_path, sub_run.status)
+
+
+def add_step(
+    node: datatypes.Node[Any, execution.ResultType],
+    label_in_run: fr.schemas.Label,
+    run: execution.Run[fr.schemas.CompositeData],
+    config: execution.RunConfig,
+) -> execution.Run[execution.ResultType]:
+    """
+    Add a pending step evaluating `node` as `label_in_run` to `run`, and return it.
+    """
     sub_run = execution.Run[execution.ResultType](
         lexical_path=lexical.lexical_path(run.lexical_path, label_in_run),
         result=node.generate_flowrep_live_node(),
@@ -180,8 +1342,8 @@ def evaluate_node(
         run_dir=config.run_dir,
     )
     run.steps.append(sub_run)
-    result.nodes[label_in_run] = sub_run.result
-    execution.run(node, config, sub_run, **input_data)
+    run.result.nodes[label_in_run] = sub_run.result
+    return sub_run
 
 
 def gather_target_inputs(
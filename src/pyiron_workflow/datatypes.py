@@ -22,7 +22,7 @@ import semantikon
 from pyiron_workflow import execution, injection, lexical
 
 if TYPE_CHECKING:
-    from pyiron_workflow import actions
+    from pyiron_workflow import actions, resources
 
 
 @dataclasses.dataclass(frozen=True)
@@ -152,6 +152,9 @@ class Node(
     _pending_connections: dict[str, Port]
     _pending_constants: dict[fr.schemas.Label, fr.schemas.JSONABLE]
     executor: futures.Executor | execution.ExecutorInstructions | None
+    retry: execution.RetryPolicy | None
+    timeout: float | None
+    resources: resources.Resources | None
     last_run: execution.Run[execution.ResultType] | None
 
     @property
@@ -221,6 +224,15 @@ class Node(
     def run(
         self, config: execution.RunConfig | None = None, /, **input_data
     ) -> execution.Run[execution.ResultType]:
+        """
+        Evaluate this node, returning the run holding all the state of the
+        evaluation.
+
+        The node itself is only read while running, so one node may be run from many
+        threads at once (e.g. serving concurrent requests from one prebuilt workflow,
+        rather than a copy per request) as long as it isn't edited meanwhile. Its
+        :attr:`last_run` is then whichever of the runs finished most recently.
+        """
         current_run = execution.run(self, config, **input_data)
         self.last_run = current_run
         return current_run
@@ -259,7 +271,7 @@ class Node(
     ) -> Self:
         """
         Make a new copy of this node based on its recipe, and copy over node-state
-        (so far, just the executor.)
+        (so far, the executor, retry policy, timeout, and resource requirements.)
 
         Intentionally loses scope information like the owner and any pending
         connections, and history information like the ``last_run``.
@@ -268,6 +280,9 @@ class Node(
     @staticmethod
     def _copy_data(from_: Node, to_: Node, /) -> None:
         to_.executor = from_.executor
+        to_.retry = from_.retry
+        to_.timeout = from_.timeout
+        to_.resources = from_.resources
 
     def __call__(self, **kwargs: Port | Node | fr.schemas.JSONABLE) -> Self:
         self._establish_sources(**kwargs)
@@ -455,6 +470,10 @@ class Node(
 
         if isinstance(self.executor, futures.Executor):
             state["executor"] = None
+        if self.retry is not None and isinstance(
+            self.retry.fallback_executor, futures.Executor
+        ):
+            state["retry"] = dataclasses.replace(self.retry, fallback_executor=None)
 
         return state
 
@@ -484,6 +503,9 @@ class StaticNode(Node[RecipeType, execution.ResultType], abc.ABC):
         self._outputs = self._build_outputs(live_preview)
 
         self.executor = None
+        self.retry = None
+        self.timeout = None
+        self.resources = None
         self.last_run = None
         self._establish_sources(**connections)
 
@@ -5,18 +5,42 @@ import contextlib
 import dataclasses
 import datetime
 import enum
+import functools
+import importlib
 import logging
 import multiprocessing
 import pathlib
+import pickle
+import sys
 import threading
-from collections.abc import Callable, Iterable
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from concurrent import futures
-from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeAlias, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    NamedTuple,
+    TypeAlias,
+    TypeGuard,
+    TypeVar,
+)
 
 import flowrep as fr
 from pyiron_snippets import dotdict, import_alarm
 
-from pyiron_workflow import lexical
+from pyiron_workflow import (
+    filelocks,
+    folding,
+    history,
+    lexical,
+    resources,
+    scheduling,
+    singleflight,
+    templates,
+    transfer,
+)
 
 with import_alarm.ImportAlarm(
     "Using a fleche-cache requires 'fleche'.", raise_exception=True
@@ -33,11 +57,81 @@ class RunStatus(enum.StrEnum):
     RUNNING = "running"
     FINISHED = "finished"
     FAILED = "failed"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
+
+
+class RunCancelledError(BaseException):
+    """
+    Raised at a cooperative checkpoint once the surrounding work has been cancelled.
+
+    Like :class:`asyncio.CancelledError` this is not an :class:`Exception`, so that
+    retry policies and `Try` nodes let it through rather than treating it as the
+    node's own failure.
+    """
+
+
+class NodeTimeoutError(TimeoutError):
+    """Raised when a node's evaluation exceeds its :attr:`timeout`."""
+
+    def __init__(self, lexical_path: lexical.LexicalPath, timeout: float) -> None:
+        super().__init__(f"{lexical_path!r} did not finish within {timeout} s")
+        self.lexical_path = lexical_path
+        self.timeout = timeout
+
+    def __reduce__(self):
+        return self.__class__, (self.lexical_path, self.timeout)
+
+
+class CancellationScope:
+    """
+    A cooperative cancellation signal for a group of sibling evaluations.
+
+    Scopes nest: a scope reads as cancelled when it or any of its parents has been
+    cancelled, but cancelling it leaves its parents untouched. Nodes only check for
+    cancellation between units of work (before starting, and while waiting on an
+    executor future), so a python function that is already running is always allowed
+    to finish.
+
+    Pickling keeps only a snapshot of the flag: the live event cannot cross process
+    boundaries, so remote work is cancelled through its future instead.
+    """
+
+    def __init__(self, parent: CancellationScope | None = None) -> None:
+        self.parent = parent
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or (
+            self.parent is not None and self.parent.cancelled
+        )
+
+    def __getstate__(self) -> dict[str, bool]:
+        return {"cancelled": self.cancelled}
+
+    def __setstate__(self, state: dict[str, bool]) -> None:
+        self.parent = None
+        self._event = threading.Event()
+        if state["cancelled"]:
+            self._event.set()
+
+
+_CANCELLATION_POLL_INTERVAL = 0.05  # seconds between checks while awaiting a future
 
 
 _hook_pool: futures.ThreadPoolExecutor | None = None
 _hook_pool_lock = threading.Lock()
 
+# The recipe keys each executor has been sent the recipe for (see `_evaluate_slim`)
+_sent_templates: weakref.WeakKeyDictionary[futures.Executor, set[str]] = (
+    weakref.WeakKeyDictionary()
+)
+_sent_templates_lock = threading.Lock()
+
 
 def _get_hook_pool(max_threads: int) -> futures.ThreadPoolExecutor:
     """Lazily build the per-process, non-blocking-hook thread pool.
@@ -66,12 +160,13 @@ def _shutdown_hook_pool() -> None:
 
 
 def _guarded(
-    fn: Callable[[pathlib.Path, datetime.datetime, str, RunStatus], None],
+    fn: Callable[..., None],
     logger: logging.Logger,
     run_dir: pathlib.Path,
     time: datetime.datetime,
     lexical_path: str,
     status: RunStatus,
+    **kwargs: Any,
 ) -> None:
     """Run a non-blocking progress hook, logging (not raising) ordinary errors.
 
@@ -81,7 +176,7 @@ def _guarded(
     unaffected.
     """
     try:
-        fn(run_dir, time, lexical_path, status)
+        fn(run_dir, time, lexical_path, status, **kwargs)
     except Exception:
         logger.exception(
             "Non-blocking progress hook %r failed for %s @ %s",
@@ -97,8 +192,16 @@ HookFunction: TypeAlias = Callable[
 
 
 class ProgressHook(NamedTuple):
-    fn: HookFunction
+    """
+    A progress hook, and how to call it.
+
+    With `eta=True` the hook is also passed an `eta` keyword: the estimated seconds
+    left in the run, or `None` without a :attr:`RunConfig.duration_history`.
+    """
+
+    fn: HookFunction | Callable[..., None]
     blocking: bool = False
+    eta: bool = False
 
 
 ResultType = TypeVar("ResultType", bound=fr.schemas.NodeData[Any])
@@ -113,6 +216,51 @@ def _make_steps():
     return Steps()
 
 
+class Attempt(NamedTuple):
+    started_at: datetime.datetime
+    finished_at: datetime.datetime
+    exception: BaseException | None = None
+    on_fallback: bool = False
+
+
+class Transport(NamedTuple):
+    """
+    The pickled bytes `sent` to and `received` from a slim out-of-process
+    evaluation (see :attr:`RunConfig.slim_transport`), the time the worker spent
+    `evaluating` in between, and the bytes passed through shared memory each way
+    (see :attr:`RunConfig.shared_memory_threshold`).
+    """
+
+    sent: int
+    received: int
+    evaluating: datetime.timedelta
+    shared_sent: int = 0
+    shared_received: int = 0
+
+
+class ChainedInput(NamedTuple):
+    """
+    An input of a chained submission (see :func:`submit_chained`) that is the
+    output `port` of its `upstream`-th upstream submission, found in that
+    submission's returned run -- or, if it was `spilled`, in its outputs file.
+    """
+
+    upstream: int
+    port: str
+    spilled: bool
+
+
+class Chaining(NamedTuple):
+    """
+    The inputs a chained submission (see :func:`submit_chained`) reads from its
+    upstream submissions, and whether it `spill`s its outputs into a file for its own
+    chained readers rather than sending them back.
+    """
+
+    inputs: dict[str, ChainedInput]
+    spill: bool
+
+
 @dataclasses.dataclass
 class Run(Generic[ResultType]):
     lexical_path: lexical.LexicalPath
@@ -123,6 +271,15 @@ class Run(Generic[ResultType]):
     finished_at: datetime.datetime | None = None
     run_dir: pathlib.Path | None = None
     steps: Steps = dataclasses.field(default_factory=_make_steps)
+    speculative: bool = False
+    attempts: list[Attempt] = dataclasses.field(default_factory=list)
+    pruned: list[fr.schemas.Label] = dataclasses.field(default_factory=list)
+    folded: list[fr.schemas.Label] = dataclasses.field(default_factory=list)
+    aliases: dict[fr.schemas.Label, fr.schemas.Label] = dataclasses.field(
+        default_factory=dict
+    )
+    fused: list[list[fr.schemas.Label]] = dataclasses.field(default_factory=list)
+    transport: Transport | None = None
 
     @property
     def outputs(self):
@@ -158,17 +315,74 @@ class RunConfig:
     ] = dataclasses.field(default_factory=list)
     dag_layers_multithreaded: bool = True
     dag_layers_max_threads: int = 10
+    dag_layers_interpreters: bool = False
     dag_layers_fail_fast: bool = False
+    dag_layers_critical_path: bool = False
+    dag_prune_to_outputs: bool = False
+    requested_outputs: Iterable[str] | None = None
+    dag_merge_duplicates: bool = False
+    dag_fuse_chains: bool = False
+    dag_inline_subgraphs: bool = False
+    dag_chain_futures: bool = False
+    if_speculative: bool = False
+    if_speculate_bodies: bool = False
+    #: Submit the iterations of for-each bodies on executorlib executors together, as
+    #: a job array. Arrays are split into jobs of
+    #: :attr:`~pyiron_workflow.executorlib.CacheOverride.array_chunk_size`
+    #: iterations, which run in parallel -- but the iterations within each job run
+    #: one after the other.
+    for_each_job_array: bool = False
+    slim_transport: bool = False
+    shared_memory_threshold: int | None = None
+    slim_recipe_cache: bool = False
+    resource_budget: resources.Resources | None = None
+    scheduler: scheduling.RunScheduler | None = None
+    run_priority: int = 0
+    run_share: float = 1.0
+    run_quota: int | None = None
+    duration_history: history.DurationHistory | None = None
+    constant_cache: folding.ConstantCache | None = None
+    single_flight: singleflight.SingleFlight | None = None
     hooks_max_threads: int = 10
     logger_name: str = __name__
     fleche_cache: Cache | None = None
     _prime_mover: lexical.LexicalPath | None = dataclasses.field(
         default=None, kw_only=True
     )
+    _cancellation: CancellationScope | None = dataclasses.field(
+        default=None, kw_only=True
+    )
+    _resource_pool: resources.ResourcePool | None = dataclasses.field(
+        default=None, kw_only=True
+    )
+    _eta: history.EtaTracker | None = dataclasses.field(default=None, kw_only=True)
+    _tenant: scheduling.Tenant | None = dataclasses.field(default=None, kw_only=True)
+    _worker_pool: WorkerPool | None = dataclasses.field(default=None, kw_only=True)
 
     def __post_init__(self) -> None:
         if self.fleche_cache is not None:
             self._assert_fleche_available()
+        if self.dag_layers_interpreters and not self.dag_layers_multithreaded:
+            raise ValueError(
+                "Interpreter workers evaluate the nodes of each layer in parallel; "
+                "set dag_layers_multithreaded=True to use dag_layers_interpreters."
+            )
+        if self.run_share <= 0:
+            raise ValueError(f"A run's share must be positive, got {self.run_share}")
+        if self.run_quota is not None and self.run_quota < 1:
+            raise ValueError(
+                f"A run's quota must be at least one slot, got {self.run_quota}"
+            )
+        if self.shared_memory_threshold is not None and not self.slim_transport:
+            raise ValueError(
+                "Shared memory transfer is part of the slim transport; set "
+                "slim_transport=True to use a shared_memory_threshold."
+            )
+        if self.slim_recipe_cache and not self.slim_transport:
+            raise ValueError(
+                "The worker recipe cache is part of the slim transport; set "
+                "slim_transport=True to use slim_recipe_cache."
+            )
 
     @_import_alarm
     def _assert_fleche_available(self) -> None:
@@ -185,15 +399,27 @@ class RunConfig:
             )
         return self._prime_mover
 
+    @property
+    def cancelled(self) -> bool:
+        return self._cancellation is not None and self._cancellation.cancelled
+
+    def raise_if_cancelled(self, lexical_path: lexical.LexicalPath) -> None:
+        if self.cancelled:
+            raise RunCancelledError(f"{lexical_path!r} was cancelled")
+
     def emit_progress(
         self, time: datetime.datetime, lexical_path: str, status: RunStatus
     ):
+        eta = (
+            None if self._eta is None else self._eta.update(lexical_path, status, time)
+        )
         for hook in self.progress_hooks:
             progress_hook = (
                 hook if isinstance(hook, ProgressHook) else ProgressHook(hook)
             )
+            kwargs = {"eta": eta} if progress_hook.eta else {}
             if progress_hook.blocking:
-                progress_hook.fn(self.run_dir, time, lexical_path, status)
+                progress_hook.fn(self.run_dir, time, lexical_path, status, **kwargs)
             else:
                 _get_hook_pool(self.hooks_max_threads).submit(
                     _guarded,
@@ -203,6 +429,7 @@ class RunConfig:
                     time,
                     lexical_path,
                     status,
+                    **kwargs,
                 )
 
     def emit_exception(self, failed_run: Run[ResultType], exception: BaseException):
@@ -223,15 +450,97 @@ class RunConfig:
             return contextlib.nullcontext()
 
 
+_INTERPRETER_POOL: type[futures.Executor] | None
+if sys.version_info >= (3, 14):
+    _INTERPRETER_POOL = futures.InterpreterPoolExecutor
+else:
+    _INTERPRETER_POOL = None
+# Pools whose workers start with nothing imported
+_FRESH_WORKER_POOLS: tuple[type[futures.Executor], ...] = tuple(
+    pool
+    for pool in (futures.ProcessPoolExecutor, _INTERPRETER_POOL)
+    if pool is not None
+)
+
+
+# What every worker evaluating nodes needs imported
+_STACK = ("pyiron_workflow.execution",)
+
+
+@functools.cache
+def _interpreters_usable() -> bool:
+    """Whether there are interpreter pools, and their workers can import our stack."""
+    if sys.version_info >= (3, 14):
+        from concurrent import interpreters  # noqa: PLC0415
+
+        interpreter = interpreters.create()
+        try:
+            interpreter.exec(f"import {', '.join(_STACK)}")
+        except interpreters.ExecutionFailed:
+            return False
+        finally:
+            interpreter.close()
+        return True
+    return False
+
+
 @dataclasses.dataclass
 class ExecutorInstructions:
+    """
+    How to build a fresh executor for each submission.
+
+    Process pools can start warm: before taking any task, each worker imports the
+    :attr:`preload` modules and calls the :attr:`warm_up` callables (which must be
+    picklable, e.g. module-level functions). On its own this only moves work out of
+    the first task; with ``start_method="forkserver"`` the preload modules are also
+    imported by the fork server, once, and the workers of every pool after that are
+    forked with them already imported. The fork server belongs to the whole process
+    and starts with the first such pool, so only the preloads known by then count.
+    """
+
     constructor: type[futures.Executor]
     args: tuple[Any, ...] = dataclasses.field(default_factory=tuple)
     kwargs: dict[str, Any] = dataclasses.field(default_factory=dict)
     start_method: str | None = "spawn"
+    preload: tuple[str, ...] = ()
+    warm_up: tuple[Callable[[], object], ...] = ()
+
+    @classmethod
+    def interpreter_pool(
+        cls, max_workers: int | None = None, **kwargs: Any
+    ) -> ExecutorInstructions:
+        """
+        Instructions for a pool evaluating in parallel: a
+        :class:`concurrent.futures.InterpreterPoolExecutor`, whose workers are
+        subinterpreters of this process with a GIL each, on python >= 3.14 -- and a
+        process pool otherwise, or if the pyiron_workflow stack can't be imported into
+        subinterpreters (extension modules need to support them).
+
+        Subinterpreters start without the cost of spawning processes, but both still
+        pickle what they are sent. Either way the workers start with our stack
+        preloaded, process pools through a fork server where there is one. Further
+        `kwargs` go to the pool.
+        """
+        kwargs = {"max_workers": max_workers, **kwargs}
+        if _INTERPRETER_POOL is not None and _interpreters_usable():
+            return cls(_INTERPRETER_POOL, kwargs=kwargs, preload=_STACK)
+        return cls(
+            futures.ProcessPoolExecutor,
+            kwargs=kwargs,
+            start_method="forkserver",
+            preload=_STACK,
+        )
 
     def instantiate(self) -> futures.Executor:
-        return self.constructor(*self.args, **self._resolved_kwargs())
+        kwargs = self._resolved_kwargs()
+        context = kwargs.get("mp_context")
+        if (
+            self.preload
+            and context is not None
+            and context.get_start_method() == "forkserver"
+        ):
+            context.set_forkserver_preload(list(self.preload))
+        return self.constructor(*self.args, **kwargs)
 
     def _resolved_kwargs(self) -> dict[str, Any]:
         """:attr:`kwargs`, with a non-``fork`` context forced onto process pools.
@@ -249,19 +558,133 @@ class ExecutorInstructions:
 
         An explicit ``mp_context`` in :attr:`kwargs` always wins, and
         ``start_method=None`` opts out entirely.
+
+        Any :attr:`preload` and :attr:`warm_up` become the pool initializer, which
+        then calls an ``initializer`` from :attr:`kwargs` itself -- for interpreter
+        pools too, whose workers likewise start with nothing imported.
         """
-        if (
-            self.start_method is None
-            or "mp_context" in self.kwargs
-            or not isinstance(self.constructor, type)
-            or not issubclass(self.constructor, futures.ProcessPoolExecutor)
-            or self.start_method not in multiprocessing.get_all_start_methods()
+        if not isinstance(self.constructor, type) or not issubclass(
+            self.constructor, _FRESH_WORKER_POOLS
         ):
             return self.kwargs
-        return {
-            **self.kwargs,
-            "mp_context": multiprocessing.get_context(self.start_method),
-        }
+        kwargs = dict(self.kwargs)
+        if self.preload or self.warm_up:
+            kwargs["initializer"] = _warm_worker
+            kwargs["initargs"] = (
+                self.preload,
+                self.warm_up,
+                self.kwargs.get("initializer"),
+                tuple(self.kwargs.get("initargs", ())),
+            )
+        if (
+            self.start_method is not None
+            and issubclass(self.constructor, futures.ProcessPoolExecutor)
+            and "mp_context" not in kwargs
+            and self.start_method in multiprocessing.get_all_start_methods()
+        ):
+            kwargs["mp_context"] = multiprocessing.get_context(self.start_method)
+        return kwargs
+
+
+class WorkerPool:
+    """
+    The parallel workers a run with :attr:`RunConfig.dag_layers_interpreters` sends
+    its atomic nodes to, unless they have an executor of their own: a pool following
+    :meth:`ExecutorInstructions.interpreter_pool`, started on first use and shut down
+    with the run. The layer threads then only orchestrate, and aren't bound by the
+    GIL while the nodes compute -- provided the nodes' functions can be pickled.
+
+    Pickling (e.g. along with a run configuration sent to an executor) yields a
+    closed pool: nodes evaluated elsewhere stay there.
+    """
+
+    def __init__(self, max_workers: int, closed: bool = False) -> None:
+        self.max_workers = max_workers
+        self._closed = closed
+        self._executor: futures.Executor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> futures.Executor | None:
+        """The live pool, or `None` once closed."""
+        with self._lock:
+            if self._closed:
+                return None
+            if self._executor is None:
+                self._executor = ExecutorInstructions.interpreter_pool(
+                    self.max_workers
+                ).instantiate()
+            return self._executor
+
+    def shutdown(self, abandon: bool = False) -> None:
+        """Close the pool, waiting for its workers -- or not, if abandoning them."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        if abandon:
+            _abandon(executor)
+        else:
+            executor.shutdown(wait=True)
+
+    def __reduce__(self):
+        return self.__class__, (self.max_workers, True)
+
+
+def _warm_worker(
+    preload: tuple[str, ...],
+    warm_up: tuple[Callable[[], object], ...],
+    initializer: Callable[..., object] | None,
+    initargs: tuple[Any, ...],
+) -> None:
+    """The pool initializer for :attr:`ExecutorInstructions.preload` and `warm_up`."""
+    for module in preload:
+        importlib.import_module(module)
+    for function in warm_up:
+        function()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How often, and how patiently, to re-evaluate a node whose evaluation raised.
+
+    Only exceptions matching :attr:`exceptions` are retried, and never more than
+    :attr:`max_attempts` evaluations are made in total. Before attempt `n + 1` we wait
+    `backoff * backoff_factor ** (n - 1)` seconds, capped at :attr:`max_backoff`.
+    Every attempt after the first is submitted to :attr:`fallback_executor`, when one
+    is given, instead of the node's own executor.
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.0
+    backoff_factor: float = 2.0
+    max_backoff: float | None = None
+    exceptions: tuple[type[Exception], ...] = (Exception,)
+    fallback_executor: futures.Executor | ExecutorInstructions | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(
+                f"A retry policy needs at least one attempt, got {self.max_attempts}."
+            )
+        if self.backoff < 0 or self.backoff_factor < 0:
+            raise ValueError(
+                f"Backoff must be non-negative, got backoff={self.backoff} and "
+                f"backoff_factor={self.backoff_factor}."
+            )
+
+    def retries(self, exception: BaseException, attempt: int) -> bool:
+        """Whether a failure on (1-indexed) `attempt` earns another attempt."""
+        return attempt < self.max_attempts and isinstance(exception, self.exceptions)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after a failure on (1-indexed) `attempt`."""
+        delay = self.backoff * self.backoff_factor ** (attempt - 1)
+        return delay if self.max_backoff is None else min(delay, self.max_backoff)
 
 
 def run(
@@ -289,10 +712,34 @@ def _run(
     /,
     **input_data,
 ):
+    owned_pool = None
     if config is None:
         config = RunConfig(_prime_mover=node.lexical_path)
     elif config._prime_mover is None:
-        config = dataclasses.replace(config, _prime_mover=node.lexical_path)
+        _assert_outputs_can_be_requested(node, config)
+        config = dataclasses.replace(
+            config,
+            _prime_mover=node.lexical_path,
+            _resource_pool=(
+                None
+                if config.resource_budget is None
+                else resources.ResourcePool(config.resource_budget)
+            ),
+            _eta=_eta_tracker(node, config, input_data),
+            _tenant=(
+                None
+                if config.scheduler is None
+                else scheduling.Tenant(
+                    config.run_priority, config.run_share, config.run_quota
+                )
+            ),
+            _worker_pool=(
+                WorkerPool(config.dag_layers_max_threads)
+                if config.dag_layers_interpreters
+                else None
+            ),
+        )
+        owned_pool = config._worker_pool
 
     if _current_run is None:
         current_run = Run[ResultType](
@@ -304,61 +751,741 @@ def _run(
     else:
         current_run = _current_run
 
-    current_run.started_at = datetime.datetime.now()
-    current_run.status = RunStatus.RUNNING
-    config.emit_progress(
-        current_run.started_at, current_run.lexical_path, current_run.status
-    )
+    _start_run(current_run, config)
     try:
+        config.raise_if_cancelled(current_run.lexical_path)
         populate_input_ports(current_run.result, input_data)
-        if node.executor is None:
-            with config._fleche_cache_context():
-                node.evaluate(current_run, config)
+        if config.single_flight is not None and isinstance(
+            current_run.result, fr.schemas.AtomicData
+        ):
+            _evaluate_single_flight(
+                node, config.single_flight, current_run, config, input_data
+            )
         else:
-            # Across-process: copy back rather than rebind
-            f = _submit(node, current_run, config)
-            returned, encountered_exception = f.result()
-            _copy_run_fields(returned, into=current_run)
-            if encountered_exception:
-                raise encountered_exception
+            _evaluate_with_any_retries(node, current_run, config, input_data)
         current_run.status = RunStatus.FINISHED
     except BaseException as e:
-        current_run.exception = e
-        current_run.status = RunStatus.FAILED
-        if config.is_prime_mover(node):
-            config.emit_exception(current_run, e)
+        _fail_run(node, current_run, config, e)
         raise
     finally:
-        current_run.finished_at = datetime.datetime.now()
-        config.emit_progress(
-            current_run.finished_at, current_run.lexical_path, current_run.status
-        )
+        if owned_pool is not None:
+            owned_pool.shutdown(abandon=current_run.status != RunStatus.FINISHED)
+        _finish_run(current_run, config)
     return current_run
 
 
-def _submit(
-    node: datatypes.Node, current_run: Run[ResultType], config: RunConfig
+def submit_chained(
+    node: datatypes.Node,
+    config: RunConfig,
+    current_run: Run[ResultType],
+    chaining: Chaining,
+    upstream: Sequence[futures.Future],
+    /,
+    **input_data,
 ) -> futures.Future:
-    if isinstance(node.executor, ExecutorInstructions):
-        with config._fleche_cache_context(), node.executor.instantiate() as exe:
-            if config.fleche_cache is not None:
-                fleche.wrap_executor(exe)
-            f = exe.submit(
-                _return_mutated_state_with_any_exception, node, current_run, config
+    """
+    Start evaluating `node` on its executorlib executor without waiting for it.
+
+    The `upstream` futures are those of other chained submissions (on executorlib
+    executors), which `chaining` says which inputs to read from. They are handed to
+    the executor as they are, so that it resolves them for the evaluation itself --
+    a file-based executor does so remotely, from the upstream cache files, so the
+    upstream data never passes through here. Pass the returned future to
+    :func:`collect_chained` to finish the run.
+    """
+    _start_run(current_run, config)
+    try:
+        config.raise_if_cancelled(current_run.lexical_path)
+        populate_input_ports(current_run.result, input_data)
+        executor = node.executor
+        if not isinstance(executor, futures.Executor):
+            raise TypeError(
+                f"Chained submission needs an executor instance, but "
+                f"{node.lexical_path!r} got {executor}."
             )
-    elif isinstance(node.executor, futures.Executor):
         with config._fleche_cache_context():
             if config.fleche_cache is not None:
-                fleche.wrap_executor(node.executor)
-            f = node.executor.submit(
-                _return_mutated_state_with_any_exception, node, current_run, config
+                fleche.wrap_executor(executor)
+            # The executor resolves the futures into what they hold before calling
+            return executor.submit(
+                _return_chained_state_with_any_exception,  # type: ignore[arg-type]
+                node,
+                current_run,
+                config,
+                chaining,
+                *upstream,
+            )
+    except BaseException as e:
+        _fail_run(node, current_run, config, e)
+        _finish_run(current_run, config)
+        raise
+
+
+def submit_array(
+    node: datatypes.Node,
+    config: RunConfig,
+    current_runs: Sequence[Run[ResultType]],
+    input_data: Sequence[dict[str, Any]],
+    /,
+) -> list[futures.Future]:
+    """
+    Start evaluating `node` once for each of `current_runs` (with the matching
+    `input_data`) as a job array on its executorlib executor, without waiting for
+    them. Pass each returned future to :func:`collect_chained` to finish its run.
+    """
+    from pyiron_workflow import executorlib  # noqa: PLC0415
+
+    started: list[Run[ResultType]] = []
+    try:
+        for current_run, data in zip(current_runs, input_data, strict=True):
+            _start_run(current_run, config)
+            started.append(current_run)
+            config.raise_if_cancelled(current_run.lexical_path)
+            populate_input_ports(current_run.result, data)
+        if not isinstance(node.executor, executorlib.CacheOverride):
+            raise TypeError(
+                f"Job arrays need a pyiron_workflow executorlib executor, but "
+                f"{node.lexical_path!r} got {node.executor}."
+            )
+        return node.executor.submit_array(
+            _return_mutated_state_with_any_exception,
+            [(node, current_run, config) for current_run in current_runs],
+        )
+    except BaseException as e:
+        for current_run in started:
+            _fail_run(node, current_run, config, e)
+            _finish_run(current_run, config)
+        raise
+
+
+def collect_chained(
+    node: datatypes.Node,
+    config: RunConfig,
+    current_run: Run[ResultType],
+    future: futures.Future,
+    /,
+) -> Run[ResultType]:
+    """
+    Wait for a :func:`submit_chained` (or :func:`submit_array`) evaluation and finish
+    its run.
+    """
+    try:
+        returned, encountered_exception = _await_result(
+            future, config, current_run.lexical_path
+        )
+        _copy_run_fields(returned, into=current_run)
+        if encountered_exception:
+            raise encountered_exception
+        current_run.status = RunStatus.FINISHED
+    except BaseException as e:
+        _fail_run(node, current_run, config, e)
+        raise
+    finally:
+        _finish_run(current_run, config)
+    return current_run
+
+
+def _start_run(current_run: Run[ResultType], config: RunConfig) -> None:
+    current_run.started_at = datetime.datetime.now()
+    current_run.status = RunStatus.RUNNING
+    config.emit_progress(
+        current_run.started_at, current_run.lexical_path, current_run.status
+    )
+
+
+def _fail_run(
+    node: datatypes.Node,
+    current_run: Run[ResultType],
+    config: RunConfig,
+    exception: BaseException,
+) -> None:
+    current_run.exception = exception
+    if isinstance(exception, RunCancelledError):
+        current_run.status = RunStatus.CANCELLED
+        return
+    current_run.status = (
+        RunStatus.TIMED_OUT
+        if isinstance(exception, NodeTimeoutError)
+        and exception.lexical_path == current_run.lexical_path
+        else RunStatus.FAILED
+    )
+    if config.is_prime_mover(node):
+        config.emit_exception(current_run, exception)
+
+
+def _finish_run(current_run: Run[ResultType], config: RunConfig) -> None:
+    current_run.finished_at = datetime.datetime.now()
+    config.emit_progress(
+        current_run.finished_at, current_run.lexical_path, current_run.status
+    )
+    duration = current_run.duration
+    if (
+        config.duration_history is not None
+        and current_run.status == RunStatus.FINISHED
+        and duration is not None
+    ):
+        config.duration_history.record(
+            history.recipe_key(current_run.result.recipe),
+            duration.total_seconds(),
+            history.input_size(
+                port.get_data() for port in current_run.result.input_ports.values()
+            ),
+        )
+
+
+def _evaluate_with_any_retries(
+    node: datatypes.Node,
+    current_run: Run[ResultType],
+    config: RunConfig,
+    input_data: dict[str, Any],
+) -> None:
+    if node.retry is None:
+        _evaluate(node, _executor(node, current_run, config), current_run, config)
+    else:
+        _evaluate_with_retries(node, node.retry, current_run, config, input_data)
+
+
+def _executor(
+    node: datatypes.Node, current_run: Run[ResultType], config: RunConfig
+) -> futures.Executor | ExecutorInstructions | None:
+    """The node's own executor, or else the run's worker pool for atomic nodes."""
+    if (
+        node.executor is None
+        and config._worker_pool is not None
+        and isinstance(current_run.result, fr.schemas.AtomicData)
+    ):
+        return config._worker_pool.executor
+    return node.executor
+
+
+def _evaluate_single_flight(
+    node: datatypes.Node,
+    flights: singleflight.SingleFlight,
+    current_run: Run[ResultType],
+    config: RunConfig,
+    input_data: dict[str, Any],
+) -> None:
+    """
+    Evaluate an atomic node, unless the same recipe is already being evaluated with
+    equal input, in which case wait for and take its outputs instead.
+    """
+    live = current_run.result
+    key = singleflight.flight_key(
+        live.recipe, {name: port.get_data() for name, port in live.input_ports.items()}
+    )
+    if key is None:
+        _evaluate_with_any_retries(node, current_run, config, input_data)
+        return
+
+    def compute() -> dict[str, Any]:
+        _evaluate_with_any_retries(node, current_run, config, input_data)
+        return {name: port.value for name, port in live.output_ports.items()}
+
+    outputs = flights.share(
+        key, compute, lambda: config.raise_if_cancelled(current_run.lexical_path)
+    )
+    for name, value in outputs.items():
+        live.output_ports[name].value = value
+
+
+def _assert_outputs_can_be_requested(node: datatypes.Node, config: RunConfig) -> None:
+    from pyiron_workflow import datatypes  # noqa: PLC0415
+
+    if config.requested_outputs and not isinstance(
+        node, datatypes.ImmutableDag | datatypes.MutableDag
+    ):
+        raise ValueError(
+            f"Only macros and workflows can narrow their outputs, but "
+            f"{node.lexical_path!r} is a {node.__class__.__name__} and was run with "
+            f"requested_outputs={config.requested_outputs!r}."
+        )
+
+
+def _eta_tracker(
+    node: datatypes.Node, config: RunConfig, input_data: dict[str, Any]
+) -> history.EtaTracker | None:
+    if config.duration_history is None or not any(
+        isinstance(hook, ProgressHook) and hook.eta for hook in config.progress_hooks
+    ):
+        return None
+    from pyiron_workflow import dag, datatypes  # noqa: PLC0415
+
+    plan = dag.estimate_runtime(node, config.duration_history, input_data)
+    root = lexical.LexicalPath(node.label)
+    if not isinstance(node, datatypes.ImmutableDag | datatypes.MutableDag):
+        return history.EtaTracker({root: plan.total}, {root: plan.total})
+    return history.EtaTracker(
+        {lexical.lexical_path(root, label): r for label, r in plan.ranks.items()},
+        {lexical.lexical_path(root, label): d for label, d in plan.durations.items()},
+    )
+
+
+def _evaluate(
+    node: datatypes.Node,
+    executor: futures.Executor | ExecutorInstructions | None,
+    current_run: Run[ResultType],
+    config: RunConfig,
+) -> None:
+    with (
+        _claimed_resources(node, executor, current_run, config),
+        _scheduled(executor, current_run, config),
+    ):
+        _evaluate_claimed(node, executor, current_run, config)
+
+
+def _does_the_work(
+    executor: futures.Executor | ExecutorInstructions | None,
+    current_run: Run[ResultType],
+) -> bool:
+    """
+    Whether a node evaluated on `executor` does its work itself: atomic nodes do, and
+    so do composites sent to another process as a whole, where their children draw
+    on fresh pools (pools pickle fresh). Composites evaluated in this process --
+    directly, or on a thread pool -- leave the work to their children, who draw on
+    the same pools as the composite.
+    """
+    if isinstance(current_run.result, fr.schemas.AtomicData):
+        return True
+    return executor is not None and not _in_this_process(executor)
+
+
+def _in_this_process(executor: futures.Executor | ExecutorInstructions) -> bool:
+    """Whether `executor` evaluates on threads of this interpreter."""
+    constructor = (
+        executor.constructor
+        if isinstance(executor, ExecutorInstructions)
+        else type(executor)
+    )
+    return (
+        isinstance(constructor, type)
+        and issubclass(constructor, futures.ThreadPoolExecutor)
+        and not issubclass(constructor, _FRESH_WORKER_POOLS)
+    )
+
+
+@contextlib.contextmanager
+def _claimed_resources(
+    node: datatypes.Node,
+    executor: futures.Executor | ExecutorInstructions | None,
+    current_run: Run[ResultType],
+    config: RunConfig,
+) -> Iterator[None]:
+    """
+    Hold the node's resource requirement from the run's pool, if there is one.
+
+    Only nodes that do the work themselves claim (see :func:`_does_the_work`), so a
+    composite never holds resources its children are waiting for.
+    """
+    if config._resource_pool is None or not _does_the_work(executor, current_run):
+        yield
+        return
+    requirement = node.resources or resources.DEFAULT_REQUIREMENT
+    with config._resource_pool.claim(
+        requirement, lambda: config.cancelled, _CANCELLATION_POLL_INTERVAL
+    ):
+        # Claims are only abandoned on cancellation
+        config.raise_if_cancelled(current_run.lexical_path)
+        yield
+
+
+@contextlib.contextmanager
+def _scheduled(
+    executor: futures.Executor | ExecutorInstructions | None,
+    current_run: Run[ResultType],
+    config: RunConfig,
+) -> Iterator[None]:
+    """
+    Hold a worker slot of the run's scheduler, if there is one, for the same nodes
+    that claim resources (see :func:`_does_the_work`) -- after their claim, so that
+    waiting on the run's own budget never holds up other runs.
+    """
+    if config.scheduler is None or not _does_the_work(executor, current_run):
+        yield
+        return
+    tenant = scheduling.Tenant() if config._tenant is None else config._tenant
+    with config.scheduler.slot(
+        tenant, lambda: config.cancelled, _CANCELLATION_POLL_INTERVAL
+    ):
+        # Slots are only abandoned on cancellation
+        config.raise_if_cancelled(current_run.lexical_path)
+        yield
+
+
+def _evaluate_claimed(
+    node: datatypes.Node,
+    executor: futures.Executor | ExecutorInstructions | None,
+    current_run: Run[ResultType],
+    config: RunConfig,
+) -> None:
+    if executor is None:
+        if node.timeout is None:
+            with config._fleche_cache_context():
+                node.evaluate(current_run, config)
+        elif isinstance(current_run.result, fr.schemas.AtomicData):
+            _evaluate_abandonably(node, node.timeout, current_run, config)
+        else:
+            _evaluate_with_deadline(node, node.timeout, current_run, config)
+    elif config.slim_transport and isinstance(
+        current_run.result, fr.schemas.AtomicData
+    ):
+        _evaluate_slim(node, executor, current_run, config)
+    else:
+        # Across-process: copy back rather than rebind
+        with _submitted(
+            node,
+            executor,
+            config,
+            _return_mutated_state_with_any_exception,
+            node,
+            current_run,
+            config,
+        ) as f:
+            returned, encountered_exception = _await_result(
+                f, config, current_run.lexical_path, node.timeout
             )
+        _copy_run_fields(returned, into=current_run)
+        if encountered_exception:
+            raise encountered_exception
+
+
+def _evaluate_slim(
+    node: datatypes.Node,
+    executor: futures.Executor | ExecutorInstructions,
+    current_run: Run[ResultType],
+    config: RunConfig,
+) -> None:
+    """
+    Evaluate an atomic node out of process, sending only its recipe and input values,
+    and receiving only its outputs, evaluation time and any exception -- rather than
+    the node, run, and configuration there and the whole run back.
+
+    Large buffers go through shared memory (see :mod:`pyiron_workflow.transfer`);
+    those we send are unlinked once the evaluation is over.
+
+    With a recipe cache, workers keep the live data they parse from a recipe (see
+    :mod:`pyiron_workflow.templates`), and once an executor has been sent a recipe it
+    only gets its key; a worker that hasn't seen it yet answers with a miss, and we
+    send the recipe after all.
+    """
+    recipe = current_run.result.recipe
+    input_data = {
+        name: port.value
+        for name, port in current_run.result.input_ports.items()
+        if not isinstance(port.value, fr.schemas.NotData)
+    }
+    key = history.recipe_key(recipe) if config.slim_recipe_cache else None
+    sent = received = shared_sent = shared_received = 0
+    send_recipe = key is None or not _was_sent_template(executor, key)
+    while True:
+        request, reply = _slim_round_trip(
+            node,
+            executor,
+            current_run,
+            config,
+            (key, recipe if send_recipe else None, input_data),
+        )
+        (outputs, evaluating, encountered_exception), received_segments = (
+            transfer.unpack(reply)
+        )
+        # Our outputs keep whatever they need mapped
+        transfer.release(received_segments, unlink=True)
+        sent += len(request.payload)
+        received += len(reply.payload)
+        shared_sent += request.shared
+        shared_received += reply.shared
+        if send_recipe or not isinstance(
+            encountered_exception, templates.TemplateMissError
+        ):
+            break
+        send_recipe = True
+    if key is not None and send_recipe:
+        _add_sent_template(executor, key)
+    current_run.transport = Transport(
+        sent, received, evaluating, shared_sent, shared_received
+    )
+    if encountered_exception:
+        raise encountered_exception
+    for name, value in outputs.items():
+        current_run.result.output_ports[name].value = value
+
+
+def _slim_round_trip(
+    node: datatypes.Node,
+    executor: futures.Executor | ExecutorInstructions,
+    current_run: Run[ResultType],
+    config: RunConfig,
+    request_data: tuple[str | None, fr.schemas.AtomicRecipe | None, dict[str, Any]],
+) -> tuple[transfer.Packed, transfer.Packed]:
+    request, sent_segments = transfer.pack(request_data, config.shared_memory_threshold)
+    try:
+        with _submitted(
+            node,
+            executor,
+            config,
+            _return_slim_reply,
+            current_run.lexical_path,
+            request,
+            config.run_dir,
+        ) as f:
+            reply = _await_result(f, config, current_run.lexical_path, node.timeout)
+    finally:
+        transfer.release(sent_segments, unlink=True)
+    return request, reply
+
+
+def _keeps_workers(
+    executor: futures.Executor | ExecutorInstructions,
+) -> TypeGuard[futures.Executor]:
+    """
+    Whether later submissions may reach the same workers, so that it's worth only
+    sending recipe keys. Instructions build a fresh executor every time, and the
+    executorlib wrappers cache replies by lexical path, so they'd keep a miss.
+    """
+    from pyiron_workflow import executorlib  # noqa: PLC0415
+
+    return isinstance(executor, futures.Executor) and not isinstance(
+        executor, executorlib.CacheOverride
+    )
+
+
+def _was_sent_template(
+    executor: futures.Executor | ExecutorInstructions, key: str
+) -> bool:
+    if _keeps_workers(executor):
+        with _sent_templates_lock:
+            return key in _sent_templates.get(executor, ())
+    return False
+
+
+def _add_sent_template(
+    executor: futures.Executor | ExecutorInstructions, key: str
+) -> None:
+    if _keeps_workers(executor):
+        with _sent_templates_lock:
+            _sent_templates.setdefault(executor, set()).add(key)
+
+
+def _evaluate_abandonably(
+    node: datatypes.Node,
+    timeout: float,
+    current_run: Run[ResultType],
+    config: RunConfig,
+) -> None:
+    """
+    Evaluate an atomic node on a daemon thread, and stop waiting for it on timeout.
+
+    Python threads can't be killed, so a timed-out function keeps running in the
+    background until it returns (or the interpreter exits). It works on a scratch
+    copy of the live data, so that it can't write into the run after we gave up on it.
+    """
+    scratch = dataclasses.replace(
+        current_run,
+        result=node.generate_flowrep_live_node(),
+        steps=Steps(),
+        attempts=[],
+    )
+    for name, port in current_run.result.input_ports.items():
+        scratch.result.input_ports[name].value = port.value
+
+    f: futures.Future = futures.Future()
+
+    def evaluate_in_thread():
+        if not f.set_running_or_notify_cancel():
+            return
+        try:
+            with config._fleche_cache_context():
+                f.set_result(
+                    _return_mutated_state_with_any_exception(node, scratch, config)
+                )
+        except BaseException as e:
+            f.set_exception(e)
+
+    threading.Thread(
+        target=evaluate_in_thread,
+        name=f"timeout-guarded {current_run.lexical_path}",
+        daemon=True,
+    ).start()
+    returned, encountered_exception = _await_result(
+        f, config, current_run.lexical_path, timeout
+    )
+    _copy_run_fields(returned, into=current_run)
+    if encountered_exception:
+        raise encountered_exception
+
+
+def _evaluate_with_deadline(
+    node: datatypes.Node,
+    timeout: float,
+    current_run: Run[ResultType],
+    config: RunConfig,
+) -> None:
+    """
+    Evaluate a composite node in-process, cancelling its children once `timeout` has
+    elapsed; children that are already running finish, but no new ones start.
+    """
+    deadline = CancellationScope(config._cancellation)
+    timer = threading.Timer(timeout, deadline.cancel)
+    timer.daemon = True
+    timer.start()
+    try:
+        with config._fleche_cache_context():
+            node.evaluate(
+                current_run, dataclasses.replace(config, _cancellation=deadline)
+            )
+    except RunCancelledError as e:
+        if config.cancelled:
+            raise
+        raise NodeTimeoutError(current_run.lexical_path, timeout) from e
+    finally:
+        timer.cancel()
+
+
+def _evaluate_with_retries(
+    node: datatypes.Node,
+    policy: RetryPolicy,
+    current_run: Run[ResultType],
+    config: RunConfig,
+    input_data: dict[str, Any],
+) -> None:
+    """
+    Evaluate `node` until it succeeds or `policy` gives up, recording each attempt.
+
+    A failed attempt may have partially populated the run, so the live data is reset
+    in place (the parent's data holds a reference to it) before the next attempt.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        on_fallback = attempt > 1 and policy.fallback_executor is not None
+        executor = (
+            policy.fallback_executor
+            if on_fallback
+            else _executor(node, current_run, config)
+        )
+        started_at = datetime.datetime.now()
+        try:
+            _evaluate(node, executor, current_run, config)
+        except BaseException as e:
+            current_run.attempts.append(
+                Attempt(started_at, datetime.datetime.now(), e, on_fallback)
+            )
+            if not policy.retries(e, attempt):
+                raise
+            logging.getLogger(config.logger_name).warning(
+                "Attempt %d of %d failed for %s, retrying: %r",
+                attempt,
+                policy.max_attempts,
+                current_run.lexical_path,
+                e,
+            )
+            _reset_for_retry(node, current_run, input_data)
+            time.sleep(policy.delay(attempt))
+            config.raise_if_cancelled(current_run.lexical_path)
+        else:
+            current_run.attempts.append(
+                Attempt(started_at, datetime.datetime.now(), None, on_fallback)
+            )
+            return
+
+
+def _reset_for_retry(
+    node: datatypes.Node, current_run: Run[ResultType], input_data: dict[str, Any]
+) -> None:
+    vars(current_run.result).update(vars(node.generate_flowrep_live_node()))
+    populate_input_ports(current_run.result, input_data)
+    current_run.steps = Steps()
+    current_run.exception = None
+    current_run.status = RunStatus.RUNNING
+
+
+@contextlib.contextmanager
+def _submitted(
+    node: datatypes.Node,
+    executor: futures.Executor | ExecutorInstructions,
+    config: RunConfig,
+    fn: Callable[..., Any],
+    /,
+    *args: Any,
+) -> Iterator[futures.Future]:
+    """
+    Submit `fn(*args)` and yield the future, so that the caller waits on it while any
+    executor we instantiated ourselves is still alive.
+
+    If the wait is cancelled or times out, such an executor is abandoned (see
+    :func:`_abandon`). Live executors belong to the user, so there we only cancel
+    the future.
+    """
+    if isinstance(executor, ExecutorInstructions):
+        with config._fleche_cache_context():
+            exe = executor.instantiate()
+            try:
+                if config.fleche_cache is not None:
+                    fleche.wrap_executor(exe)
+                yield exe.submit(fn, *args)
+            except (RunCancelledError, NodeTimeoutError):
+                _abandon(exe)
+                raise
+            except BaseException:
+                exe.shutdown(wait=True)
+                raise
+            else:
+                exe.shutdown(wait=True)
+    elif isinstance(executor, futures.Executor):
+        with config._fleche_cache_context():
+            if config.fleche_cache is not None:
+                fleche.wrap_executor(executor)
+            yield executor.submit(fn, *args)
     else:
         raise TypeError(
             f"Expected executor to be an instance of ExecutorInstructions or "
-            f"futures.Executor, but {node.lexical_path!r} got {node.executor}."
+            f"futures.Executor, but {node.lexical_path!r} got {executor}."
         )
-    return f
+
+
+def _abandon(exe: futures.Executor) -> None:
+    """
+    Shut `exe` down without waiting and with its futures cancelled, which lets
+    backends that can (e.g. `executorlib`'s file based executors) kill the remote
+    task; process pool workers are terminated outright.
+    """
+    if isinstance(exe, futures.ProcessPoolExecutor):
+        if hasattr(exe, "terminate_workers"):  # python >= 3.14
+            exe.terminate_workers()
+            return
+        # Shutting down forgets the worker processes, so grab them first
+        workers = list((exe._processes or {}).values())
+        exe.shutdown(wait=False, cancel_futures=True)
+        for process in workers:
+            process.terminate()
+    else:
+        exe.shutdown(wait=False, cancel_futures=True)
+
+
+def _await_result(
+    f: futures.Future,
+    config: RunConfig,
+    lexical_path: lexical.LexicalPath,
+    timeout: float | None = None,
+) -> Any:
+    """
+    Wait for `f`, cancelling it if the run is cancelled or `timeout` elapses in the
+    meantime.
+    """
+    if config._cancellation is None and timeout is None:
+        return f.result()
+    started = time.monotonic()
+    while True:
+        wait = _CANCELLATION_POLL_INTERVAL
+        if timeout is not None:
+            wait = min(wait, max(started + timeout - time.monotonic(), 0))
+        if futures.wait([f], timeout=wait).done:
+            return f.result()
+        if config.cancelled:
+            f.cancel()
+            raise RunCancelledError(f"{lexical_path!r} was cancelled")
+        if timeout is not None and time.monotonic() - started >= timeout:
+            f.cancel()
+            raise NodeTimeoutError(lexical_path, timeout)
 
 
 def _return_mutated_state_with_any_exception(
@@ -385,6 +1512,108 @@ def _return_mutated_state_with_any_exception(
         return current_run, e
 
 
+def _return_slim_reply(
+    lexical_path: lexical.LexicalPath,
+    request: transfer.Packed,
+    run_dir: pathlib.Path,
+    /,
+) -> transfer.Packed:
+    """
+    The worker side of :func:`_evaluate_slim`: build the live data from the packed
+    recipe (or our cached template for its key), populate the packed input values,
+    evaluate it, and pack the outputs, evaluation time and any exception. The lexical
+    path and run directory only key executor caches.
+    """
+    from pyiron_workflow import atomic_node  # noqa: PLC0415
+
+    # The requester unlinks all segments; a tracker of our own would unlink them on exit
+    tracked = transfer.shares_tracker(request.pid)
+    (key, recipe, input_data), received_segments = transfer.unpack(request, tracked)
+    started_at = datetime.datetime.now()
+    outputs: dict[str, Any] = {}
+    encountered_exception: BaseException | None = None
+    try:
+        live = (
+            fr.schemas.AtomicData.from_recipe(recipe)
+            if key is None
+            else templates.resident().instantiate(key, recipe)
+        )
+        populate_input_ports(live, input_data)
+        atomic_node.evaluate_live(live)
+    except BaseException as e:
+        encountered_exception = e
+    else:
+        outputs = {name: port.value for name, port in live.output_ports.items()}
+    evaluating = datetime.datetime.now() - started_at
+    try:
+        reply, sent_segments = transfer.pack(
+            (outputs, evaluating, encountered_exception), request.threshold, tracked
+        )
+    finally:
+        transfer.release(received_segments, unlink=False)
+    transfer.release(sent_segments, unlink=False)
+    return reply
+
+
+def _return_chained_state_with_any_exception(
+    node: datatypes.Node[Any, ResultType],
+    current_run: Run[ResultType],
+    config: RunConfig,
+    chaining: Chaining,
+    /,
+    *upstream: tuple[Run[Any], BaseException | None],
+) -> tuple[Run[ResultType], BaseException | None]:
+    """
+    :func:`_return_mutated_state_with_any_exception`, after first reading the inputs
+    that arrive as outputs of the (executor-resolved) `upstream` chained submissions.
+
+    Those inputs aren't sent back, and neither are the outputs if they `spill` into
+    the outputs file -- only chained readers need them then.
+    """
+    try:
+        for port, chained in chaining.inputs.items():
+            upstream_run, upstream_exception = upstream[chained.upstream]
+            if upstream_exception is not None:
+                raise RunCancelledError(
+                    f"{current_run.lexical_path!r} was cancelled because its upstream "
+                    f"{upstream_run.lexical_path!r} failed"
+                )
+            current_run.result.input_ports[port].value = (
+                _read_spilled_outputs(upstream_run, config)[chained.port]
+                if chained.spilled
+                else upstream_run.result.output_ports[chained.port].value
+            )
+    except BaseException as e:
+        current_run.exception = e
+        current_run.status = RunStatus.CANCELLED
+        current_run.finished_at = datetime.datetime.now()
+        return current_run, e
+    returned, exception = _return_mutated_state_with_any_exception(
+        node, current_run, config
+    )
+    for port in chaining.inputs:
+        returned.result.input_ports[port].value = fr.schemas.NOT_DATA
+    if chaining.spill and exception is None:
+        outputs_file = _spilled_outputs_file(returned, config)
+        outputs_file.parent.mkdir(parents=True, exist_ok=True)
+        filelocks.write_atomically(
+            outputs_file,
+            {name: port.value for name, port in returned.result.output_ports.items()},
+        )
+        for port in returned.result.output_ports.values():
+            port.value = fr.schemas.NOT_DATA
+    return returned, exception
+
+
+def _spilled_outputs_file(current_run: Run[Any], config: RunConfig) -> pathlib.Path:
+    return config.run_dir / "chained_outputs" / f"{current_run.lexical_path}.pickle"
+
+
+def _read_spilled_outputs(current_run: Run[Any], config: RunConfig) -> dict[str, Any]:
+    with open(_spilled_outputs_file(current_run, config), "rb") as f:
+        return pickle.load(f)
+
+
 def _copy_run_fields(from_run: Run[ResultType], into: Run[ResultType]) -> None:
     vars(into.result).update(vars(from_run.result))
     into.status = from_run.status
@@ -392,6 +1621,10 @@ def _copy_run_fields(from_run: Run[ResultType], into: Run[ResultType]) -> None:
     into.started_at = from_run.started_at
     into.finished_at = from_run.finished_at
     into.steps = from_run.steps
+    into.pruned = from_run.pruned
+    into.folded = from_run.folded
+    into.aliases = from_run.aliases
+    into.fused = from_run.fused
 
 
 def populate_input_ports(node: fr.schemas.NodeData, values: dict[str, Any]) -> None:
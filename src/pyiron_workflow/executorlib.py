@@ -11,12 +11,20 @@ I.e., make a fresh run config directory for each iteration of input data where t
 caching executors are being leveraged.
 """
 
-from typing import ClassVar
+import contextlib
+import os
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from concurrent import futures
+from typing import Any, ClassVar, NamedTuple
 
 import executorlib
 import executorlib.api as exlib_api
+from executorlib.standalone import hdf
 
-from pyiron_workflow import execution
+from pyiron_workflow import execution, history
 
 
 class DedicatedExecutorError(TypeError):
@@ -31,39 +39,322 @@ class ProtectedResourceError(ValueError):
     """
 
 
+class _PackedTask(NamedTuple):
+    fn: Any
+    args: tuple[Any, ...]
+    cache_file: str
+    estimate: float
+    future: futures.Future
+
+
 class CacheOverride(executorlib.BaseExecutor):
+    """
+    Job arrays (see :meth:`submit_array`) are split into jobs of at most
+    `array_chunk_size` tasks each, which run in parallel, while the tasks within a
+    job run one after the other. The sizes of the array jobs submitted so far are
+    kept in :attr:`array_sizes`.
+    """
+
     cache_directory: ClassVar[str] = "executorlib_cache"
+    slim_cache_directory: ClassVar[str] = "slim"
+    _ROUTINES_DESCRIPTION: ClassVar[str] = (
+        "_return_mutated_state_with_any_exception(node, run, config), "
+        "_return_slim_reply(lexical_path, request, run_dir), and "
+        "_return_chained_state_with_any_exception(node, run, config, chaining, "
+        "*upstream)"
+    )
+
+    def __init__(self, *args, array_chunk_size: int = 8, **kwargs):
+        if array_chunk_size < 1:
+            raise ValueError(
+                f"An array job needs room for at least one task, got "
+                f"{array_chunk_size}."
+            )
+        super().__init__(*args, **kwargs)
+        self.array_chunk_size = array_chunk_size
+        self.array_sizes: list[int] = []
 
     def submit(self, fn, /, *args, **kwargs):
         """
         Modify behaviour when submitting for a pyiron_workflow execution loop
         """
-        if not self._recognized_submission(fn) or len(args) != 3 or len(kwargs) != 0:
+        super_kwargs = {"resource_dict": self._cache_key_info(fn, args, kwargs)}
+        return super().submit(fn, *args, **super_kwargs)
+
+    def _cache_key_info(self, fn, args, kwargs) -> dict[str, str]:
+        if not self._recognized_submission(fn, args) or len(kwargs) != 0:
             raise DedicatedExecutorError(
                 f"{self.__class__.__name__} is only intended to work with the "
-                f"run routine of pyiron_workflow: "
-                f"{execution._return_mutated_state_with_any_exception.__module__}."
-                f"{execution._return_mutated_state_with_any_exception.__qualname__}, and "
-                f"its three expected arguments, but got submitted {fn!r} with input "
-                f"{args!r}, and {kwargs!r}"
+                f"run routines of pyiron_workflow in {execution.__name__} and their "
+                f"expected arguments ({self._ROUTINES_DESCRIPTION}), but got "
+                f"submitted {fn!r} with input {args!r}, and {kwargs!r}"
             )
 
-        node, _, config = args
-        cache_key_info = {
-            "cache_key": node.lexical_path,
-            "cache_directory": str(config.run_dir / self.cache_directory),
+        if unwrapped(fn) is execution._return_slim_reply:
+            # Slim replies are packed differently, so they mustn't be read back as
+            # (or in place of) full ones
+            lexical_path, _, run_dir = args
+            cache_directory = run_dir / self.cache_directory / self.slim_cache_directory
+        else:
+            # The run's path, not the node's, so repeated children (e.g. for-loop
+            # iterations, which share a body node) each get their own cache file
+            _, run, config = args[:3]
+            lexical_path, run_dir = run.lexical_path, config.run_dir
+            cache_directory = run_dir / self.cache_directory
+        return {
+            "cache_key": lexical_path,
+            "cache_directory": str(cache_directory),
         }
-        super_kwargs = {"resource_dict": cache_key_info}
 
-        return super().submit(fn, *args, **super_kwargs)
+    def submit_array(
+        self, fn, tasks: Sequence[tuple[Any, ...]]
+    ) -> list[futures.Future]:
+        """
+        Submit the run routine `fn` for each of `tasks` (its arguments) as a job
+        array, whose task `i` evaluates `fn(*tasks[i])` and writes its own cache file,
+        just as if it had been submitted on its own. Tasks that are already cached are
+        read back from there instead, and are left out of the array. The rest are
+        submitted in jobs of up to :attr:`array_chunk_size` tasks.
+
+        Returns:
+            list[futures.Future]: The future of each task, in order.
+        """
+        if unwrapped(fn) is execution._return_chained_state_with_any_exception:
+            raise DedicatedExecutorError(
+                f"Job arrays can't resolve chained futures, but got submitted {fn!r}."
+            )
+        submitted: list[futures.Future] = []
+        array: list[_PackedTask] = []
+        for args in tasks:
+            cache_file = self._cache_file(fn, args, {})
+            if os.path.exists(cache_file):
+                submitted.append(_from_cache(cache_file))
+            else:
+                task = _PackedTask(fn, args, cache_file, 0.0, futures.Future())
+                array.append(task)
+                submitted.append(task.future)
+        for start in range(0, len(array), self.array_chunk_size):
+            n_submitted = self._submit_together(
+                array[start : start + self.array_chunk_size], "array"
+            )
+            if n_submitted > 0:
+                self.array_sizes.append(n_submitted)
+        return submitted
+
+    def _cache_file(self, fn, args, kwargs) -> str:
+        cache_key_info = self._cache_key_info(fn, args, kwargs)
+        return os.path.join(
+            cache_key_info["cache_directory"], cache_key_info["cache_key"] + "_o.h5"
+        )
+
+    def _submit_together(self, tasks: list[_PackedTask], kind: str) -> int:
+        """
+        Submit `tasks` (those not yet cancelled) as a single job, resolving their
+        futures as it finishes, and return how many were submitted.
+        """
+        tasks = [task for task in tasks if task.future.set_running_or_notify_cancel()]
+        if len(tasks) == 0:
+            return 0
+        # These jobs are one-offs, and their own files only ferry results back to us
+        cache_directory = os.path.dirname(tasks[0].cache_file)
+        job_key = f"{kind}_{uuid.uuid4().hex}"
+        try:
+            # Bypass our own submit, which handles exactly one routine
+            together = super().submit(
+                _run_together,
+                [(task.fn, task.args, task.cache_file) for task in tasks],
+                resource_dict={
+                    "cache_key": job_key,
+                    "cache_directory": cache_directory,
+                },
+            )
+        except BaseException as e:
+            for task in tasks:
+                task.future.set_exception(e)
+            raise
+
+        def distribute(done: futures.Future) -> None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(cache_directory, job_key + "_o.h5"))
+            try:
+                results = done.result()
+            except BaseException as e:
+                for task in tasks:
+                    task.future.set_exception(e)
+                return
+            for task, (returned, result) in zip(tasks, results, strict=True):
+                if returned:
+                    task.future.set_result(result)
+                else:
+                    task.future.set_exception(result)
+
+        together.add_done_callback(distribute)
+        return len(tasks)
+
+    @classmethod
+    def _recognized_submission(cls, fn, args) -> bool:
+        """
+        Whether `fn` is a recognized run routine and `args` fit it (chained routines
+        take any number of upstream futures after their fixed arguments).
+        """
+        fn = unwrapped(fn)
+        for routine, n_args, variadic in (
+            (execution._return_mutated_state_with_any_exception, 3, False),
+            (execution._return_slim_reply, 3, False),
+            (execution._return_chained_state_with_any_exception, 4, True),
+        ):
+            if fn is routine:
+                return len(args) == n_args or (variadic and len(args) > n_args)
+        return False
+
+
+class JobPacking(CacheOverride):
+    """
+    Pack run routines submitted in quick succession (e.g. the iterations of a
+    for-loop) into shared jobs, rather than submitting one job per node.
+
+    A pack is submitted once it holds `max_pack_size` routines, once their estimated
+    durations (from the run configuration's duration history, where it knows the
+    node) reach `pack_walltime` seconds, or `pack_window` seconds after its first
+    routine arrived -- whichever comes first. Inside the job, routines run one after
+    the other, and each writes its own cache file, just as if it had been submitted
+    on its own; routines that are already cached are read back from there without
+    any job. Routines reading upstream futures are never packed.
+
+    The resources the executor is built with apply to each pack, and the sizes of
+    the packs submitted so far are kept in :attr:`pack_sizes`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_pack_size: int = 64,
+        pack_walltime: float | None = None,
+        pack_window: float = 0.1,
+        **kwargs,
+    ):
+        if max_pack_size < 1:
+            raise ValueError(
+                f"A pack needs room for at least one node, got {max_pack_size}."
+            )
+        super().__init__(*args, **kwargs)
+        self.max_pack_size = max_pack_size
+        self.pack_walltime = pack_walltime
+        self.pack_window = pack_window
+        self.pack_sizes: list[int] = []
+        self._pending: list[_PackedTask] = []
+        self._pending_timer: threading.Timer | None = None
+        self._pack_lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        cache_file = self._cache_file(fn, args, kwargs)
+        if unwrapped(fn) is execution._return_chained_state_with_any_exception:
+            return super().submit(fn, *args, **kwargs)
+        if os.path.exists(cache_file):
+            return _from_cache(cache_file)
+
+        task = _PackedTask(
+            fn, args, cache_file, self._estimate(fn, args), futures.Future()
+        )
+        with self._pack_lock:
+            self._pending.append(task)
+            full = len(self._pending) >= self.max_pack_size or (
+                self.pack_walltime is not None
+                and sum(t.estimate for t in self._pending) >= self.pack_walltime
+            )
+            if full:
+                pack = self._take_pending()
+            else:
+                pack = []
+                if self._pending_timer is None:
+                    self._pending_timer = threading.Timer(
+                        self.pack_window, self._submit_pending
+                    )
+                    self._pending_timer.daemon = True
+                    self._pending_timer.start()
+        self._submit_pack(pack)
+        return task.future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        self._submit_pending()
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self._submit_pending()
+        super().__exit__(*args, **kwargs)
 
     @staticmethod
-    def _recognized_submission(fn):
-        return fn is execution._return_mutated_state_with_any_exception or (
-            type(fn).__name__ == "BoundWrapper"
-            and getattr(fn, "func", None)
-            is execution._return_mutated_state_with_any_exception
+    def _estimate(fn, args) -> float:
+        """Seconds the routine is expected to take, or zero if we can't tell."""
+        if unwrapped(fn) is execution._return_slim_reply:
+            return 0.0
+        node, current_run, config = args
+        if config.duration_history is None:
+            return 0.0
+        estimate = config.duration_history.estimate(
+            history.recipe_key(node.recipe),
+            history.input_size(
+                port.get_data() for port in current_run.result.input_ports.values()
+            ),
+        )
+        return 0.0 if estimate is None else estimate
+
+    def _take_pending(self) -> list[_PackedTask]:
+        pack, self._pending = self._pending, []
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+        return pack
+
+    def _submit_pending(self) -> None:
+        with self._pack_lock:
+            pack = self._take_pending()
+        self._submit_pack(pack)
+
+    def _submit_pack(self, pack: list[_PackedTask]) -> None:
+        n_submitted = self._submit_together(pack, "pack")
+        if n_submitted > 0:
+            self.pack_sizes.append(n_submitted)
+
+
+def _run_together(
+    tasks: list[tuple[Any, tuple[Any, ...], str]],
+) -> list[tuple[bool, Any]]:
+    """
+    Run the routines of a pack or array one after the other, writing each one's cache file as the
+    executorlib backend would have, and return whether each returned, and what.
+    """
+    results = []
+    for fn, args, cache_file in tasks:
+        started = time.time()
+        try:
+            result = (True, fn(*args))
+        except Exception as e:
+            result = (False, e)
+        runtime = time.time() - started
+        # Unique, since jobs may run the same routine at once (e.g. loop iterations)
+        reply_file = f"{cache_file[: -len('_o.h5')]}_{uuid.uuid4().hex}_r.h5"
+        hdf.dump(
+            file_name=reply_file,
+            data_dict=(
+                {"output": result[1], "runtime": runtime}
+                if result[0]
+                else {"error": result[1], "runtime": runtime}
+            ),
         )
+        os.replace(reply_file, cache_file)
+        results.append(result)
+    return results
+
+
+def _from_cache(cache_file: str) -> futures.Future:
+    future: futures.Future = futures.Future()
+    _, returned, result = hdf.get_output(cache_file)
+    if returned:
+        future.set_result(result)
+    else:
+        future.set_exception(result)
+    return future
 
 
 class NodeSingleExecutor(CacheOverride, executorlib.SingleNodeExecutor): ...
@@ -72,4 +363,30 @@ class NodeSingleExecutor(CacheOverride, executorlib.SingleNodeExecutor): ...
 class NodeSlurmExecutor(CacheOverride, executorlib.SlurmClusterExecutor): ...
 
 
+class NodeSlurmPackingExecutor(JobPacking, executorlib.SlurmClusterExecutor): ...
+
+
 class _CacheTestExecutor(CacheOverride, exlib_api.TestClusterExecutor): ...
+
+
+class _PackingCacheTestExecutor(JobPacking, exlib_api.TestClusterExecutor): ...
+
+
+def accepts_futures(executor: object) -> bool:
+    """Whether `executor` resolves futures among submitted arguments itself."""
+    return isinstance(executor, executorlib.BaseExecutor)
+
+
+def accepts_arrays(executor: object) -> bool:
+    """Whether `executor` can submit many run routines as a single job array."""
+    return isinstance(executor, CacheOverride)
+
+
+def unwrapped(fn):
+    """
+    The function submitted as `fn`, beneath the resource-binding wrapper executorlib
+    may have put around it.
+    """
+    if type(fn).__name__ == "BoundWrapper":
+        return getattr(fn, "func", None)
+    return fn
@@ -0,0 +1,63 @@
+"""
+Coordination between processes (and hosts) through files on storage they share.
+
+A lock is claimed by exclusively creating its file, which only one process can do,
+and holds the claiming host and process id. Pickles are written under temporary
+names and moved into place, so nobody reads them half written.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import pathlib
+import pickle
+import socket
+import uuid
+from typing import Any
+
+
+def claim(lock_file: pathlib.Path) -> bool:
+    """Whether we got the lock, which only one process can."""
+    try:
+        descriptor = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    with os.fdopen(descriptor, "w") as f:
+        f.write(f"{socket.gethostname()} {os.getpid()}\n")
+    return True
+
+
+def abandoned(lock_file: pathlib.Path) -> bool:
+    """Whether the lock is held by a process on this host that no longer exists."""
+    try:
+        host, pid = lock_file.read_text().split()
+    except (FileNotFoundError, ValueError):
+        return False  # Released, or not yet written
+    if host != socket.gethostname():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass  # Alive, just not ours
+    return False
+
+
+def write_atomically(path: pathlib.Path, obj: Any) -> None:
+    """Pickle `obj` to `path`, leaving nothing behind if that fails."""
+    partial = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    try:
+        with open(partial, "wb") as f:
+            pickle.dump(obj, f)
+        os.replace(partial, path)
+    finally:
+        remove(partial)
+
+
+def remove(*paths: pathlib.Path) -> None:
+    """Remove whichever of the `paths` exist."""
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
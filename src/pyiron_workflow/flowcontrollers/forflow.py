@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from collections.abc import MutableMapping
+from typing import NamedTuple
 
 import flowrep as fr
 
@@ -10,10 +11,24 @@ from pyiron_workflow import (
     dag,
     datatypes,
     execution,
+    executorlib,
     transformers,
 )
 
 
+class _RuntimeStages(NamedTuple):
+    """The children of a for-each run, by the stage of the loop they belong to."""
+
+    scatters: dict[fr.schemas.Label, datatypes.Node]
+    iterations: dict[fr.schemas.Label, datatypes.Node]
+    aggregators: dict[fr.schemas.Label, datatypes.Node]
+
+    def node_map(self, parent: ForEach) -> datatypes.NodeMap:
+        return datatypes.NodeMap(
+            parent, {**self.scatters, **self.iterations, **self.aggregators}
+        )
+
+
 class ForEach(datatypes.StaticGraph[fr.schemas.ForEachRecipe, fr.schemas.ForEachData]):
     _recipe: fr.schemas.ForEachRecipe
 
@@ -43,15 +58,78 @@ class ForEach(datatypes.StaticGraph[fr.schemas.ForEachRecipe, fr.schemas.ForEach
         config: execution.RunConfig,
     ) -> execution.Run[execution.ResultType]:
         result = run.result
-        nodes = self._build_runtime_dag(run)
-        dag.evaluate_dag_by_layer(nodes, run, config)
+        stages = self._build_runtime_stages(run)
+        if config.for_each_job_array and self._arrays_body(result.recipe):
+            self._evaluate_as_job_array(stages, run, config)
+        else:
+            dag.evaluate_dag_by_layer(stages.node_map(self), run, config)
         dag.populate_outputs(result)
         return run
 
+    def _arrays_body(self, recipe: fr.schemas.ForEachRecipe) -> bool:
+        body = self.nodes[recipe.body_node.label]
+        return (
+            executorlib.accepts_arrays(body.executor)
+            and body.retry is None
+            and body.timeout is None
+            and body.resources is None
+        )
+
+    def _evaluate_as_job_array(
+        self,
+        stages: _RuntimeStages,
+        run: execution.Run[fr.schemas.ForEachData],
+        config: execution.RunConfig,
+    ) -> None:
+        """
+        Evaluate the scatters here, then every body iteration as one job array on the
+        body's executorlib executor, then the aggregators here.
+
+        Array task `i` is body iteration `i`, so its element of each iterated port is
+        the mixed-radix digit of `i` that the scatter edges already pick out.
+        """
+        body = self.nodes[run.result.recipe.body_node.label]
+
+        for label, node in stages.scatters.items():
+            dag.evaluate_node(node, label, run, config)
+
+        gathered = {
+            label: dag.gather_target_inputs(label, run.result)
+            for label in stages.iterations
+        }
+        # Like any other child, iterations missing input are skipped
+        input_data = {
+            label: data for label, data in gathered.items() if not dag.any_missing(data)
+        }
+        sub_runs = [dag.add_step(body, label, run, config) for label in input_data]
+        submitted = (
+            execution.submit_array(body, config, sub_runs, list(input_data.values()))
+            if len(input_data) > 0
+            else []
+        )
+        errors: list[Exception] = []
+        for sub_run, future in zip(sub_runs, submitted, strict=True):
+            try:
+                execution.collect_chained(body, config, sub_run, future)
+            except Exception as e:
+                errors.append(e)
+        if len(errors) == 1:
+            raise errors[0]
+        elif len(errors) > 1:
+            raise ExceptionGroup(f"{len(errors)} node(s) failed in job array", errors)
+
+        for label, node in stages.aggregators.items():
+            dag.evaluate_node(node, label, run, config)
+
     def _build_runtime_dag(
         self, run: execution.Run[fr.schemas.ForEachData]
     ) -> datatypes.NodeMap:
-        runtime_map: dict[fr.schemas.Label, datatypes.Node] = {}
+        return self._build_runtime_stages(run).node_map(self)
+
+    def _build_runtime_stages(
+        self, run: execution.Run[fr.schemas.ForEachData]
+    ) -> _RuntimeStages:
+        stages = _RuntimeStages({}, {}, {})
 
         result = run.result
         recipe = result.recipe
@@ -89,7 +167,7 @@ class ForEach(datatypes.StaticGraph[fr.schemas.ForEachRecipe, fr.schemas.ForEach
         for label, length in scattered_length_map.items():
             result_scatter_label = self._scatter_label(label)
             scatter_node = transformers.Transform1toN(length).node(result_scatter_label)
-            runtime_map[result_scatter_label] = scatter_node
+            stages.scatters[result_scatter_label] = scatter_node
             result.nodes[result_scatter_label] = (
                 scatter_node.generate_flowrep_live_node()
             )
@@ -97,14 +175,14 @@ class ForEach(datatypes.StaticGraph[fr.schemas.ForEachRecipe, fr.schemas.ForEach
         # Body nodes
         for i in range(total_steps):
             result_body_label = self._body_label(body_label, i)
-            runtime_map[result_body_label] = body_node
+            stages.iterations[result_body_label] = body_node
             result.nodes[result_body_label] = body_node.generate_flowrep_live_node()
 
         # Aggregator nodes
         for label in recipe.outputs:
             result_aggregator_label = self._aggregate_label(label)
             aggregator_node = transformers.TransformNto1(total_steps).node(label)
-            runtime_map[result_aggregator_label] = aggregator_node
+            stages.aggregators[result_aggregator_label] = aggregator_node
             result.nodes[result_aggregator_label] = (
                 aggregator_node.generate_flowrep_live_node()
             )
@@ -232,7 +310,7 @@ class ForEach(datatypes.StaticGraph[fr.schemas.ForEachRecipe, fr.schemas.ForEach
         }
         result.output_edges = output_edges
 
-        return datatypes.NodeMap(self, runtime_map)
+        return stages
 
     @staticmethod
     def _body_to_parent_label_map(
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import dataclasses
+from concurrent import futures
+
 import flowrep as fr
 
 from pyiron_workflow import constructors, dag, datatypes, execution
@@ -35,6 +38,9 @@ class If(datatypes.StaticGraph[fr.schemas.IfRecipe, fr.schemas.IfData]):
         run: execution.Run[execution.ResultType],
         config: execution.RunConfig,
     ) -> execution.Run[execution.ResultType]:
+        if config.if_speculative:
+            return self._evaluate_speculatively(run, config)
+
         recipe = self._recipe
         result = run.result
 
@@ -67,6 +73,96 @@ class If(datatypes.StaticGraph[fr.schemas.IfRecipe, fr.schemas.IfData]):
         dag.populate_outputs(result)
         return run
 
+    def _evaluate_speculatively(
+        self,
+        run: execution.Run[execution.ResultType],
+        config: execution.RunConfig,
+    ) -> execution.Run[execution.ResultType]:
+        """
+        Evaluate every case condition concurrently (and, with
+        `config.if_speculate_bodies`, every body too), then commit the first truthy
+        case in declared order.
+
+        The outcome is the same as the sequential evaluation: the same branch is
+        committed, and a condition failing ahead of the committed case raises.
+        As soon as the committed case is known, the rest of the work is cancelled --
+        each piece runs in a cancellation scope of its own -- and nobody waits for
+        it: a python function that is already running finishes in the background,
+        and its step is marked `speculative` in the run record. Exceptions from
+        discarded work are not raised.
+        """
+        recipe = self._recipe
+        result = run.result
+
+        bodies = [case.body for case in recipe.cases]
+        if recipe.else_case is not None:
+            bodies.append(recipe.else_case)
+
+        executor = futures.ThreadPoolExecutor(max_workers=config.dag_layers_max_threads)
+        submitted: dict[fr.schemas.Label, futures.Future] = {}
+        scopes: dict[fr.schemas.Label, execution.CancellationScope] = {}
+
+        def submit(labeled: fr.schemas.LabeledRecipe) -> None:
+            label = labeled.label
+            self._stage_node(label, result, labeled.recipe)
+            self._stage_node_input_edges(label, result, recipe)
+            scopes[label] = execution.CancellationScope(config._cancellation)
+            submitted[label] = executor.submit(
+                dag.evaluate_node,
+                self.nodes[label],
+                label,
+                run,
+                dataclasses.replace(config, _cancellation=scopes[label]),
+            )
+
+        def discard(keep: set[fr.schemas.Label]) -> None:
+            for label, future in submitted.items():
+                if label not in keep:
+                    scopes[label].cancel()
+                    future.cancel()
+
+        needed: set[fr.schemas.Label] = set()
+        try:
+            for case in recipe.cases:
+                submit(case.condition)
+            if config.if_speculate_bodies:
+                for body in bodies:
+                    submit(body)
+
+            committed = recipe.else_case
+            for case in recipe.cases:
+                needed.add(case.condition.label)
+                submitted[case.condition.label].result()
+                if self._condition_value(case, result):
+                    committed = case.body
+                    break
+            if committed is not None:
+                needed.add(committed.label)
+            discard(keep=needed)
+
+            if committed is not None:
+                self._stage_body_output_edges(committed.label, result, recipe)
+                if committed.label in submitted:
+                    submitted[committed.label].result()
+                else:
+                    self._stage_node(committed.label, result, committed.recipe)
+                    self._stage_node_input_edges(committed.label, result, recipe)
+                    dag.evaluate_node(
+                        self.nodes[committed.label], committed.label, run, config
+                    )
+        except BaseException:
+            discard(keep=set())
+            raise
+        finally:
+            # Don't wait on discarded work that is already running
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for step in run.steps:
+            if step.label not in needed:
+                step.speculative = True
+        dag.populate_outputs(result)
+        return run
+
     @staticmethod
     def _stage_node(
         node_label: fr.schemas.Label,
@@ -46,6 +46,8 @@ class Try(datatypes.StaticGraph[fr.schemas.TryRecipe, fr.schemas.TryData]):
 
         try:
             dag.evaluate_node(try_node, try_label, run, config)
+        except execution.RunCancelledError:
+            raise
         except BaseException as exc:
             for case in recipe.exception_cases:
                 exc_types = self._resolve_exception_types(case)
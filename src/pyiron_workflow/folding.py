@@ -0,0 +1,136 @@
+"""
+Constant folding: serving the parts of a graph that depend only on constants from a
+cache, instead of recomputing them on every run.
+
+A child is *constant* if it is a :class:`~pyiron_workflow.constant.Constant`, or an
+atomic node whose every input is either fed by another constant child or left to
+its default. Each constant child gets a key hashing its own recipe along with the
+keys of everything upstream of it, so editing a constant value (or swapping an
+upstream function) invalidates exactly the affected results.
+
+Folding assumes the atomic functions involved are deterministic, and folded
+outputs are shared between runs rather than copied -- downstream nodes must not
+mutate them in place. It is therefore opt-in, via
+:attr:`pyiron_workflow.execution.RunConfig.constant_cache`.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import pickle
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import flowrep as fr
+
+from pyiron_workflow import history
+
+
+class ConstantCache:
+    """
+    A thread-safe, in-memory store of the outputs of constant children, keyed by
+    :func:`constant_keys`, and discarding the least recently used entries beyond
+    `maxsize` (`None` for no limit).
+
+    Pickling (e.g. along with a run configuration sent to an executor) yields a
+    fresh, empty cache: the receiving process has its own.
+    """
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        self.maxsize = maxsize
+        self._outputs: collections.OrderedDict[str, dict[str, Any]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            outputs = self._outputs.get(key)
+            if outputs is not None:
+                self._outputs.move_to_end(key)
+            return outputs
+
+    def put(self, key: str, outputs: dict[str, Any]) -> None:
+        with self._lock:
+            self._outputs[key] = outputs
+            self._outputs.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._outputs) > self.maxsize:
+                    self._outputs.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._outputs.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._outputs)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._outputs
+
+    def __reduce__(self):
+        return self.__class__, (self.maxsize,)
+
+
+def constant_keys(data: fr.schemas.CompositeData) -> dict[fr.schemas.Label, str]:
+    """
+    Cache keys for every constant child of a graph (see the module docstring);
+    children missing from the returned map depend on something other than
+    constants.
+    """
+    fed_by_graph = {target.node for target in data.input_edges}
+    keys: dict[fr.schemas.Label, str | None] = {}
+
+    def key_of(label: fr.schemas.Label) -> str | None:
+        if label in keys:
+            return keys[label]
+        child = data.nodes[label]
+        keys[label] = None  # Graphs are acyclic; this is just a placeholder
+        if isinstance(child.recipe, fr.schemas.ConstantRecipe):
+            keys[label] = history.recipe_key(child.recipe)
+        elif (
+            isinstance(child.recipe, fr.schemas.AtomicRecipe)
+            and label not in fed_by_graph
+        ):
+            keys[label] = _atomic_key(label, child, data, key_of)
+        return keys[label]
+
+    for label in data.nodes:
+        key_of(label)
+    return {label: key for label, key in keys.items() if key is not None}
+
+
+def _atomic_key(
+    label: fr.schemas.Label,
+    child: fr.schemas.AtomicData,
+    data: fr.schemas.CompositeData,
+    key_of: Callable[[fr.schemas.Label], str | None],
+) -> str | None:
+    digest = hashlib.sha256(history.recipe_key(child.recipe).encode())
+    for port in child.recipe.inputs:
+        source = data.edges.get(fr.schemas.TargetHandle(node=label, port=port))
+        if source is None:
+            default = _default_digest(child.input_ports[port].default)
+            if default is None:
+                return None
+            digest.update(f"|{port}={default}".encode())
+            continue
+        upstream = key_of(source.node)
+        if upstream is None:
+            return None
+        digest.update(f"|{port}<-{upstream}.{source.port}".encode())
+    return digest.hexdigest()
+
+
+def _default_digest(default: Any) -> str | None:
+    """A digest of a default value, or `None` if it is missing or can't be pickled."""
+    if default is fr.schemas.NOT_DATA:
+        return None
+    try:
+        return hashlib.sha256(pickle.dumps(default)).hexdigest()
+    except Exception:
+        return None
@@ -0,0 +1,65 @@
+"""
+Chain fusion: evaluating straight-line runs of atomic children as a single task.
+
+A *chain* is a sequence of atomic children in which each member feeds only the
+next, and each next member depends on no sibling but the previous one (graph
+inputs and defaults are fine). Fusing it evaluates the whole chain as one task,
+scheduled as a single child in place of its head, which calls the members'
+functions one after the other on the graph's live data. That spares each member the
+per-child overhead -- a :class:`~pyiron_workflow.execution.Run` step, a live node,
+a thread-pool submission, a progress event on starting, and a duration record --
+which can outweigh the work of trivial functions.
+
+The members' inputs and outputs are still on the graph's live data
+(`run.result.nodes`), their completion is still reported as progress, and a failing
+member still gets a step of its own; the fused chains are listed in
+:attr:`pyiron_workflow.execution.Run.fused`. Fusion is opt-in, via
+:attr:`pyiron_workflow.execution.RunConfig.dag_fuse_chains`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import flowrep as fr
+
+
+def linear_chains(
+    data: fr.schemas.CompositeData, among: Iterable[fr.schemas.Label]
+) -> list[list[fr.schemas.Label]]:
+    """
+    Maximal chains (of at least two members) of the atomic children in `among`,
+    each in evaluation order.
+    """
+    among = {
+        label
+        for label in among
+        if isinstance(data.nodes[label].recipe, fr.schemas.AtomicRecipe)
+    }
+    predecessors: dict[fr.schemas.Label, set[fr.schemas.Label]] = {}
+    successors: dict[fr.schemas.Label, set[fr.schemas.Label]] = {}
+    for target, source in data.edges.items():
+        predecessors.setdefault(target.node, set()).add(source.node)
+        successors.setdefault(source.node, set()).add(target.node)
+    graph_outputs = {
+        source.node
+        for source in data.output_edges.values()
+        if isinstance(source, fr.schemas.SourceHandle)
+    }
+
+    following: dict[fr.schemas.Label, fr.schemas.Label] = {}
+    for label in among:
+        consumers = successors.get(label, set())
+        if len(consumers) != 1 or label in graph_outputs:
+            continue
+        (consumer,) = consumers
+        if consumer in among and predecessors[consumer] == {label}:
+            following[label] = consumer
+
+    chains = []
+    for head in sorted(set(following).difference(following.values())):
+        chain = [head]
+        while chain[-1] in following:
+            chain.append(following[chain[-1]])
+        chains.append(chain)
+    return chains
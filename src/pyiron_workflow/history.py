@@ -0,0 +1,176 @@
+"""
+A persistent record of how long nodes took, so that later runs can plan with it.
+
+Durations are keyed by a hash of the node's recipe (along with a rough measure of
+the input size), and appended as JSON lines to a single file in a directory of your
+choosing -- so several processes (e.g. executor workers on a shared filesystem) can
+contribute to, and share, the same history.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import statistics
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import flowrep as fr
+
+from pyiron_workflow import lexical
+
+
+def recipe_key(recipe: fr.schemas.NodeRecipe) -> str:
+    """A stable identifier for everything that makes up a node's recipe."""
+    return hashlib.sha256(recipe.model_dump_json().encode()).hexdigest()
+
+
+def input_size(values: Iterable[Any]) -> float:
+    """
+    A rough, recipe-specific measure of how much input there is: the byte count of
+    array-likes, the length of other sized objects, and one for anything else.
+    """
+    size = 0.0
+    for value in values:
+        nbytes = getattr(value, "nbytes", None)
+        if isinstance(nbytes, int):
+            size += nbytes
+            continue
+        try:
+            size += len(value)
+        except TypeError:
+            size += 1
+    return size
+
+
+class DurationHistory:
+    """
+    Append-only store of successful evaluation durations, in seconds, per recipe.
+
+    Durations may be recorded with an :func:`input_size`, in which case estimates
+    for a given size come from a least-squares line through the recorded sizes,
+    wherever there are at least two distinct ones. The file is read once, lazily;
+    records written by other processes after that are picked up by :meth:`reload`.
+    """
+
+    filename = "durations.jsonl"
+
+    def __init__(self, directory: str | pathlib.Path) -> None:
+        self.directory = pathlib.Path(directory)
+        self._lock = threading.Lock()
+        self._records: dict[str, list[tuple[float, float | None]]] | None = None
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self.directory / self.filename
+
+    def record(self, key: str, seconds: float, size: float | None = None) -> None:
+        line = json.dumps({"key": key, "seconds": seconds, "size": size}) + "\n"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as f:
+                f.write(line)
+            if self._records is not None:
+                self._records.setdefault(key, []).append((seconds, size))
+
+    def durations(self, key: str) -> list[float]:
+        return [seconds for seconds, _ in self._records_for(key)]
+
+    def estimate(self, key: str, size: float | None = None) -> float | None:
+        """
+        The expected duration for `key` (at `size`, if given and a size trend is
+        known), or `None` if we have never seen the key.
+        """
+        records = self._records_for(key)
+        if not records:
+            return None
+        if size is not None:
+            sized = [(s, x) for s, x in records if x is not None]
+            if len({x for _, x in sized}) > 1:
+                slope, intercept = statistics.linear_regression(
+                    [x for _, x in sized], [s for s, _ in sized]
+                )
+                return max(intercept + slope * size, 0.0)
+        return statistics.median(seconds for seconds, _ in records)
+
+    def reload(self) -> None:
+        with self._lock:
+            self._records = None
+
+    def _records_for(self, key: str) -> list[tuple[float, float | None]]:
+        with self._lock:
+            if self._records is None:
+                self._records = self._read()
+            return list(self._records.get(key, []))
+
+    def _read(self) -> dict[str, list[tuple[float, float | None]]]:
+        records: dict[str, list[tuple[float, float | None]]] = {}
+        if not self.path.exists():
+            return records
+        with self.path.open() as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A concurrent writer's partial line
+                records.setdefault(entry["key"], []).append(
+                    (entry["seconds"], entry.get("size"))
+                )
+        return records
+
+    def __reduce__(self):
+        return self.__class__, (self.directory,)
+
+
+class EtaTracker:
+    """
+    Live estimate of the time left in a run, from the critical-path ranks of the
+    prime mover's children (see :func:`pyiron_workflow.dag.estimate_runtime`).
+
+    The estimate is the longest remaining path among unfinished children, with
+    running children credited for the time they have already spent (up to their
+    expected duration).
+    """
+
+    def __init__(
+        self,
+        ranks: Mapping[lexical.LexicalPath, float],
+        durations: Mapping[lexical.LexicalPath, float],
+    ) -> None:
+        self.ranks = dict(ranks)
+        self.durations = dict(durations)
+        self._started: dict[str, Any] = {}
+        self._done: set[str] = set()
+        self._lock = threading.Lock()
+
+    def update(self, lexical_path: str, status: str, time: Any) -> float:
+        """Note a status change and return the estimated seconds remaining."""
+        with self._lock:
+            if lexical_path in self.ranks:
+                if status == "running":
+                    self._started[lexical_path] = time
+                elif status != "pending":
+                    self._done.add(lexical_path)
+            remaining = 0.0
+            for path, rank in self.ranks.items():
+                if path in self._done:
+                    continue
+                started = self._started.get(path)
+                spent = 0.0 if started is None else (time - started).total_seconds()
+                remaining = max(remaining, rank - min(spent, self.durations[path]))
+            return remaining
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "ranks": self.ranks,
+                "durations": self.durations,
+                "_started": dict(self._started),
+                "_done": set(self._done),
+            }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -11,16 +11,25 @@ Not _all_ operations are injectable. Notably absent are comparators (e.g. `==`),
 are reserved for use by the actual port/node objects themselves (e.g. to investigate
 membership in collections), and reflexive operations (e.g. `*=`), which don't make
 sense in a graph paradigm (E.g., `wf.some_node.inputs.foo *= wf.inputs.bar`?!).
+
+By default each operation gets its own node, so `(a + b) * c - d` nests several
+graphs. Inside :func:`fused_expressions`, each injected graph whose nodes are all
+operations and literals is instead collapsed into a single atomic node evaluating
+the whole operator tree at once -- elementwise over whole arrays, for NumPy operands
+-- behind the same graph inputs and output.
 """
 
 from __future__ import annotations
 
 import abc
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Protocol
+import contextlib
+import contextvars
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Protocol
 
 import flowrep as fr
 from flowrep.parsers import label_helpers
+from pyiron_snippets import versions
 
 from pyiron_workflow import lexical
 
@@ -438,4 +447,191 @@ def _build_injection_graph(
         **dict(zip(operation_node.inputs, negotiated_source_ports, strict=False))
     )
 
-    return graph
+    return _fuse_expression(graph) if _FUSE_EXPRESSIONS.get() else graph
+
+
+_FUSE_EXPRESSIONS: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "fuse_expressions", default=False
+)
+
+_OPERATIONS = frozenset(
+    {
+        "abs",
+        "add",
+        "and_",
+        "floordiv",
+        "getitem",
+        "invert",
+        "lshift",
+        "matmul",
+        "mod",
+        "mul",
+        "neg",
+        "or_",
+        "pos",
+        "pow",
+        "rshift",
+        "sub",
+        "truediv",
+        "xor",
+    }
+)
+
+EXPRESSION_INPUT = "expression"
+
+
+@contextlib.contextmanager
+def fused_expressions(enabled: bool = True) -> Iterator[None]:
+    """Fuse (or, with `enabled=False`, don't fuse) injected operator trees."""
+    token = _FUSE_EXPRESSIONS.set(enabled)
+    try:
+        yield
+    finally:
+        _FUSE_EXPRESSIONS.reset(token)
+
+
+def evaluate_expression(expression, /, *operands):
+    """
+    Evaluate an operator tree: `["operand", i]` is the `i`-th operand, `["value",
+    v]` the literal `v`, and `["call", name, [args...]]` applies the
+    :mod:`flowrep.std` operation `name` to the evaluated arguments.
+    """
+    kind = expression[0]
+    if kind == "operand":
+        return operands[expression[1]]
+    if kind == "value":
+        return expression[1]
+    return getattr(fr.std, expression[1])(
+        *(evaluate_expression(arg, *operands) for arg in expression[2])
+    )
+
+
+def operand_label(i: int) -> fr.schemas.Label:
+    return f"operand_{i}"
+
+
+def expression_recipe(
+    n_operands: int, output_label: fr.schemas.Label
+) -> fr.schemas.AtomicRecipe:
+    inputs = [EXPRESSION_INPUT, *(operand_label(i) for i in range(n_operands))]
+    return fr.schemas.AtomicRecipe(
+        reference=fr.schemas.PythonReference(
+            info=versions.VersionInfo.of(evaluate_expression),
+            restricted_input_kinds=dict.fromkeys(
+                inputs, fr.schemas.RestrictedParamKind.POSITIONAL_ONLY
+            ),
+        ),
+        inputs=inputs,
+        outputs=[output_label],
+    )
+
+
+class _NotAnExpressionError(Exception):
+    """Raised internally when a graph holds more than operations and literals."""
+
+
+def _fuse_expression(graph: workflow_node.Workflow) -> workflow_node.Workflow:
+    """
+    An equivalent graph with a single :func:`evaluate_expression` node, or the graph
+    itself if it holds anything but operations and literals.
+    """
+    from pyiron_workflow.atomic_node import Atomic  # noqa: PLC0415
+    from pyiron_workflow.workflow_node import Workflow  # noqa: PLC0415
+
+    recipe = graph.recipe
+    ((output_target, output_source),) = recipe.output_edges.items()
+    if not isinstance(output_source, fr.schemas.SourceHandle):  # pragma: no cover
+        return graph  # Nothing to fuse in a pass-through
+    operands = list(recipe.inputs)
+    try:
+        tree = _source_tree(((recipe, None),), output_source, operands)
+    except _NotAnExpressionError:
+        return graph
+
+    fused = Workflow(graph.label)
+    for label in operands:
+        port = graph.inputs[label]
+        fused.create_input(
+            label, type_hint=port.type_hint, type_metadata=port.type_metadata
+        )
+    output = graph.outputs[output_target.port]
+    fused.create_output(
+        output_target.port,
+        type_hint=output.type_hint,
+        type_metadata=output.type_metadata,
+    )
+    operation_node = Atomic(
+        expression_recipe(len(operands), output_target.port), output_source.node
+    )
+    operation_node(**{EXPRESSION_INPUT: tree})
+    fused.add_node(operation_node)
+    for i, label in enumerate(operands):
+        fused.connect(fused.inputs[label], operation_node.inputs[operand_label(i)])
+    fused.connect(
+        operation_node.outputs[output_target.port], fused.outputs[output_target.port]
+    )
+    fused._connect_input(**graph._detach_pending_connections())
+    return fused
+
+
+_Scopes = tuple[tuple[fr.schemas.WorkflowRecipe, fr.schemas.Label | None], ...]
+
+
+def _source_tree(
+    scopes: _Scopes,
+    source: fr.schemas.SourceHandle | fr.schemas.InputSource,
+    operands: Sequence[fr.schemas.Label],
+) -> list[Any]:
+    recipe, label_in_parent = scopes[-1]
+    if isinstance(source, fr.schemas.InputSource):
+        if label_in_parent is None:
+            return ["operand", operands.index(source.port)]
+        return _target_tree(
+            scopes[:-1],
+            fr.schemas.TargetHandle(node=label_in_parent, port=source.port),
+            operands,
+        )
+    child = recipe.nodes[source.node]
+    if isinstance(child, fr.schemas.ConstantRecipe):
+        return ["value", child.constant]
+    if isinstance(child, fr.schemas.WorkflowRecipe):
+        inner = next(s for t, s in child.output_edges.items() if t.port == source.port)
+        return _source_tree((*scopes, (child, source.node)), inner, operands)
+    if not isinstance(child, fr.schemas.AtomicRecipe):
+        raise _NotAnExpressionError(source.node)
+    args = [
+        _target_tree(
+            scopes, fr.schemas.TargetHandle(node=source.node, port=p), operands
+        )
+        for p in child.inputs
+    ]
+    info = child.reference.info
+    if info.module == fr.std.__name__ and info.qualname in _OPERATIONS:
+        return ["call", info.qualname, args]
+    if (info.module, info.qualname) == (__name__, evaluate_expression.__qualname__):
+        (kind, inner_tree), *inner_operands = args
+        if kind != "value":
+            raise _NotAnExpressionError(source.node)
+        return _substitute(inner_tree, inner_operands)
+    raise _NotAnExpressionError(source.node)
+
+
+def _target_tree(
+    scopes: _Scopes,
+    target: fr.schemas.TargetHandle,
+    operands: Sequence[fr.schemas.Label],
+) -> list[Any]:
+    recipe = scopes[-1][0]
+    if target in recipe.input_edges:
+        return _source_tree(scopes, recipe.input_edges[target], operands)
+    if target in recipe.edges:
+        return _source_tree(scopes, recipe.edges[target], operands)
+    raise _NotAnExpressionError(target.node)  # Left to a default
+
+
+def _substitute(tree: list[Any], operands: Sequence[list[Any]]) -> list[Any]:
+    if tree[0] == "operand":
+        return operands[tree[1]]
+    if tree[0] == "call":
+        return ["call", tree[1], [_substitute(arg, operands) for arg in tree[2]]]
+    return tree
@@ -0,0 +1,90 @@
+"""
+Common-subexpression elimination: evaluating structurally identical children of a
+graph only once.
+
+Two children are identical when they have the same recipe (for atomic nodes, that
+includes the fully qualified name of the function) and every input comes from the
+same place -- the same graph input, the same output of the same (or an identical)
+sibling, or the child's own default -- and they are evaluated the same way (the
+same executor, retry policy, timeout and resources). One of each group of identical children is
+evaluated, and the rest become *aliases* of it, getting copies of its results.
+
+Merging assumes the atomic functions involved are pure, and aliased outputs are
+shared rather than copied -- downstream nodes must not mutate them in place. It is
+therefore opt-in, via
+:attr:`pyiron_workflow.execution.RunConfig.dag_merge_duplicates`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+import flowrep as fr
+
+from pyiron_workflow import history
+
+
+def duplicate_aliases(
+    data: fr.schemas.CompositeData,
+    among: Iterable[fr.schemas.Label],
+    settings: Mapping[fr.schemas.Label, Any] | None = None,
+) -> dict[fr.schemas.Label, fr.schemas.Label]:
+    """
+    Map each duplicate child to the child it duplicates, considering only atomic
+    and constant children in `among`, and never merging children whose `settings`
+    (how they are to be evaluated) differ. The alphabetically-first member of each
+    group of duplicates is the one left to evaluate.
+    """
+    among = set(among)
+    settings = {} if settings is None else settings
+    distinct_settings: list[Any] = []
+    signatures: dict[fr.schemas.Label, str] = {}
+
+    def settings_of(label: fr.schemas.Label) -> int:
+        own = settings.get(label)
+        for i, other in enumerate(distinct_settings):
+            if other == own:
+                return i
+        distinct_settings.append(own)
+        return len(distinct_settings) - 1
+
+    def signature_of(label: fr.schemas.Label) -> str:
+        if label not in signatures:
+            signatures[label] = _signature(
+                label, data, among, signature_of, settings_of
+            )
+        return signatures[label]
+
+    groups: dict[str, list[fr.schemas.Label]] = {}
+    for label in sorted(among):
+        groups.setdefault(signature_of(label), []).append(label)
+    return {alias: group[0] for group in groups.values() for alias in group[1:]}
+
+
+def _signature(
+    label: fr.schemas.Label,
+    data: fr.schemas.CompositeData,
+    among: set[fr.schemas.Label],
+    signature_of: Callable[[fr.schemas.Label], str],
+    settings_of: Callable[[fr.schemas.Label], int],
+) -> str:
+    recipe = data.nodes[label].recipe
+    if label not in among or not isinstance(
+        recipe, fr.schemas.AtomicRecipe | fr.schemas.ConstantRecipe
+    ):
+        return f"unique:{label}"
+    digest = hashlib.sha256(history.recipe_key(recipe).encode())
+    digest.update(f"|settings={settings_of(label)}".encode())
+    for port in recipe.inputs:
+        target = fr.schemas.TargetHandle(node=label, port=port)
+        if target in data.input_edges:
+            digest.update(f"|{port}<-input.{data.input_edges[target].port}".encode())
+        elif target in data.edges:
+            source = data.edges[target]
+            upstream = signature_of(source.node)
+            digest.update(f"|{port}<-{upstream}.{source.port}".encode())
+        else:
+            digest.update(f"|{port}=default".encode())
+    return digest.hexdigest()
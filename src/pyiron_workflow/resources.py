@@ -0,0 +1,134 @@
+"""
+Resource requirements for nodes, and the budget a run packs them against.
+
+Every node that does actual work (atomic nodes, and any node shipped off to an
+executor as a whole) claims its :class:`Resources` from the run's
+:class:`ResourcePool` for the duration of each evaluation attempt, and blocks until
+enough of the budget is free. Composite nodes evaluated in-process claim nothing --
+their children do.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+
+
+class InsufficientResourcesError(ValueError):
+    """
+    Raised when a node asks for more than the whole budget, and so could never run.
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class Resources:
+    """
+    An amount of compute: cores, memory (in GB), and any custom, countable resources
+    (e.g. `{"gpus": 2}` or `{"licenses": 1}`).
+
+    As a node requirement, unlisted custom resources are not needed; as a budget,
+    they are not available.
+    """
+
+    cores: int = 1
+    memory: float = 0.0
+    custom: Mapping[str, float] = dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if (
+            self.cores < 0
+            or self.memory < 0
+            or any(v < 0 for v in self.custom.values())
+        ):
+            raise ValueError(f"Resources must be non-negative, got {self}")
+
+    def fits_within(self, available: Resources) -> bool:
+        return (
+            self.cores <= available.cores
+            and self.memory <= available.memory
+            and all(
+                amount <= available.custom.get(name, 0)
+                for name, amount in self.custom.items()
+            )
+        )
+
+    def __add__(self, other: Resources) -> Resources:
+        return self._combine(other, 1)
+
+    def __sub__(self, other: Resources) -> Resources:
+        return self._combine(other, -1)
+
+    def _combine(self, other: Resources, sign: int) -> Resources:
+        custom = dict(self.custom)
+        for name, amount in other.custom.items():
+            custom[name] = custom.get(name, 0) + sign * amount
+        return Resources(
+            cores=self.cores + sign * other.cores,
+            memory=self.memory + sign * other.memory,
+            custom=custom,
+        )
+
+
+DEFAULT_REQUIREMENT = Resources()
+
+
+class ResourcePool:
+    """
+    A thread-safe budget of :class:`Resources` that concurrent evaluations claim
+    from and return to.
+
+    Claims are granted as soon as they fit, so small nodes fill capacity left idle
+    by big ones. Pickling (e.g. along with a run configuration sent to an executor)
+    yields a fresh pool with the full budget: the receiving process has its own.
+    """
+
+    def __init__(self, budget: Resources) -> None:
+        self.budget = budget
+        self._available = budget
+        self._condition = threading.Condition()
+
+    @property
+    def available(self) -> Resources:
+        with self._condition:
+            return self._available
+
+    @contextmanager
+    def claim(
+        self,
+        requirement: Resources,
+        should_abandon: Callable[[], bool] = lambda: False,
+        poll_interval: float = 0.05,
+    ) -> Iterator[bool]:
+        """
+        Hold `requirement` for the duration of the context.
+
+        Yields `True` once the claim is granted, or `False` (holding nothing) if
+        `should_abandon` became true while waiting.
+        """
+        if not requirement.fits_within(self.budget):
+            raise InsufficientResourcesError(
+                f"Requirement {requirement} exceeds the entire budget {self.budget}"
+            )
+        granted = False
+        with self._condition:
+            while not requirement.fits_within(self._available):
+                if should_abandon():
+                    break
+                self._condition.wait(poll_interval)
+            else:
+                self._available -= requirement
+                granted = True
+        if not granted:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            with self._condition:
+                self._available += requirement
+                self._condition.notify_all()
+
+    def __reduce__(self):
+        return self.__class__, (self.budget,)
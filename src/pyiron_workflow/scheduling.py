@@ -0,0 +1,145 @@
+"""
+Scheduling the work of many concurrent runs in one process, e.g. a service handling
+the runs of many users at once.
+
+Runs whose configurations share a :class:`RunScheduler` each become one of its
+:class:`Tenant`s, and every node of theirs that does actual work (atomic nodes, and
+any node shipped off to an executor as a whole -- just as for resource claims, see
+:mod:`pyiron_workflow.resources`) first takes one of the scheduler's worker slots,
+and holds it for the duration of each evaluation attempt.
+
+Free slots go to the waiting tenant with the highest priority, then to the one
+holding the fewest slots for its share, then first come first served -- so a big run
+can't crowd out the others, and no tenant holds more than its quota.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import NamedTuple
+
+
+class Tenant:
+    """
+    One run's account with a scheduler: its `priority` (higher goes first), its
+    `share` of slots relative to tenants of the same priority, and its `quota` of
+    slots held at once (`None` for no limit beyond the scheduler's).
+
+    Pickling yields a fresh account, holding nothing.
+    """
+
+    def __init__(
+        self, priority: int = 0, share: float = 1.0, quota: int | None = None
+    ) -> None:
+        if share <= 0:
+            raise ValueError(f"A tenant's share must be positive, got {share}")
+        if quota is not None and quota < 1:
+            raise ValueError(f"A tenant's quota must be at least one, got {quota}")
+        self.priority = priority
+        self.share = share
+        self.quota = quota
+        self.running = 0
+
+    def __reduce__(self):
+        return self.__class__, (self.priority, self.share, self.quota)
+
+
+class _Request(NamedTuple):
+    tenant: Tenant
+    order: int
+
+
+class RunScheduler:
+    """
+    A thread-safe gate of `max_workers` slots, shared by the runs of a process.
+
+    Pickling (e.g. along with a run configuration sent to an executor) yields a fresh
+    scheduler with the same limit: the receiving process has its own.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError(
+                f"A scheduler needs at least one worker slot, got {max_workers}"
+            )
+        self.max_workers = max_workers
+        self._running = 0
+        self._waiting: list[_Request] = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+
+    @property
+    def running(self) -> int:
+        with self._condition:
+            return self._running
+
+    @property
+    def waiting(self) -> int:
+        with self._condition:
+            return len(self._waiting)
+
+    @contextmanager
+    def slot(
+        self,
+        tenant: Tenant,
+        should_abandon: Callable[[], bool] = lambda: False,
+        poll_interval: float = 0.05,
+    ) -> Iterator[bool]:
+        """
+        Hold one of the slots for `tenant` for the duration of the context.
+
+        Yields `True` once the slot is granted, or `False` (holding nothing) if
+        `should_abandon` became true while waiting.
+        """
+        granted = False
+        with self._condition:
+            request = _Request(tenant, next(self._order))
+            self._waiting.append(request)
+            try:
+                while not self._grantable(request):
+                    if should_abandon():
+                        break
+                    self._condition.wait(poll_interval)
+                else:
+                    self._running += 1
+                    tenant.running += 1
+                    granted = True
+            finally:
+                self._waiting.remove(request)
+                # Whoever is next in line may have been waiting behind us
+                self._condition.notify_all()
+        if not granted:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            with self._condition:
+                self._running -= 1
+                tenant.running -= 1
+                self._condition.notify_all()
+
+    def _grantable(self, request: _Request) -> bool:
+        if self._running >= self.max_workers or not _under_quota(request.tenant):
+            return False
+        return request == min(
+            (r for r in self._waiting if _under_quota(r.tenant)), key=_precedence
+        )
+
+    def __reduce__(self):
+        return self.__class__, (self.max_workers,)
+
+
+def _under_quota(tenant: Tenant) -> bool:
+    return tenant.quota is None or tenant.running < tenant.quota
+
+
+def _precedence(request: _Request) -> tuple[int, float, int]:
+    return (
+        -request.tenant.priority,
+        request.tenant.running / request.tenant.share,
+        request.order,
+    )
@@ -0,0 +1,174 @@
+"""
+Single-flight evaluation: when the same atomic recipe is evaluated with equal inputs
+several times at once (e.g. by concurrent runs, or by the iterations of a for-loop),
+only the first caller computes, and the others wait for and share its outputs.
+
+Flights are keyed by :func:`flight_key`. Within a process, callers coordinate
+through a :class:`SingleFlight`; given a `directory` on storage they share, processes
+(and hosts) coordinate too, the computing process holding a lock file there and
+leaving its pickled outputs behind for the processes waiting on it (the last of
+which to read them removes them). Only callers who arrive while a flight is underway
+share it -- this is not a cache, and a caller arriving afterwards computes afresh.
+
+Like constant folding (:mod:`pyiron_workflow.folding`), sharing assumes the atomic
+functions involved are deterministic, and the shared outputs are not copied in
+process -- nodes must not mutate them in place. It is therefore opt-in, via
+:attr:`pyiron_workflow.execution.RunConfig.single_flight`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import pathlib
+import pickle
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import flowrep as fr
+
+from pyiron_workflow import filelocks, history
+
+
+def flight_key(recipe: fr.schemas.NodeRecipe, input_data: dict[str, Any]) -> str | None:
+    """
+    A key hashing `recipe` along with the pickled `input_data`, or `None` if the data
+    can't be pickled.
+    """
+    try:
+        payload = pickle.dumps(sorted(input_data.items()), protocol=5)
+    except Exception:
+        return None
+    digest = hashlib.sha256(history.recipe_key(recipe).encode())
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.outputs: dict[str, Any] | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent computations under the same key, within this process, and
+    -- given a shared `directory` -- across processes. Waiting callers look for the
+    outcome every `poll_interval` seconds. :attr:`shared` counts the computations
+    this instance was spared.
+
+    If the computing caller fails, the waiting callers don't share its failure, but
+    compute for themselves (again one at a time).
+
+    Pickling (e.g. along with a run configuration sent to an executor) yields a
+    fresh instance on the same `directory`: the receiving process keeps its own
+    flights, but still coordinates with ours through the directory.
+    """
+
+    def __init__(
+        self, directory: str | pathlib.Path | None = None, poll_interval: float = 0.05
+    ) -> None:
+        self.directory = None if directory is None else pathlib.Path(directory)
+        self.poll_interval = poll_interval
+        self.shared = 0
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def share(
+        self,
+        key: str,
+        compute: Callable[[], dict[str, Any]],
+        check: Callable[[], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        The outputs of `compute`, or of a concurrent computation under the same `key`.
+        While waiting, `check` is called every poll interval, e.g. to raise once the
+        caller is cancelled.
+        """
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                if flight is None:
+                    flight = self._flights[key] = _Flight()
+                    break
+            while not flight.done.wait(self.poll_interval):
+                if check is not None:
+                    check()
+            if flight.outputs is not None:
+                self._count_shared()
+                return flight.outputs
+            # The computation failed, try our own
+
+        try:
+            flight.outputs = (
+                compute()
+                if self.directory is None
+                else self._share_across_processes(self.directory, key, compute, check)
+            )
+            return flight.outputs
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _share_across_processes(
+        self,
+        directory: pathlib.Path,
+        key: str,
+        compute: Callable[[], dict[str, Any]],
+        check: Callable[[], None] | None,
+    ) -> dict[str, Any]:
+        directory.mkdir(parents=True, exist_ok=True)
+        lock_file = directory / f"{key}.lock"
+        outputs_file = directory / f"{key}.outputs"
+        while True:
+            if filelocks.claim(lock_file):
+                try:
+                    # Whatever is left over is from an earlier flight
+                    filelocks.remove(outputs_file)
+                    outputs = compute()
+                    with contextlib.suppress(Exception):  # E.g. unpicklable outputs
+                        filelocks.write_atomically(outputs_file, outputs)
+                    return outputs
+                finally:
+                    filelocks.remove(lock_file)
+                    _discard_unless_awaited(directory, key)
+
+            waiting_file = directory / f"{key}.{uuid.uuid4().hex}.waiting"
+            waiting_file.touch()
+            try:
+                while lock_file.exists():
+                    if check is not None:
+                        check()
+                    if filelocks.abandoned(lock_file):
+                        filelocks.remove(lock_file)
+                    time.sleep(self.poll_interval)
+                try:
+                    with open(outputs_file, "rb") as f:
+                        outputs = pickle.load(f)
+                except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+                    continue  # The computation failed, try our own
+            finally:
+                filelocks.remove(waiting_file)
+                _discard_unless_awaited(directory, key)
+            self._count_shared()
+            return outputs
+
+    def _count_shared(self) -> None:
+        with self._lock:
+            self.shared += 1
+
+    def __reduce__(self):
+        return self.__class__, (self.directory, self.poll_interval)
+
+
+def _discard_unless_awaited(directory: pathlib.Path, key: str) -> None:
+    """
+    Remove the outputs of the flight under `key`, unless processes are still waiting
+    to read them.
+    """
+    if not any(directory.glob(f"{key}.*.waiting")):
+        filelocks.remove(directory / f"{key}.outputs")
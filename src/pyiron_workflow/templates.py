@@ -0,0 +1,109 @@
+"""
+Worker-resident templates of atomic live data, so that repeatedly evaluating the same
+recipe out of process (e.g. the body of a for-loop) only imports its function and
+parses its ports once per worker, and the recipe itself needn't be sent every time
+(see :attr:`pyiron_workflow.execution.RunConfig.slim_recipe_cache`).
+
+Templates are keyed by :func:`pyiron_workflow.history.recipe_key`, and each process
+has its own :func:`resident` cache -- so an executor's workers each fill theirs on the
+first submission of a recipe that reaches them.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import threading
+
+import flowrep as fr
+
+
+class TemplateMissError(KeyError):
+    """Raised by a worker asked for a template it doesn't hold."""
+
+
+class TemplateCache:
+    """
+    A thread-safe, in-memory store of atomic live data parsed from recipes, keyed by
+    recipe key, and discarding the least recently used entries beyond `maxsize`
+    (`None` for no limit). Templates are never handed out themselves, only fresh
+    copies with empty ports.
+    """
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        self.maxsize = maxsize
+        self._templates: collections.OrderedDict[str, fr.schemas.AtomicData] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def instantiate(
+        self, key: str, recipe: fr.schemas.AtomicRecipe | None = None
+    ) -> fr.schemas.AtomicData:
+        """
+        Fresh live data for the recipe under `key`, parsing and storing `recipe` if we
+        don't hold it yet.
+
+        Raises:
+            TemplateMissError: If we don't hold `key` and no `recipe` is given.
+        """
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+        if template is None:
+            if recipe is None:
+                raise TemplateMissError(key)
+            template = fr.schemas.AtomicData.from_recipe(recipe)
+            self.put(key, template)
+        return _fresh(template)
+
+    def put(self, key: str, template: fr.schemas.AtomicData) -> None:
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._templates) > self.maxsize:
+                    self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._templates)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._templates
+
+    def __reduce__(self):
+        return self.__class__, (self.maxsize,)
+
+
+def _fresh(template: fr.schemas.AtomicData) -> fr.schemas.AtomicData:
+    return dataclasses.replace(
+        template,
+        input_ports={
+            name: dataclasses.replace(port, value=fr.schemas.NOT_DATA)
+            for name, port in template.input_ports.items()
+        },
+        output_ports={
+            name: dataclasses.replace(port, value=fr.schemas.NOT_DATA)
+            for name, port in template.output_ports.items()
+        },
+    )
+
+
+_resident: TemplateCache | None = None
+_resident_lock = threading.Lock()
+
+
+def resident() -> TemplateCache:
+    """This process' template cache, created on first use."""
+    global _resident  # noqa: PLW0603 -- deliberate per-process cache singleton
+    with _resident_lock:
+        if _resident is None:
+            _resident = TemplateCache()
+        return _resident
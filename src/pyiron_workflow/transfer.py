@@ -0,0 +1,170 @@
+"""
+Out-of-band transfer of large buffers (e.g. NumPy arrays) through shared memory, for
+slim evaluations on executors on the same host (see
+:attr:`pyiron_workflow.execution.RunConfig.shared_memory_threshold`).
+
+Values are pickled with protocol 5, and every buffer of at least the threshold size
+is copied once into its own shared memory segment rather than into the pickle. The
+receiving process then maps the segment instead of copying the data in again.
+
+Segments are unlinked by the parent process: those it sent once the evaluation is
+over, and those it received as soon as they are mapped -- so received data is freed
+along with the last value using it, e.g. when its run is discarded.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import os
+import pickle
+import sys
+from collections.abc import Iterable
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, NamedTuple
+
+
+class Segment(NamedTuple):
+    name: str
+    size: int
+
+
+class Packed(NamedTuple):
+    """
+    A pickled `payload`, the shared memory `segments` holding its out-of-band
+    buffers, the `pid` of the process that packed it, and the `threshold` it used.
+    """
+
+    payload: bytes
+    segments: tuple[Segment, ...] = ()
+    pid: int = 0
+    threshold: int | None = None
+
+    @property
+    def shared(self) -> int:
+        """The number of bytes passed through shared memory."""
+        return sum(segment.size for segment in self.segments)
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    def __del__(self) -> None:
+        # Values unpacked from us may outlive us; they keep the mapping alive
+        # Not contextlib.suppress: module globals may already be gone at exit
+        try:  # noqa: SIM105
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+
+def _open(
+    name: str | None = None, size: int = 0, *, tracked: bool = True
+) -> _SharedMemory:
+    """
+    Create (without a `name`) or attach to a segment, registering it with this
+    process' resource tracker only if `tracked`. Untracked segments are left for
+    another process to unlink, and their tracker to forget.
+    """
+    if sys.version_info >= (3, 13):
+        return _SharedMemory(name, create=name is None, size=size, track=tracked)
+    segment = _SharedMemory(name, create=name is None, size=size)
+    if not tracked and os.name == "posix":
+        # The tracker knows segments by their POSIX names, which have a leading slash
+        resource_tracker.unregister(f"/{segment.name}", "shared_memory")
+    return segment
+
+
+def _mapped(segment: shared_memory.SharedMemory) -> memoryview:
+    """The buffer of an open segment."""
+    if segment.buf is None:
+        raise ValueError(f"Shared memory segment {segment.name!r} is closed")
+    return segment.buf
+
+
+def shares_tracker(pid: int) -> bool:
+    """
+    Whether this process shares its resource tracker with process `pid`, i.e. is it,
+    or is a :mod:`multiprocessing` child of it.
+    """
+    parent = multiprocessing.parent_process()
+    return pid == os.getpid() or (parent is not None and parent.pid == pid)
+
+
+def pack(
+    obj: Any, threshold: int | None, tracked: bool = True
+) -> tuple[Packed, list[shared_memory.SharedMemory]]:
+    """
+    Pickle `obj`, moving buffers of at least `threshold` bytes (with `None`, none)
+    into new shared memory segments, which are returned still open.
+    """
+    segments: list[shared_memory.SharedMemory] = []
+    sizes: list[int] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            view = buffer.raw()
+        except BufferError:  # Not contiguous
+            return True
+        if threshold is None or view.nbytes == 0 or view.nbytes < threshold:
+            return True  # Keep it in band
+        segment = _open(size=view.nbytes, tracked=tracked)
+        segments.append(segment)
+        sizes.append(view.nbytes)
+        _mapped(segment)[: view.nbytes] = view
+        return False
+
+    try:
+        payload = pickle.dumps(
+            obj,
+            protocol=5,
+            buffer_callback=None if threshold is None else buffer_callback,
+        )
+    except BaseException:
+        release(segments, unlink=True)
+        raise
+    return (
+        Packed(
+            payload,
+            tuple(
+                Segment(s.name, size) for s, size in zip(segments, sizes, strict=True)
+            ),
+            os.getpid(),
+            threshold,
+        ),
+        segments,
+    )
+
+
+def unpack(
+    packed: Packed, tracked: bool = True
+) -> tuple[Any, list[shared_memory.SharedMemory]]:
+    """Unpickle `packed`, mapping its segments, which are returned still open."""
+    segments: list[shared_memory.SharedMemory] = []
+    try:
+        for segment in packed.segments:
+            segments.append(_open(segment.name, tracked=tracked))
+        return (
+            pickle.loads(
+                packed.payload,
+                buffers=[
+                    _mapped(opened)[: segment.size]
+                    for opened, segment in zip(segments, packed.segments, strict=True)
+                ],
+            ),
+            segments,
+        )
+    except BaseException:
+        release(segments, unlink=False)
+        raise
+
+
+def release(segments: Iterable[shared_memory.SharedMemory], unlink: bool) -> None:
+    """
+    Close our handles on `segments` -- values still mapping them keep them mapped --
+    and, if we own them, `unlink` them so they are freed once nobody maps them.
+    """
+    for segment in segments:
+        with contextlib.suppress(BufferError):
+            segment.close()
+        if unlink:
+            with contextlib.suppress(FileNotFoundError):
+                segment.unlink()
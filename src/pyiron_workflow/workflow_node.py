@@ -193,6 +193,9 @@ class Workflow(datatypes.MutableDag):
         self._pending_connections = {}
         self._pending_constants = {}
         self.executor = None
+        self.retry = None
+        self.timeout = None
+        self.resources = None
         self.last_run = None
         self._inputs = MutablePortMap[datatypes.InputPort](self)
         self._outputs = MutablePortMap[datatypes.OutputPort](self)
@@ -303,8 +306,7 @@ class Workflow(datatypes.MutableDag):
         run: execution.Run[execution.ResultType],
         config: execution.RunConfig,
     ) -> execution.Run[execution.ResultType]:
-        dag.evaluate_dag_by_layer(self.nodes, run, config)
-        dag.populate_outputs(run.result)
+        dag.evaluate_graph(self, self.nodes, run, config)
         return run
 
     def validate(
@@ -0,0 +1,271 @@
+"""
+A work queue on a shared filesystem: :class:`QueueExecutor` writes each submission
+as a task file into a queue directory, and any number of worker processes -- on this
+host or any other that sees the same directory -- claim tasks, evaluate them, and
+write their results back.
+
+Start workers with the command line, e.g.::
+
+    python -m pyiron_workflow.workqueue path/to/run_dir/work_queue
+
+where the queue directory is, by default, a :attr:`QueueExecutor.queue_directory`
+directory under the run configuration directory. Workers run until interrupted,
+unless given an `--idle-timeout` or `--max-tasks`.
+
+A task is claimed by exclusively creating its lock file, which only one worker can
+do. Task and result files are written under temporary names and moved into place, so
+nobody reads them half written. Workers must be able to import whatever the tasks
+use (e.g. the modules defining the nodes' functions), just as for process pools.
+A worker that dies mid-task leaves its lock behind, holding its host and process id;
+delete the lock file to offer the task again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import pathlib
+import pickle
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from concurrent import futures
+from typing import Any, ClassVar
+
+from pyiron_workflow import execution, executorlib, filelocks
+from pyiron_workflow.executorlib import DedicatedExecutorError
+
+_TASK = ".task"
+_LOCK = ".lock"
+_RESULT = ".result"
+
+
+class QueueExecutor(futures.Executor):
+    """
+    Submit to worker processes through task files in a shared queue directory.
+
+    Args:
+        directory: The queue directory. By default, each submission goes to a
+            :attr:`queue_directory` directory under the run directory of its run
+            configuration -- in which case only the run routines of
+            :mod:`pyiron_workflow.execution` can be submitted.
+        poll_interval: Seconds between checks for results.
+
+    Futures stay pending until their result arrives. Cancelling one withdraws its
+    task if no worker has claimed it yet, and otherwise discards the result. Results
+    are looked for on a background thread, which stops whenever nothing is pending.
+
+    The queue doesn't resolve futures among the submitted arguments, so it takes no
+    chained submissions (see
+    :attr:`~pyiron_workflow.execution.RunConfig.dag_chain_futures`); children on
+    queue executors are always submitted one by one.
+    """
+
+    queue_directory: ClassVar[str] = "work_queue"
+
+    def __init__(
+        self, directory: str | pathlib.Path | None = None, poll_interval: float = 0.1
+    ):
+        self.directory = None if directory is None else pathlib.Path(directory)
+        self.poll_interval = poll_interval
+        self._pending: dict[pathlib.Path, futures.Future] = {}
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._poller: threading.Thread | None = None
+
+    def submit(self, fn, /, *args, **kwargs) -> futures.Future:
+        self._raise_if_shut_down()
+        directory = self._directory_for(fn, args)
+        task_file = _write_task(directory, (fn, args, kwargs))
+        future: futures.Future = futures.Future()
+        with self._lock:
+            if self._shutdown:
+                filelocks.remove(task_file)
+                self._raise_if_shut_down()
+            self._pending[task_file] = future
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll, daemon=True)
+                self._poller.start()
+        return future
+
+    def _raise_if_shut_down(self) -> None:
+        if self._shutdown:
+            raise RuntimeError("Cannot submit to a queue executor after shutdown")
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            pending = list(self._pending.values())
+            poller = self._poller
+        if cancel_futures:
+            for future in pending:
+                future.cancel()
+        if wait and poller is not None:
+            poller.join()
+
+    def _directory_for(self, fn, args: tuple[Any, ...]) -> pathlib.Path:
+        if self.directory is not None:
+            return self.directory
+        routine = executorlib.unwrapped(fn)
+        if routine is execution._return_slim_reply and len(args) == 3:
+            run_dir = args[2]
+        elif (
+            routine is execution._return_mutated_state_with_any_exception
+            and len(args) == 3
+        ):
+            run_dir = args[2].run_dir
+        else:
+            raise DedicatedExecutorError(
+                f"Without a queue directory, {self.__class__.__name__} only takes "
+                f"the unchained run routines of {execution.__name__}, which carry a "
+                f"run directory, but got submitted {fn!r}"
+            )
+        return pathlib.Path(run_dir) / self.queue_directory
+
+    def _poll(self) -> None:
+        while True:
+            with self._lock:
+                pending = list(self._pending.items())
+                if len(pending) == 0:
+                    # The next submission starts another
+                    self._poller = None
+                    return
+            for task_file, future in pending:
+                result_file = task_file.with_suffix(_RESULT)
+                if future.cancelled():
+                    if _claim(task_file):
+                        filelocks.remove(task_file, task_file.with_suffix(_LOCK))
+                    elif not result_file.exists():
+                        continue  # A worker has it; wait to clean up after it
+                    filelocks.remove(result_file)
+                elif result_file.exists():
+                    try:
+                        with open(result_file, "rb") as f:
+                            returned, value = pickle.load(f)
+                    except Exception as e:
+                        returned, value = False, e
+                    filelocks.remove(result_file)
+                    if future.set_running_or_notify_cancel():
+                        if returned:
+                            future.set_result(value)
+                        else:
+                            future.set_exception(value)
+                else:
+                    continue
+                with self._lock:
+                    del self._pending[task_file]
+            time.sleep(self.poll_interval)
+
+
+def _write_task(directory: pathlib.Path, task: tuple[Any, ...]) -> pathlib.Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    # Time first, so that workers taking tasks in name order go first come first
+    task_file = directory / f"{time.time_ns():020d}_{uuid.uuid4().hex}{_TASK}"
+    filelocks.write_atomically(task_file, task)
+    return task_file
+
+
+def _claim(task_file: pathlib.Path) -> bool:
+    """Whether we got the task's lock, which only one process can."""
+    return filelocks.claim(task_file.with_suffix(_LOCK))
+
+
+def work(task_file: pathlib.Path) -> bool:
+    """
+    Claim, evaluate, and answer one task, returning whether we got it (another
+    worker, or a cancelling executor, may have claimed it first).
+    """
+    if not _claim(task_file):
+        return False
+    try:
+        with open(task_file, "rb") as f:
+            task = f.read()
+    except FileNotFoundError:
+        # Withdrawn between listing and claiming it
+        filelocks.remove(task_file.with_suffix(_LOCK))
+        return False
+    try:
+        fn, args, kwargs = pickle.loads(task)
+        outcome: tuple[bool, Any] = (True, fn(*args, **kwargs))
+    except Exception as e:
+        outcome = (False, e)
+    try:
+        filelocks.write_atomically(task_file.with_suffix(_RESULT), outcome)
+    except Exception as e:  # E.g. an unpicklable result
+        filelocks.write_atomically(
+            task_file.with_suffix(_RESULT),
+            (False, RuntimeError(f"Could not return the result of the task: {e!r}")),
+        )
+    filelocks.remove(task_file, task_file.with_suffix(_LOCK))
+    return True
+
+
+def serve(
+    directory: str | pathlib.Path,
+    poll_interval: float = 0.1,
+    idle_timeout: float | None = None,
+    max_tasks: int | None = None,
+) -> int:
+    """
+    Work through the tasks in the queue `directory`, oldest first, until none have
+    arrived for `idle_timeout` seconds or `max_tasks` are done (by default, forever).
+
+    Returns:
+        int: The number of tasks done.
+    """
+    directory = pathlib.Path(directory)
+    done = 0
+    idle_since = time.monotonic()
+    while max_tasks is None or done < max_tasks:
+        worked = False
+        for task_file in sorted(directory.glob(f"*{_TASK}")):
+            if task_file.with_suffix(_LOCK).exists():
+                continue
+            if work(task_file):
+                done += 1
+                worked = True
+                break  # Look again, there may be older tasks by now
+        if worked:
+            idle_since = time.monotonic()
+        elif idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+            break
+        else:
+            time.sleep(poll_interval)
+    return done
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {__name__}",
+        description="Work through the tasks of a pyiron_workflow work queue.",
+    )
+    parser.add_argument("directory", type=pathlib.Path, help="The queue directory")
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.1,
+        help="Seconds between looks for new tasks",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Stop once no task has arrived for this many seconds",
+    )
+    parser.add_argument(
+        "--max-tasks", type=int, default=None, help="Stop after this many tasks"
+    )
+    arguments = parser.parse_args(argv)
+    arguments.directory.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(KeyboardInterrupt):
+        serve(
+            arguments.directory,
+            poll_interval=arguments.poll_interval,
+            idle_timeout=arguments.idle_timeout,
+            max_tasks=arguments.max_tasks,
+        )
+
+
+if __name__ == "__main__":
+    main()
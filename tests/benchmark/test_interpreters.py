@@ -0,0 +1,70 @@
+"""
+Wall time of a layer of CPU-bound nodes evaluated on the layer threads (bound by the
+GIL), on the run's worker pool (subinterpreters on python >= 3.14, processes before),
+and on a fresh process pool per node.
+"""
+
+import os
+import time
+import unittest
+from concurrent import futures
+
+import flowrep as fr
+
+from pyiron_workflow import constructors, execution
+
+WIDTH = 4
+
+
+def burn(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+@fr.workflow
+def burn_layer(n):
+    a = burn(n)
+    b = burn(n)
+    c = burn(n)
+    d = burn(n)
+    return a, b, c, d
+
+
+def timed_run(config: execution.RunConfig, per_node_processes: bool = False):
+    node = constructors.node(burn_layer)
+    if per_node_processes:
+        for child in node.nodes.values():
+            child.executor = execution.ExecutorInstructions(
+                futures.ProcessPoolExecutor, kwargs={"max_workers": 1}
+            )
+    start = time.perf_counter()
+    run = node.run(config, n=2_000_000)
+    return time.perf_counter() - start, dict(run.outputs)
+
+
+class TestInterpreters(unittest.TestCase):
+    def test_cpu_bound_layer(self):
+        threads, expected = timed_run(execution.RunConfig(dag_layers_max_threads=WIDTH))
+        pool, outputs = timed_run(
+            execution.RunConfig(
+                dag_layers_interpreters=True, dag_layers_max_threads=WIDTH
+            )
+        )
+        processes, per_node_outputs = timed_run(
+            execution.RunConfig(dag_layers_max_threads=WIDTH), per_node_processes=True
+        )
+        workers = "interpreters" if execution._interpreters_usable() else "processes"
+        print(
+            f"\n{WIDTH} CPU-bound nodes on {os.cpu_count()} core(s) [s]\n"
+            f"  layer threads:                 {threads:.2f}\n"
+            f"  run worker pool ({workers}):  {pool:.2f}\n"
+            f"  process pool per node:         {processes:.2f}"
+        )
+        self.assertDictEqual(outputs, expected)
+        self.assertDictEqual(per_node_outputs, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Throughput of serving concurrent requests from one prebuilt node, versus copying the
+node for each request.
+"""
+
+import time
+import unittest
+from concurrent import futures
+
+from unit import _fixtures
+
+
+def serve(
+    make_node, requests: list[dict], share: bool, workers: int
+) -> tuple[float, list[dict]]:
+    shared = make_node()
+
+    def handle(inputs: dict) -> dict:
+        node = shared if share else shared.copy()
+        return dict(node.run(**inputs).outputs)
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=workers) as exe:
+        outputs = list(exe.map(handle, requests))
+    return time.perf_counter() - start, outputs
+
+
+class TestSharedNode(unittest.TestCase):
+    def test_requests_per_second(self):
+        requests = [{"x": i, "y": -i} for i in range(200)]
+        workers = 8
+        copied_time, copied = serve(
+            _fixtures.nested_macro_node, requests, False, workers
+        )
+        shared_time, shared = serve(
+            _fixtures.nested_macro_node, requests, True, workers
+        )
+        print(
+            f"\n{len(requests)} requests over {workers} threads [requests/s]\n"
+            f"  copy per request:  {len(requests) / copied_time:.0f}\n"
+            f"  one shared node:   {len(requests) / shared_time:.0f}"
+        )
+        self.assertListEqual(shared, copied)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+First-task latency of fresh process pools built from executor instructions, forked
+from a fork server with and without the pyiron_workflow stack preloaded.
+
+A fork server is started once per process, with whatever preloads are known by then,
+so each fork server variant is measured from a fresh interpreter of its own.
+"""
+
+import multiprocessing
+import sys
+import time
+import unittest
+from concurrent import futures
+
+from pyiron_workflow import execution
+
+PRELOAD = ("pyiron_workflow.execution", "flowrep", "semantikon", "rdflib")
+
+
+def touch_stack():
+    already_loaded = "rdflib" in sys.modules
+    import flowrep  # noqa: F401, PLC0415
+    import rdflib  # noqa: F401, PLC0415
+    import semantikon  # noqa: F401, PLC0415
+
+    return already_loaded
+
+
+def first_task_latencies(
+    instructions: execution.ExecutorInstructions, repeats: int
+) -> tuple[list[float], list[bool]]:
+    latencies, already_loaded = [], []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with instructions.instantiate() as exe:
+            already_loaded.append(exe.submit(touch_stack).result())
+        latencies.append(time.perf_counter() - start)
+    return latencies, already_loaded
+
+
+def forkserver_latencies(
+    preload: tuple[str, ...], repeats: int
+) -> tuple[list[float], list[bool]]:
+    return first_task_latencies(
+        execution.ExecutorInstructions(
+            futures.ProcessPoolExecutor,
+            kwargs={"max_workers": 1},
+            start_method="forkserver",
+            preload=preload,
+        ),
+        repeats,
+    )
+
+
+def in_fresh_interpreter(fn, *args):
+    with futures.ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as exe:
+        return exe.submit(fn, *args).result()
+
+
+class TestWarmWorkers(unittest.TestCase):
+    def test_first_task_latency(self):
+        repeats = 3
+        cold, _ = in_fresh_interpreter(forkserver_latencies, (), repeats)
+        warm, already_loaded = in_fresh_interpreter(
+            forkserver_latencies, PRELOAD, repeats
+        )
+        print(
+            f"\nFirst-task latency over {repeats} fresh pools [s]\n"
+            f"  forkserver:            {[round(t, 3) for t in cold]}\n"
+            f"  forkserver + preload:  {[round(t, 3) for t in warm]}"
+        )
+        self.assertEqual(len(cold), repeats)
+        self.assertEqual(
+            already_loaded,
+            [True] * repeats,
+            msg="Preloaded workers have the stack before their first task",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
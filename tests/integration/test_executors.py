@@ -1,6 +1,9 @@
+import dataclasses
 import os
 import pathlib
 import shutil
+import subprocess
+import sys
 import tempfile
 import time
 import unittest
@@ -9,7 +12,7 @@ from concurrent import futures
 import flowrep as fr
 
 from pyiron_workflow import api as wfms
-from pyiron_workflow import executorlib
+from pyiron_workflow import executorlib, history, workqueue
 
 
 def get_pid(trigger):
@@ -67,6 +70,21 @@ def sleepy_array(times: list[float]) -> list[float]:
     return slept_for
 
 
+@fr.atomic
+def shift(t, offset):
+    shifted = t + offset
+    return shifted
+
+
+@fr.workflow
+def shifted_array(times, offset):
+    shifted_times = []
+    for t in times:
+        shifted = shift(t, offset)
+        shifted_times.append(shifted)
+    return shifted_times
+
+
 @fr.workflow
 def slow_wf(t):
     s = sleepy(t)
@@ -80,6 +98,76 @@ def two_slow(a, b):
     return x, y
 
 
+@fr.workflow
+def four_slow(a, b, c, d):
+    w = sleepy(a)
+    x = sleepy(b)
+    y = sleepy(c)
+    z = sleepy(d)
+    return w, x, y, z
+
+
+@fr.workflow
+def sleepy_chain(t):
+    a = sleepy(t)
+    b = sleepy(a)
+    c = sleepy(b)
+    return c
+
+
+@fr.atomic
+def fail_on_negative(x):
+    if x < 0:
+        raise ValueError("negative")
+    return x
+
+
+@fr.workflow
+def failing_chain(t):
+    a = fail_on_negative(t)
+    b = sleepy(a)
+    return b
+
+
+UNPICKLED_IN_PARENT: list[object] = []
+
+
+class ParentShy:
+    """A value that records being unpickled in the process `parent_pid`."""
+
+    def __init__(self, value, parent_pid):
+        self.value = value
+        self.parent_pid = parent_pid
+
+    def __reduce__(self):
+        return _arrive_shyly, (self.value, self.parent_pid)
+
+
+def _arrive_shyly(value, parent_pid):
+    if os.getpid() == parent_pid:
+        UNPICKLED_IN_PARENT.append(value)
+    return ParentShy(value, parent_pid)
+
+
+@fr.atomic
+def make_shy(x, parent_pid):
+    payload = ParentShy(x, parent_pid)
+    return payload
+
+
+@fr.atomic
+def unwrap_shy(payload):
+    x = payload.value
+    return x
+
+
+@fr.workflow
+def shy_chain(x, parent_pid):
+    payload = make_shy(x, parent_pid)
+    y = unwrap_shy(payload)
+    return y
+
+
 def plain_fn(x):
     return x
 
@@ -328,9 +416,332 @@ class TestCachingExecutors(unittest.TestCase):
         self._assert_cached(run_dir, node.sleepy_0.lexical_path)
         self._assert_cached(run_dir, node.sleepy_1.lexical_path)
 
+    def test_cache_is_keyed_by_node_path_outside_loops(self):
+        run_dir = self.run_root / "keys"
+        node = self._fresh_node(wfms.tools._CacheTestExecutor)
+        out = node.run(wfms.RunConfig(run_dir=run_dir), t=self.T)
+        (step,) = out.steps
+        self.assertEqual(step.lexical_path, node.sleepy_0.lexical_path)
+        self.assertEqual(
+            [p.name for p in self._cache_dir(run_dir).iterdir()],
+            [f"{node.sleepy_0.lexical_path}_o.h5"],
+            msg="Keying by the run's path leaves non-iterated nodes' files as they were",
+        )
+
+    def test_slim_and_full_replies_are_cached_apart(self):
+        run_dir = self.run_root / "transport"
+        for slim in (True, False, True):
+            with self.subTest(slim=slim):
+                node = self._fresh_node(wfms.tools._CacheTestExecutor)
+                out = node.run(
+                    wfms.RunConfig(run_dir=run_dir, slim_transport=slim), t=self.T
+                )
+                self.assertEqual(out.outputs.s, self.T)
+        self.assertTrue(
+            (
+                self._cache_dir(run_dir)
+                / executorlib.CacheOverride.slim_cache_directory
+            ).is_dir()
+        )
+
     def test_dedicated_executor_error(self):
         with (
             wfms.tools._CacheTestExecutor() as exe,
             self.assertRaises(executorlib.DedicatedExecutorError),
         ):
             exe.submit(plain_fn, 1)
+
+
+class TestChainedFutures(unittest.TestCase):
+    def setUp(self) -> None:
+        self.run_dir = pathlib.Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+    def _config(self, chain):
+        return wfms.RunConfig(
+            run_dir=self.run_dir / str(chain), dag_chain_futures=chain
+        )
+
+    def test_consumer_is_submitted_before_upstream_finishes(self):
+        for chain in (False, True):
+            with (
+                self.subTest(chain=chain),
+                wfms.tools.NodeSingleExecutor(block_allocation=True) as exe,
+            ):
+                node = wfms.node(sleepy_chain.flowrep_recipe)
+                node.sleepy_0.executor = exe
+                node.sleepy_1.executor = exe
+                out = node.run(self._config(chain), t=0.1)
+                self.assertEqual(out.outputs.c, 0.1)
+                steps = {step.label: step for step in out.steps}
+                self.assertTrue(
+                    all(
+                        step.status == wfms.schemas.RunStatus.FINISHED
+                        for step in steps.values()
+                    )
+                )
+                self.assertEqual(
+                    chain,
+                    steps["sleepy_1"].started_at < steps["sleepy_0"].finished_at,
+                    msg="Only chained futures let the consumer start early",
+                )
+
+    def test_only_outputs_read_here_are_kept(self):
+        with wfms.tools.NodeSingleExecutor(block_allocation=True) as exe:
+            node = wfms.node(sleepy_chain.flowrep_recipe)
+            node.sleepy_0.executor = exe
+            node.sleepy_1.executor = exe
+            out = node.run(self._config(True), t=0.1)
+        self.assertEqual(out.outputs.c, 0.1)
+        steps = {step.label: step for step in out.steps}
+        self.assertIs(
+            steps["sleepy_0"].outputs.t_sleep,
+            fr.schemas.NOT_DATA,
+            msg="Only the chained consumer reads it, and gets just the value",
+        )
+        self.assertIs(
+            steps["sleepy_1"].result.input_ports["t_sleep"].value,
+            fr.schemas.NOT_DATA,
+            msg="Chained inputs are read remotely and not sent back",
+        )
+        self.assertEqual(steps["sleepy_1"].outputs.t_sleep, 0.1)
+
+    def test_chained_data_never_reaches_this_process(self):
+        UNPICKLED_IN_PARENT.clear()
+        with wfms.tools._CacheTestExecutor() as exe:
+            node = wfms.node(shy_chain.flowrep_recipe)
+            node.make_shy_0.executor = exe
+            node.unwrap_shy_0.executor = exe
+            out = node.run(self._config(True), x=42, parent_pid=os.getpid())
+        self.assertEqual(out.outputs.y, 42)
+        self.assertListEqual(UNPICKLED_IN_PARENT, [])
+        steps = {step.label: step for step in out.steps}
+        self.assertIs(steps["make_shy_0"].outputs.payload, fr.schemas.NOT_DATA)
+
+    def test_upstream_failure_cancels_chained_consumer(self):
+        failed_runs = []
+        config = dataclasses.replace(
+            self._config(True),
+            exception_hooks=[lambda _dir, run, _exc: failed_runs.append(run)],
+        )
+        with wfms.tools.NodeSingleExecutor(block_allocation=True) as exe:
+            node = wfms.node(failing_chain.flowrep_recipe)
+            node.fail_on_negative_0.executor = exe
+            node.sleepy_0.executor = exe
+            with self.assertRaises(ValueError):
+                node.run(config, t=-1)
+        self.assertEqual(
+            {step.label: step.status for step in failed_runs[0].steps},
+            {
+                "fail_on_negative_0": wfms.schemas.RunStatus.FAILED,
+                "sleepy_0": wfms.schemas.RunStatus.CANCELLED,
+            },
+        )
+
+
+class TestJobPacking(unittest.TestCase):
+    def setUp(self) -> None:
+        self.run_dir = pathlib.Path(tempfile.mkdtemp())
+        self.times = {"a": 0.01, "b": 0.02, "c": 0.03, "d": 0.04}
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+    def _run_four(self, exe, config):
+        node = wfms.node(four_slow.flowrep_recipe)
+        for i in range(4):
+            node.get_node(f"sleepy_{i}").executor = exe
+        return node, node.run(config, **self.times)
+
+    def test_rejects_empty_packs(self):
+        with self.assertRaises(ValueError):
+            wfms.tools._PackingCacheTestExecutor(max_pack_size=0)
+
+    def test_packed_nodes_are_cached_individually(self):
+        config = wfms.RunConfig(run_dir=self.run_dir)
+        with wfms.tools._PackingCacheTestExecutor(
+            max_pack_size=4, pack_window=5.0
+        ) as exe:
+            node, out = self._run_four(exe, config)
+        self.assertEqual(tuple(out.outputs.values()), tuple(self.times.values()))
+        self.assertEqual(exe.pack_sizes, [4], msg="All four should share one job")
+
+        cache_dir = self.run_dir / executorlib.CacheOverride.cache_directory
+        self.assertEqual(
+            sorted(p.name for p in cache_dir.iterdir()),
+            sorted(
+                f"{node.get_node(f'sleepy_{i}').lexical_path}_o.h5" for i in range(4)
+            ),
+            msg="Each node is cached as if submitted on its own, and packs leave "
+            "nothing behind",
+        )
+
+        # The unpacked executor reads these back
+        t0 = time.perf_counter()
+        with wfms.tools._CacheTestExecutor() as exe:
+            _, cached = self._run_four(exe, config)
+        self.assertEqual(tuple(cached.outputs.values()), tuple(self.times.values()))
+        self.assertLess(time.perf_counter() - t0, 1.0)
+
+    def test_packs_are_sized_by_walltime(self):
+        durations = history.DurationHistory(self.run_dir / "history")
+        durations.record(history.recipe_key(sleepy.flowrep_recipe), 1.0)
+        config = wfms.RunConfig(run_dir=self.run_dir, duration_history=durations)
+        with wfms.tools._PackingCacheTestExecutor(
+            pack_walltime=2.0, pack_window=5.0
+        ) as exe:
+            _, out = self._run_four(exe, config)
+        self.assertEqual(tuple(out.outputs.values()), tuple(self.times.values()))
+        self.assertEqual(exe.pack_sizes, [2, 2])
+
+    def test_for_each_body_is_packed(self):
+        times = [0.01, 0.02, 0.03, 0.04, 0.05]
+        node = wfms.node(sleepy_array.flowrep_recipe)
+        with wfms.tools._PackingCacheTestExecutor(max_pack_size=3) as exe:
+            node.for_each_0.body.sleepy_0.executor = exe
+            out = node.run(wfms.RunConfig(run_dir=self.run_dir), times=times)
+        self.assertListEqual(out.outputs.slept_for, times)
+        self.assertEqual(sum(exe.pack_sizes), len(times))
+        self.assertLess(len(exe.pack_sizes), len(times))
+
+
+class TestForEachJobArray(unittest.TestCase):
+    def setUp(self) -> None:
+        self.run_dir = pathlib.Path(tempfile.mkdtemp())
+        self.times = [0.03, 0.01, 0.02]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+    def _run(self, config):
+        node = wfms.node(sleepy_array.flowrep_recipe)
+        with wfms.tools._CacheTestExecutor() as exe:
+            node.for_each_0.body.executor = exe
+            return node, node.run(config, times=self.times)
+
+    def test_iterations_are_one_job_cached_individually(self):
+        config = wfms.RunConfig(run_dir=self.run_dir, for_each_job_array=True)
+        node, out = self._run(config)
+        self.assertListEqual(out.outputs.slept_for, self.times)
+
+        for_each_path = node.for_each_0.lexical_path
+        cache_dir = self.run_dir / executorlib.CacheOverride.cache_directory
+        self.assertEqual(
+            sorted(p.name for p in cache_dir.iterdir()),
+            sorted(f"{for_each_path}.body_{i}_o.h5" for i in range(len(self.times))),
+            msg="Each iteration is cached under its own run path, with no per-"
+            "iteration submission files, and the array leaves nothing behind",
+        )
+
+        # Iterations submitted one by one read the array's cache files back
+        t0 = time.perf_counter()
+        _, cached = self._run(dataclasses.replace(config, for_each_job_array=False))
+        self.assertListEqual(cached.outputs.slept_for, self.times)
+        self.assertLess(time.perf_counter() - t0, 1.0)
+
+    def test_arrays_are_split_into_parallel_jobs(self):
+        node = wfms.node(sleepy_array.flowrep_recipe)
+        with wfms.tools._CacheTestExecutor(array_chunk_size=2) as exe:
+            node.for_each_0.body.executor = exe
+            out = node.run(
+                wfms.RunConfig(run_dir=self.run_dir, for_each_job_array=True),
+                times=self.times,
+            )
+        self.assertListEqual(out.outputs.slept_for, self.times)
+        self.assertEqual(exe.array_sizes, [2, 1])
+
+    def test_rejects_empty_array_jobs(self):
+        with self.assertRaises(ValueError):
+            wfms.tools._CacheTestExecutor(array_chunk_size=0)
+
+    def test_iterations_missing_input_are_skipped(self):
+        for job_array in (False, True):
+            with self.subTest(job_array=job_array):
+                node = wfms.node(shifted_array.flowrep_recipe)
+                with wfms.tools._CacheTestExecutor() as exe:
+                    node.for_each_0.body.executor = exe
+                    run = node.for_each_0.run(
+                        wfms.RunConfig(
+                            run_dir=self.run_dir / str(job_array),
+                            for_each_job_array=job_array,
+                        ),
+                        times=self.times,
+                    )
+                self.assertEqual(run.steps.labels, ["scatter_times"])
+                self.assertEqual(exe.array_sizes, [])
+
+    def test_only_executorlib_bodies_are_arrayed(self):
+        node = wfms.node(sleepy_array.flowrep_recipe)
+        with futures.ThreadPoolExecutor() as exe:
+            node.for_each_0.body.executor = exe
+            out = node.run(
+                wfms.RunConfig(run_dir=self.run_dir, for_each_job_array=True),
+                times=self.times,
+            )
+        self.assertListEqual(out.outputs.slept_for, self.times)
+        self.assertFalse(
+            (self.run_dir / executorlib.CacheOverride.cache_directory).exists()
+        )
+
+
+class TestWorkQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.run_dir = pathlib.Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+    def _start_worker(self, *args):
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "pyiron_workflow.workqueue",
+                str(self.run_dir / wfms.tools.QueueExecutor.queue_directory),
+                "--poll-interval",
+                "0.01",
+                *args,
+            ],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+    def test_worker_processes_share_the_queue(self):
+        # Each worker quits after two tasks, so both must take part
+        workers = [self._start_worker("--max-tasks", "2") for _ in range(2)]
+        try:
+            node = wfms.node(four_slow.flowrep_recipe)
+            for i in range(4):
+                node.get_node(f"sleepy_{i}").executor = wfms.tools.QueueExecutor(
+                    poll_interval=0.01
+                )
+            out = node.run(
+                wfms.RunConfig(run_dir=self.run_dir), a=0.1, b=0.2, c=0.3, d=0.4
+            )
+            self.assertTupleEqual(tuple(out.outputs.values()), (0.1, 0.2, 0.3, 0.4))
+            for worker in workers:
+                self.assertEqual(worker.wait(timeout=60), 0)
+        finally:
+            for worker in workers:
+                worker.kill()
+                worker.wait()
+        self.assertListEqual(
+            list((self.run_dir / wfms.tools.QueueExecutor.queue_directory).iterdir()),
+            [],
+        )
+
+    def test_idle_workers_stop(self):
+        worker = self._start_worker("--idle-timeout", "0.1")
+        try:
+            self.assertEqual(worker.wait(timeout=60), 0)
+        finally:
+            worker.kill()
+            worker.wait()
+        self.assertEqual(
+            workqueue.serve(
+                self.run_dir / wfms.tools.QueueExecutor.queue_directory,
+                idle_timeout=0,
+            ),
+            0,
+        )
@@ -15,6 +15,8 @@ Usage:
 from __future__ import annotations
 
 import dataclasses
+import pickle
+import threading
 from typing import Annotated
 
 import flowrep as fr
@@ -251,6 +253,29 @@ def for_wf(xs, ys, z):
     return x_used, y_used, sums
 
 
+# --------------------------------------------------------------------------- #
+# Out-of-band buffers                                                         #
+# --------------------------------------------------------------------------- #
+
+
+class Blob(bytearray):
+    """A bytearray pickled out of band with protocol 5, as NumPy arrays are."""
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self),)
+        return type(self), (bytes(self),)
+
+    @classmethod
+    def _reconstruct(cls, buffer):
+        return cls(buffer)
+
+
+def reverse_blob(data):
+    reversed_data = Blob(reversed(data))
+    return reversed_data
+
+
 # --------------------------------------------------------------------------- #
 # Constructor helpers                                                         #
 # --------------------------------------------------------------------------- #
@@ -744,3 +769,21 @@ class WithInitVar:
     a: "int"  # noqa: UP037
     d: dataclasses.InitVar[int] = 3
     b: int = 5
+
+
+# --------------------------------------------------------------------------- #
+# Helpers                                                                     #
+# --------------------------------------------------------------------------- #
+
+
+def run_or_fail(test, node, config=None, timeout: float = 30, **input_data):
+    """Run `node` on a daemon thread, failing `test` if it hangs past `timeout`."""
+    runs = []
+    thread = threading.Thread(
+        target=lambda: runs.append(node.run(config, **input_data)), daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        test.fail(f"{node.label!r} did not finish within {timeout} s")
+    return runs[0]
@@ -15,12 +15,14 @@ Covers the testable surface of `dag.py`:
 from __future__ import annotations
 
 import pickle
+import tempfile
+import time
 import unittest
 
 import flowrep as fr
 from unit import _fixtures
 
-from pyiron_workflow import dag, datatypes, execution
+from pyiron_workflow import dag, datatypes, execution, history, workflow_node
 
 
 @fr.atomic
@@ -45,6 +47,100 @@ def _double_error(x):
     return ok, problem, problem_again
 
 
+@fr.atomic
+def _slow(x):
+    time.sleep(0.2)
+    return x
+
+
+@fr.workflow
+def _error_beside_pending(x):
+    problem = _problematic(x)
+    slow = _slow(x)
+    slow_again = _slow(x)
+    return problem, slow, slow_again
+
+
+@fr.workflow
+def _slow_chain(x):
+    first = _slow(x)
+    second = _slow(first)
+    return second
+
+
+@fr.atomic
+def _delayed_problem(x):
+    time.sleep(0.1)
+    raise ValueError("problem in node, eventually")
+    return x  # noqa: F841
+
+
+@fr.workflow
+def _error_beside_running(x):
+    problem = _delayed_problem(x)
+    chain = _slow_chain(x)
+    return problem, chain
+
+
+@fr.workflow
+def _uneven(x):
+    short = _fixtures.identity(x)
+    long_0 = _fixtures.negate(x)
+    long_1 = _fixtures.negate(long_0)
+    long_2 = _fixtures.negate(long_1)
+    return short, long_2
+
+
+@fr.workflow
+def _independent(x):
+    a = _fixtures.identity(x)
+    b = _fixtures.negate(x)
+    return a, b
+
+
+@fr.workflow
+def _with_dead_end(x):
+    used = _fixtures.identity(x)
+    dead = _fixtures.negate(x)
+    dead_again = _fixtures.negate(dead)  # noqa: F841
+    result = _fixtures.add(used, x)
+    return result
+
+
+@fr.workflow
+def _nested_dead_end(x):
+    inner = _with_dead_end(x)
+    dead = _problematic(x)  # noqa: F841
+    return inner
+
+
+@fr.atomic
+def _stamp(x):
+    t = time.perf_counter()
+    return t
+
+
+@fr.workflow
+def _early_and_late(x):
+    early = _fixtures.identity(x)
+    late = _slow(x)
+    return early, late
+
+
+@fr.workflow
+def _waits_on_early(x):
+    early, late = _early_and_late(x)
+    t = _stamp(early)
+    total = _fixtures.add(early, late)
+    return t, total
+
+
+@fr.workflow
+def _nested_problem(x):
+    ok, problem, ok_again = _single_error(x)
+    return ok, problem, ok_again
+
+
 class TestMacro(unittest.TestCase):
     """End-to-end exercise of `Macro` via the `macro` fixture."""
 
@@ -261,5 +357,341 @@ class TestErrorParallelism(unittest.TestCase):
             self.double.run(cfg, x=1)
 
 
+class TestFailFastCancellation(unittest.TestCase):
+    @staticmethod
+    def _run_and_capture(macro: dag.Macro, **config_kwargs) -> execution.Run:
+        captured = []
+        cfg = execution.RunConfig(
+            dag_layers_fail_fast=True,
+            exception_hooks=[lambda _, failed_run, __: captured.append(failed_run)],
+            **config_kwargs,
+        )
+        try:
+            macro.run(cfg, x=1)
+        except ValueError:
+            pass
+        else:  # pragma: no cover
+            raise AssertionError("Expected the problematic node to raise")
+        return captured[0]
+
+    def test_pending_siblings_are_cancelled(self):
+        macro = dag.Macro(_error_beside_pending.flowrep_recipe, "pending")
+        start = time.perf_counter()
+        failed = self._run_and_capture(macro, dag_layers_max_threads=1)
+        self.assertLess(time.perf_counter() - start, 0.2)
+        statuses = {step.label: step.status for step in failed.steps}
+        self.assertEqual(
+            statuses,
+            {
+                "_problematic_0": execution.RunStatus.FAILED,
+                "_slow_0": execution.RunStatus.CANCELLED,
+                "_slow_1": execution.RunStatus.CANCELLED,
+            },
+        )
+
+    def test_running_sibling_is_cancelled_cooperatively(self):
+        macro = dag.Macro(_error_beside_running.flowrep_recipe, "running")
+        failed = self._run_and_capture(macro)
+        chain = next(step for step in failed.steps if step.label == "_slow_chain_0")
+        self.assertEqual(chain.status, execution.RunStatus.CANCELLED)
+        self.assertIsInstance(chain.exception, execution.RunCancelledError)
+        self.assertEqual(
+            [(step.label, step.status) for step in chain.steps],
+            [
+                ("_slow_0", execution.RunStatus.FINISHED),
+                ("_slow_1", execution.RunStatus.CANCELLED),
+            ],
+            msg="The running child finishes, but the next one is never started",
+        )
+
+    def test_without_fail_fast_siblings_finish(self):
+        macro = dag.Macro(_error_beside_running.flowrep_recipe, "running")
+        captured = []
+        cfg = execution.RunConfig(
+            exception_hooks=[lambda _, failed_run, __: captured.append(failed_run)],
+        )
+        with self.assertRaises(ValueError):
+            macro.run(cfg, x=1)
+        chain = next(s for s in captured[0].steps if s.label == "_slow_chain_0")
+        self.assertEqual(chain.status, execution.RunStatus.FINISHED)
+
+
+class TestCriticalPathPriority(unittest.TestCase):
+    def test_ranks_count_remaining_nodes_without_history(self) -> None:
+        macro = dag.Macro(_uneven.flowrep_recipe, "uneven")
+        ranks = dag.critical_path_ranks(macro.nodes, macro.recipe.edges)
+        self.assertEqual(
+            ranks,
+            {"identity_0": 1, "negate_0": 3, "negate_1": 2, "negate_2": 1},
+        )
+
+    def test_ranks_weighted_by_history(self) -> None:
+        macro = dag.Macro(_independent.flowrep_recipe, "independent")
+        with tempfile.TemporaryDirectory() as tmp:
+            durations = history.DurationHistory(tmp)
+            durations.record(history.recipe_key(macro.nodes.negate_0.recipe), 5.0)
+            ranks = dag.critical_path_ranks(macro.nodes, macro.recipe.edges, durations)
+        self.assertEqual(
+            ranks,
+            {"identity_0": 5.0, "negate_0": 5.0},
+            msg="Unknown nodes weigh the median of known ones",
+        )
+
+    def test_ranks_weighted_by_known_input_size(self) -> None:
+        macro = dag.Macro(_independent.flowrep_recipe, "independent")
+        data = macro.generate_flowrep_live_node()
+        data.input_ports["x"].value = list(range(30))
+        with tempfile.TemporaryDirectory() as tmp:
+            durations = history.DurationHistory(tmp)
+            key = history.recipe_key(macro.nodes.identity_0.recipe)
+            for seconds, size in ((1.0, 1), (10.0, 10)):
+                durations.record(key, seconds, size)
+            durations.record(history.recipe_key(macro.nodes.negate_0.recipe), 20.0)
+            ranks = dag.critical_path_ranks(
+                macro.nodes, macro.recipe.edges, durations, dag.known_inputs(data)
+            )
+        self.assertAlmostEqual(ranks["identity_0"], 30.0)
+        self.assertEqual(ranks["negate_0"], 20.0)
+
+    def test_submission_order_follows_critical_path(self) -> None:
+        for critical_path, first in ((False, "identity_0"), (True, "negate_0")):
+            with self.subTest(critical_path=critical_path):
+                macro = dag.Macro(_uneven.flowrep_recipe, "uneven")
+                run = macro.run(
+                    execution.RunConfig(
+                        dag_layers_max_threads=1,
+                        dag_layers_critical_path=critical_path,
+                    ),
+                    x=1,
+                )
+                self.assertEqual(run.steps[0].label, first)
+
+    def test_history_is_recorded_and_used(self) -> None:
+        macro = dag.Macro(_independent.flowrep_recipe, "independent")
+        with tempfile.TemporaryDirectory() as tmp:
+            durations = history.DurationHistory(tmp)
+            config = execution.RunConfig(
+                dag_layers_max_threads=1,
+                dag_layers_critical_path=True,
+                duration_history=durations,
+            )
+            macro.run(config, x=1)
+            self.assertEqual(
+                len(durations.durations(history.recipe_key(macro.recipe))), 1
+            )
+            durations.record(history.recipe_key(macro.nodes.negate_0.recipe), 60)
+            run = macro.run(config, x=1)
+        self.assertEqual(run.steps[0].label, "negate_0")
+
+
+class TestEstimateRuntime(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.durations = history.DurationHistory(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _record(self, node, seconds: float) -> None:
+        self.durations.record(history.recipe_key(node.recipe), seconds)
+
+    def test_no_history_counts_nodes(self) -> None:
+        macro = dag.Macro(_uneven.flowrep_recipe, "uneven")
+        plan = dag.estimate_runtime(macro, self.durations)
+        self.assertEqual(plan.total, 4)
+        self.assertEqual(plan.critical_path, 3)
+        self.assertEqual(plan.path, ["negate_0", "negate_1", "negate_2"])
+        self.assertEqual(plan.unknown, sorted(macro.nodes))
+
+    def test_history_shifts_the_critical_path(self) -> None:
+        macro = dag.Macro(_uneven.flowrep_recipe, "uneven")
+        self._record(macro.nodes.identity_0, 10.0)
+        self._record(macro.nodes.negate_0, 1.0)
+        plan = dag.estimate_runtime(macro, self.durations)
+        self.assertEqual(plan.path, ["identity_0"])
+        self.assertEqual(plan.critical_path, 10.0)
+        self.assertEqual(plan.total, 13.0, msg="Every negation shares one recipe")
+        self.assertEqual(plan.unknown, [])
+
+    def test_descends_into_child_graphs_without_history(self) -> None:
+        macro = dag.Macro(_error_beside_running.flowrep_recipe, "outer")
+        chain = macro.nodes._slow_chain_0
+        for child in chain.nodes.values():
+            self._record(child, 2.0)
+        self._record(macro.nodes._delayed_problem_0, 3.0)
+        plan = dag.estimate_runtime(macro, self.durations)
+        self.assertEqual(plan.durations["_slow_chain_0"], 4.0)
+        self.assertEqual(plan.critical_path, 4.0)
+        self.assertEqual(plan.unknown, [])
+
+    def test_known_inputs_are_sized(self) -> None:
+        macro = dag.Macro(_uneven.flowrep_recipe, "uneven")
+        key = history.recipe_key(macro.nodes.identity_0.recipe)
+        for seconds, size in ((1.0, 1), (10.0, 10)):
+            self.durations.record(key, seconds, size)
+        self._record(macro.nodes.negate_0, 1.0)
+        self.assertEqual(
+            dag.estimate_runtime(macro, self.durations).durations["identity_0"],
+            5.5,
+            msg="Without input, fall back on the median",
+        )
+        plan = dag.estimate_runtime(macro, self.durations, {"x": list(range(30))})
+        self.assertAlmostEqual(plan.durations["identity_0"], 30.0)
+        self.assertEqual(plan.path, ["identity_0"])
+
+    def test_non_graph_is_a_graph_of_one(self) -> None:
+        node = _fixtures.atomic_add_node()
+        self._record(node, 0.5)
+        plan = dag.estimate_runtime(node, self.durations)
+        self.assertEqual((plan.total, plan.critical_path), (0.5, 0.5))
+
+
+class TestPruneToOutputs(unittest.TestCase):
+    def test_output_cone(self) -> None:
+        data = dag.Macro(_uneven.flowrep_recipe, "uneven").generate_flowrep_live_node()
+        self.assertEqual(
+            dag.output_cone(data), {"identity_0", "negate_0", "negate_1", "negate_2"}
+        )
+        self.assertEqual(dag.output_cone(data, ["short"]), {"identity_0"})
+        with self.assertRaises(ValueError):
+            dag.output_cone(data, ["not_an_output"])
+
+    def test_nothing_pruned_by_default(self) -> None:
+        run = dag.Macro(_with_dead_end.flowrep_recipe, "m").run(x=1)
+        self.assertEqual(len(run.steps), 4)
+        self.assertEqual(run.pruned, [])
+
+    def test_dead_nodes_are_skipped_and_reported(self) -> None:
+        run = dag.Macro(_with_dead_end.flowrep_recipe, "m").run(
+            execution.RunConfig(dag_prune_to_outputs=True), x=1
+        )
+        self.assertEqual(run.outputs.result, 2)
+        self.assertEqual(sorted(run.steps.labels), ["add_0", "identity_0"])
+        self.assertEqual(sorted(run.pruned), ["negate_0", "negate_1"])
+
+    def test_pruning_applies_to_nested_graphs(self) -> None:
+        run = dag.Macro(_nested_dead_end.flowrep_recipe, "m").run(
+            execution.RunConfig(dag_prune_to_outputs=True), x=1
+        )
+        self.assertEqual(run.outputs.inner, 2)
+        self.assertEqual(run.pruned, ["_problematic_0"], msg="It would have raised")
+        self.assertEqual(sorted(run.steps[0].pruned), ["negate_0", "negate_1"])
+
+    def test_requested_outputs_narrow_the_prime_mover(self) -> None:
+        run = dag.Macro(_uneven.flowrep_recipe, "uneven").run(
+            execution.RunConfig(requested_outputs=["short"]), x=1
+        )
+        self.assertEqual(run.outputs.short, 1)
+        self.assertIs(run.outputs.long_2, fr.schemas.NOT_DATA)
+        self.assertEqual(sorted(run.pruned), ["negate_0", "negate_1", "negate_2"])
+
+    def test_requested_outputs_only_apply_to_the_prime_mover(self) -> None:
+        run = dag.Macro(_nested_dead_end.flowrep_recipe, "m").run(
+            execution.RunConfig(requested_outputs=["inner"]), x=1
+        )
+        self.assertEqual(run.outputs.inner, 2)
+        self.assertEqual(run.pruned, ["_problematic_0"])
+        self.assertListEqual(
+            run.steps[0].pruned, [], msg="Children keep all their outputs"
+        )
+
+    def test_requested_outputs_need_a_graph(self) -> None:
+        for node in (_fixtures.atomic_add_node(), _fixtures.foreach_node()):
+            with (
+                self.subTest(node.__class__.__name__),
+                self.assertRaises(ValueError),
+            ):
+                node.run(execution.RunConfig(requested_outputs=["output_0"]))
+
+
+class TestInlineSubgraphs(unittest.TestCase):
+    def test_downstream_starts_on_early_outputs(self) -> None:
+        for inline in (False, True):
+            with self.subTest(inline=inline):
+                start = time.perf_counter()
+                run = dag.Macro(_waits_on_early.flowrep_recipe, "m").run(
+                    execution.RunConfig(dag_inline_subgraphs=inline), x=1
+                )
+                self.assertEqual(run.outputs.total, 2)
+                waited = run.outputs.t - start >= 0.2
+                self.assertEqual(waited, not inline)
+
+    def test_runs_keep_their_nested_structure(self) -> None:
+        plain = dag.Macro(_waits_on_early.flowrep_recipe, "m").run(x=1)
+        inlined = dag.Macro(_waits_on_early.flowrep_recipe, "m").run(
+            execution.RunConfig(dag_inline_subgraphs=True), x=1
+        )
+        self.assertEqual(sorted(inlined.steps.labels), sorted(plain.steps.labels))
+        inner = next(step for step in inlined.steps if step.steps)
+        self.assertEqual(inner.lexical_path, "m._early_and_late_0")
+        self.assertEqual(inner.status, execution.RunStatus.FINISHED)
+        self.assertEqual(sorted(inner.steps.labels), ["_slow_0", "identity_0"])
+        self.assertEqual(inner.steps[0].lexical_path.count("."), 2)
+        self.assertEqual(dict(inner.outputs), {"early": 1, "late": 1})
+        self.assertEqual(inner.result.input_ports["x"].value, 1)
+
+    def test_sequential_inlining(self) -> None:
+        run = dag.Macro(_waits_on_early.flowrep_recipe, "m").run(
+            execution.RunConfig(
+                dag_inline_subgraphs=True, dag_layers_multithreaded=False
+            ),
+            x=1,
+        )
+        self.assertEqual(run.outputs.total, 2)
+
+    def test_graphs_missing_input_are_skipped(self) -> None:
+        wf = workflow_node.Workflow("wf")
+        wf.create_input("x")
+        wf.create_output("early")
+        wf.inner = _early_and_late
+        wf.connect(wf.inputs["x"], wf.inner.inputs["x"])
+        wf.connect(wf.inner.outputs["early"], wf.outputs["early"])
+        for inline in (False, True):
+            for multithreaded in (True, False):
+                with self.subTest(inline=inline, multithreaded=multithreaded):
+                    run = wf.run(
+                        execution.RunConfig(
+                            dag_inline_subgraphs=inline,
+                            dag_layers_multithreaded=multithreaded,
+                        )
+                    )
+                    self.assertEqual(len(run.steps), 0)
+                    self.assertIs(run.outputs.early, fr.schemas.NOT_DATA)
+
+    def test_inlined_graphs_are_pruned(self) -> None:
+        for multithreaded in (True, False):
+            with self.subTest(multithreaded=multithreaded):
+                run = dag.Macro(_nested_dead_end.flowrep_recipe, "m").run(
+                    execution.RunConfig(
+                        dag_inline_subgraphs=True,
+                        dag_prune_to_outputs=True,
+                        dag_layers_multithreaded=multithreaded,
+                    ),
+                    x=1,
+                )
+                self.assertEqual(run.outputs.inner, 2)
+                self.assertEqual(run.pruned, ["_problematic_0"])
+                (inner,) = run.steps
+                self.assertEqual(sorted(inner.pruned), ["negate_0", "negate_1"])
+                self.assertEqual(sorted(inner.steps.labels), ["add_0", "identity_0"])
+
+    def test_failures_are_recorded_on_the_inlined_graph(self) -> None:
+        failed = []
+        for multithreaded in (True, False):
+            with self.subTest(multithreaded=multithreaded):
+                failed.clear()
+                config = execution.RunConfig(
+                    dag_inline_subgraphs=True,
+                    dag_layers_multithreaded=multithreaded,
+                    dag_layers_fail_fast=True,
+                    exception_hooks=[lambda _, run, __: failed.append(run)],
+                )
+                with self.assertRaises(ValueError):
+                    dag.Macro(_nested_problem.flowrep_recipe, "m").run(config, x=1)
+                (inner,) = failed[0].steps
+                self.assertEqual(inner.status, execution.RunStatus.FAILED)
+                self.assertIsInstance(inner.exception, ValueError)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -14,7 +14,14 @@ from concurrent import futures
 
 from unit import _fixtures
 
-from pyiron_workflow import atomic_node, dag, datatypes, execution
+from pyiron_workflow import (
+    atomic_node,
+    dag,
+    datatypes,
+    execution,
+    folding,
+    workflow_node,
+)
 
 
 class TestPort(unittest.TestCase):
@@ -206,6 +213,102 @@ class TestNodeRun(unittest.TestCase):
         self.assertEqual(run.outputs[out_label], 3)
 
 
+def _partly_constant_workflow() -> workflow_node.Workflow:
+    """`multiply_with_defaults() -> add <- wf.y`, whose first child folds."""
+    wf = workflow_node.Workflow("partly_constant")
+    wf.create_input("y")
+    wf.create_output("z")
+    wf.m = _fixtures.multiply_with_defaults
+    wf.m()
+    wf.a = _fixtures.add
+    wf.connect(wf.m.outputs["output_0"], wf.a.inputs["x"])
+    wf.connect(wf.inputs["y"], wf.a.inputs["y"])
+    wf.connect(wf.a.outputs["output_0"], wf.outputs["z"])
+    return wf
+
+
+class TestConcurrentRuns(unittest.TestCase):
+    """One node instance run from many threads at once, as a service would."""
+
+    def _assert_isolated(self, make_node, inputs, config=None):
+        expected = [dict(make_node().run(**kw).outputs) for kw in inputs]
+        shared = make_node()
+        with futures.ThreadPoolExecutor(max_workers=16) as exe:
+            runs = list(exe.map(lambda kw: shared.run(config, **kw), inputs))
+        self.assertListEqual([dict(r.outputs) for r in runs], expected)
+        self.assertTrue(all(r.status == execution.RunStatus.FINISHED for r in runs))
+        self.assertIn(shared.last_run, runs, msg="The last run to finish is kept")
+
+    def test_graphs(self):
+        cases = {
+            "macro": (
+                _fixtures.macro_node,
+                [{"x": i, "y": 2 * i, "z": -i} for i in range(32)],
+            ),
+            "for-each": (
+                _fixtures.foreach_node,
+                [{"xs": list(range(i % 5)), "y": i} for i in range(32)],
+            ),
+            "if": (_fixtures.if_abs_node, [{"x": i - 16} for i in range(32)]),
+            "while": (
+                _fixtures.while_countdown_node,
+                [{"n": i % 6} for i in range(32)],
+            ),
+            "try": (
+                _fixtures.try_safe_divide_node,
+                [{"x": i, "y": i % 3} for i in range(32)],
+            ),
+        }
+        for label, (make_node, inputs) in cases.items():
+            with self.subTest(label):
+                self._assert_isolated(make_node, inputs)
+
+    def test_with_config(self):
+        nested = [{"x": i, "y": -i} for i in range(32)]
+        cases = {
+            "fused and pruned": (
+                _fixtures.nested_macro_node,
+                nested,
+                execution.RunConfig(dag_fuse_chains=True, dag_prune_to_outputs=True),
+            ),
+            "inlined": (
+                _fixtures.nested_macro_node,
+                nested,
+                execution.RunConfig(dag_inline_subgraphs=True),
+            ),
+            "speculative": (
+                _fixtures.if_abs_node,
+                [{"x": i - 16} for i in range(32)],
+                execution.RunConfig(if_speculative=True),
+            ),
+            "constant cache": (
+                _partly_constant_workflow,
+                [{"y": i} for i in range(32)],
+                execution.RunConfig(constant_cache=folding.ConstantCache()),
+            ),
+        }
+        for label, (make_node, inputs, config) in cases.items():
+            with self.subTest(label):
+                self._assert_isolated(make_node, inputs, config)
+
+    def test_failures_stay_with_their_run(self):
+        shared = atomic_node.Atomic(_fixtures.divide.flowrep_recipe, "divide")
+
+        def run(y):
+            try:
+                return shared.run(x=12, y=y).outputs["output_0"]
+            except ZeroDivisionError as e:
+                return e
+
+        with futures.ThreadPoolExecutor(max_workers=16) as exe:
+            results = list(exe.map(run, [i % 4 for i in range(32)]))
+        for i, result in enumerate(results):
+            if i % 4 == 0:
+                self.assertIsInstance(result, ZeroDivisionError)
+            else:
+                self.assertEqual(result, 12 / (i % 4))
+
+
 class TestNodeGetState(unittest.TestCase):
     def test_owner_present_records_last_detached_path(self):
         m = _fixtures.macro_node()
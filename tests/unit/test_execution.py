@@ -3,9 +3,13 @@ from __future__ import annotations
 import datetime
 import logging
 import multiprocessing
+import os
 import pathlib
+import pickle
+import sys
 import tempfile
 import threading
+import time
 import unittest
 from concurrent import futures
 from typing import Any
@@ -13,7 +17,15 @@ from typing import Any
 import flowrep as fr
 from unit import _fixtures
 
-from pyiron_workflow import atomic_node, execution
+from pyiron_workflow import (
+    atomic_node,
+    constructors,
+    execution,
+    history,
+    lexical,
+    templates,
+    workflow_node,
+)
 
 try:
     import fleche  # noqa: F401
@@ -62,6 +74,61 @@ class PlainClass:
         self.x = x
 
 
+_FLAKY_CALLS: list[int] = []
+
+
+def flaky_add(x, y, failures=2):
+    """Raise `ConnectionError` on the first `failures` calls since the last reset."""
+    _FLAKY_CALLS.append(x)
+    if len(_FLAKY_CALLS) <= failures:
+        raise ConnectionError("transient")
+    return x + y
+
+
+def fails_on_main_thread(x):
+    if threading.current_thread() is threading.main_thread():
+        raise ConnectionError("main thread is preempted")
+    return x
+
+
+def sleepy(x, seconds=0.3, pid_file=None):
+    if pid_file is not None:
+        pathlib.Path(pid_file).write_text(str(os.getpid()))
+    time.sleep(seconds)
+    return x
+
+
+def reciprocal(x):
+    y = 1 / x
+    return y
+
+
+def mark_warm():
+    os.environ["PYIRON_WORKFLOW_TEST_WARM"] = "1"
+
+
+def warm_state():
+    return "colorsys" in sys.modules, os.environ.get("PYIRON_WORKFLOW_TEST_WARM")
+
+
+@fr.workflow
+def sleepy_chain(x):
+    first = sleepy(x)
+    second = sleepy(first)
+    return second
+
+
+def process_id(x):
+    return os.getpid()
+
+
+@fr.workflow
+def process_ids(x):
+    a = process_id(x)
+    b = process_id(x)
+    return a, b
+
+
 # --------------------------------------------------------------------------- #
 # Run.duration                                                                #
 # --------------------------------------------------------------------------- #
@@ -265,6 +332,79 @@ class TestExecutorInstructions(unittest.TestCase):
                     msg="Only process pools understand mp_context",
                 )
 
+    def test_preload_and_warm_up_become_the_initializer(self) -> None:
+        instructions = execution.ExecutorInstructions(
+            constructor=futures.ProcessPoolExecutor,
+            kwargs={"initializer": print, "initargs": ["hi"]},
+            preload=("colorsys",),
+            warm_up=(mark_warm,),
+        )
+        resolved = instructions._resolved_kwargs()
+        self.assertIs(resolved["initializer"], execution._warm_worker)
+        self.assertEqual(
+            resolved["initargs"],
+            (("colorsys",), (mark_warm,), print, ("hi",)),
+            msg="The caller's own initializer should still run, after the warm-up",
+        )
+        self.assertIs(instructions.kwargs["initializer"], print)
+
+    def test_workers_start_warm(self) -> None:
+        instructions = execution.ExecutorInstructions(
+            constructor=futures.ProcessPoolExecutor,
+            kwargs={"max_workers": 1},
+            preload=("colorsys",),
+            warm_up=(mark_warm,),
+        )
+        with instructions.instantiate() as exe:
+            self.assertEqual(exe.submit(warm_state).result(), (True, "1"))
+
+    def test_interpreter_pool(self) -> None:
+        instructions = execution.ExecutorInstructions.interpreter_pool(2)
+        self.assertEqual(instructions.kwargs, {"max_workers": 2})
+        if execution._interpreters_usable():
+            self.assertIs(instructions.constructor, futures.InterpreterPoolExecutor)
+            self.assertNotIn("mp_context", instructions._resolved_kwargs())
+        else:
+            self.assertIs(
+                instructions.constructor,
+                futures.ProcessPoolExecutor,
+                msg="Without interpreter pools, fall back to processes",
+            )
+            self.assertEqual(instructions.start_method, "forkserver")
+        self.assertEqual(
+            instructions.preload,
+            ("pyiron_workflow.execution",),
+            msg="Workers should start ready to evaluate nodes",
+        )
+
+    @unittest.skipUnless(
+        sys.version_info >= (3, 14), "Interpreter pools are new in python 3.14"
+    )
+    def test_interpreter_pool_workers_share_our_process(self) -> None:
+        instructions = execution.ExecutorInstructions(
+            futures.InterpreterPoolExecutor,
+            kwargs={"max_workers": 1},
+            preload=("colorsys",),
+        )
+        self.assertNotIn("mp_context", instructions._resolved_kwargs())
+        with instructions.instantiate() as exe:
+            self.assertIsInstance(exe, futures.InterpreterPoolExecutor)
+            self.assertEqual(exe.submit(os.getpid).result(), os.getpid())
+
+    @unittest.skipUnless(
+        sys.version_info >= (3, 14), "Interpreter pools are new in python 3.14"
+    )
+    def test_nodes_run_on_interpreter_pools(self) -> None:
+        if not execution._interpreters_usable():
+            self.skipTest("The stack can't be imported into subinterpreters")
+        node = _fixtures.macro_node()
+        node.executor = execution.ExecutorInstructions.interpreter_pool(1)
+        run = _fixtures.run_or_fail(self, node, x=1, y=2, z=3)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertDictEqual(
+            dict(run.outputs), dict(_fixtures.macro_node().run(x=1, y=2, z=3).outputs)
+        )
+
     def test_instantiate_returns_fresh_instance_per_call(self) -> None:
         instructions = execution.ExecutorInstructions(
             constructor=futures.ThreadPoolExecutor,
@@ -541,6 +681,465 @@ class TestRunExecutorBranches(unittest.TestCase):
         self.assertIn(node.lexical_path, str(ctx.exception))
 
 
+class TestRunWorkerPool(unittest.TestCase):
+    def test_requires_multithreaded_layers(self) -> None:
+        with self.assertRaises(ValueError):
+            execution.RunConfig(
+                dag_layers_interpreters=True, dag_layers_multithreaded=False
+            )
+
+    def test_atomic_nodes_go_to_the_pool(self) -> None:
+        node = constructors.node(process_ids)
+        node.nodes["process_id_0"].executor = futures.ThreadPoolExecutor(1)
+        config = execution.RunConfig(
+            dag_layers_interpreters=True, dag_layers_max_threads=2
+        )
+        try:
+            run = node.run(config, x=0)
+        finally:
+            node.nodes["process_id_0"].executor.shutdown()
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertEqual(
+            run.outputs.a, os.getpid(), msg="Nodes keep their own executors"
+        )
+        if execution._interpreters_usable():
+            self.assertEqual(
+                run.outputs.b, os.getpid(), msg="Subinterpreters share our process"
+            )
+        else:
+            self.assertNotEqual(run.outputs.b, os.getpid())
+
+    def test_pool_lifecycle(self) -> None:
+        pool = execution.WorkerPool(1)
+        self.assertIsNone(pool._executor, msg="Started on first use")
+        executor = pool.executor
+        self.assertIs(pool.executor, executor)
+        copy = pickle.loads(pickle.dumps(pool))
+        self.assertEqual(copy.max_workers, 1)
+        self.assertIsNone(copy.executor, msg="Copies are closed")
+        pool.shutdown()
+        self.assertIsNone(pool.executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(os.getpid)
+
+
+class TestRunSlimTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = execution.RunConfig(
+            run_dir=pathlib.Path(self.tmp.name), slim_transport=True
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_full_transport_by_default(self) -> None:
+        node = _fixtures.atomic_add_node()
+        with futures.ThreadPoolExecutor(max_workers=1) as exe:
+            node.executor = exe
+            run = execution.run(node, None, x=1, y=2)
+        self.assertEqual(run.outputs.output_0, 3)
+        self.assertIsNone(run.transport)
+
+    def test_slim_transport_reports_bytes_per_direction(self) -> None:
+        for executor in (
+            execution.ExecutorInstructions(futures.ProcessPoolExecutor),
+            execution.ExecutorInstructions(futures.ThreadPoolExecutor),
+        ):
+            with self.subTest(executor=executor.constructor.__name__):
+                node = _fixtures.atomic_add_node()
+                node.executor = executor
+                run = execution.run(node, self.config, x=1, y=2)
+                self.assertEqual(run.status, execution.RunStatus.FINISHED)
+                self.assertEqual(run.outputs.output_0, 3)
+                self.assertGreater(run.transport.sent, 0)
+                self.assertGreater(run.transport.received, 0)
+                self.assertLessEqual(run.transport.evaluating, run.duration)
+
+    def test_slim_failure_is_raised(self) -> None:
+        node = constructors.node(reciprocal)
+        with futures.ThreadPoolExecutor(max_workers=1) as exe:
+            node.executor = exe
+            with self.assertRaises(ZeroDivisionError):
+                execution.run(node, self.config, x=0)
+
+    def test_shared_memory_requires_slim_transport(self) -> None:
+        with self.assertRaises(ValueError):
+            execution.RunConfig(shared_memory_threshold=1024)
+
+    def test_large_buffers_go_through_shared_memory(self) -> None:
+        config = execution.RunConfig(
+            run_dir=pathlib.Path(self.tmp.name),
+            slim_transport=True,
+            shared_memory_threshold=1024,
+        )
+        data = _fixtures.Blob(bytes(range(256)) * 64)
+        for executor in (
+            execution.ExecutorInstructions(futures.ProcessPoolExecutor),
+            execution.ExecutorInstructions(futures.ThreadPoolExecutor),
+        ):
+            with self.subTest(executor=executor.constructor.__name__):
+                node = constructors.node(_fixtures.reverse_blob)
+                node.executor = executor
+                run = execution.run(node, config, data=data)
+                self.assertEqual(run.status, execution.RunStatus.FINISHED)
+                self.assertEqual(run.outputs.reversed_data, data[::-1])
+                self.assertEqual(run.transport.shared_sent, len(data))
+                self.assertEqual(run.transport.shared_received, len(data))
+                self.assertLess(run.transport.sent, len(data))
+
+        small = execution.run(
+            constructors.node(_fixtures.reverse_blob),
+            config,
+            data=_fixtures.Blob(b"abc"),
+        )
+        self.assertEqual(small.outputs.reversed_data, b"cba")
+
+    def test_recipe_cache_requires_slim_transport(self) -> None:
+        with self.assertRaises(ValueError):
+            execution.RunConfig(slim_recipe_cache=True)
+
+    def test_recipe_cache_sends_recipes_once_per_executor(self) -> None:
+        config = execution.RunConfig(
+            run_dir=pathlib.Path(self.tmp.name),
+            slim_transport=True,
+            slim_recipe_cache=True,
+        )
+        templates.resident().clear()
+        with futures.ThreadPoolExecutor(max_workers=1) as exe:
+            runs = []
+            for x in range(3):
+                node = _fixtures.atomic_add_node()
+                node.executor = exe
+                runs.append(execution.run(node, config, x=x, y=2))
+        self.assertEqual([run.outputs.output_0 for run in runs], [2, 3, 4])
+        self.assertEqual(len(templates.resident()), 1)
+        self.assertLess(runs[1].transport.sent, runs[0].transport.sent)
+        self.assertEqual(runs[1].transport.sent, runs[2].transport.sent)
+
+    def test_recipe_cache_resends_on_worker_miss(self) -> None:
+        config = execution.RunConfig(
+            run_dir=pathlib.Path(self.tmp.name),
+            slim_transport=True,
+            slim_recipe_cache=True,
+        )
+        with futures.ThreadPoolExecutor(max_workers=1) as exe:
+            node = _fixtures.atomic_add_node()
+            node.executor = exe
+            first = execution.run(node, config, x=1, y=2)
+            templates.resident().clear()
+            node = _fixtures.atomic_add_node()
+            node.executor = exe
+            missed = execution.run(node, config, x=2, y=2)
+        self.assertEqual(missed.status, execution.RunStatus.FINISHED)
+        self.assertEqual(missed.outputs.output_0, 4)
+        self.assertGreater(missed.transport.sent, first.transport.sent)
+
+    def test_composites_use_the_full_transport(self) -> None:
+        wf = _fixtures.grouping_wf()
+        with futures.ThreadPoolExecutor(max_workers=1) as exe:
+            wf.executor = exe
+            run = execution.run(wf, self.config, x=1, y=2, z=4)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertIsNone(run.transport)
+        self.assertGreater(len(run.steps), 0)
+
+
+# --------------------------------------------------------------------------- #
+# RetryPolicy                                                                 #
+# --------------------------------------------------------------------------- #
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_rejects_zero_attempts(self) -> None:
+        with self.assertRaises(ValueError):
+            execution.RetryPolicy(max_attempts=0)
+
+    def test_rejects_negative_backoff(self) -> None:
+        with self.assertRaises(ValueError):
+            execution.RetryPolicy(backoff=-1)
+
+    def test_exponential_delay_with_cap(self) -> None:
+        policy = execution.RetryPolicy(backoff=1, backoff_factor=2, max_backoff=3)
+        self.assertEqual([policy.delay(a) for a in (1, 2, 3)], [1, 2, 3])
+
+    def test_retries_respects_filter_and_budget(self) -> None:
+        policy = execution.RetryPolicy(max_attempts=2, exceptions=(ConnectionError,))
+        self.assertTrue(policy.retries(ConnectionError(), 1))
+        self.assertFalse(policy.retries(ConnectionError(), 2), msg="Out of attempts")
+        self.assertFalse(policy.retries(ValueError(), 1), msg="Filtered out")
+        self.assertFalse(
+            policy.retries(KeyboardInterrupt(), 1),
+            msg="Only ordinary exceptions are ever retried",
+        )
+
+
+class TestRunRetries(unittest.TestCase):
+    def setUp(self) -> None:
+        _FLAKY_CALLS.clear()
+        self.node = constructors.atomictype2node(flaky_add)
+
+    def test_transient_failures_are_retried(self) -> None:
+        self.node.retry = execution.RetryPolicy(max_attempts=3)
+        run = execution.run(self.node, None, x=1, y=2)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertEqual(run.outputs.output_0, 3)
+        self.assertIsNone(run.exception)
+        self.assertEqual(
+            [type(a.exception) for a in run.attempts],
+            [ConnectionError, ConnectionError, type(None)],
+            msg="Every attempt is recorded, including the successful one",
+        )
+
+    def test_exhausted_attempts_raise_last_exception(self) -> None:
+        self.node.retry = execution.RetryPolicy(max_attempts=2)
+        with self.assertRaises(ConnectionError):
+            self.node.run(x=1, y=2)
+        self.assertIsNone(self.node.last_run)
+        self.assertEqual(len(_FLAKY_CALLS), 2)
+
+    def test_unmatched_exceptions_are_not_retried(self) -> None:
+        self.node.retry = execution.RetryPolicy(exceptions=(MemoryError,))
+        with self.assertRaises(ConnectionError):
+            execution.run(self.node, None, x=1, y=2)
+        self.assertEqual(len(_FLAKY_CALLS), 1)
+
+    def test_no_policy_fails_immediately_without_attempt_records(self) -> None:
+        with self.assertRaises(ConnectionError):
+            execution.run(self.node, None, x=1, y=2)
+        self.assertEqual(len(_FLAKY_CALLS), 1)
+
+    def test_backoff_waits_between_attempts(self) -> None:
+        self.node.retry = execution.RetryPolicy(backoff=0.05, backoff_factor=2)
+        run = execution.run(self.node, None, x=1, y=2)
+        first, second, third = run.attempts
+        self.assertGreaterEqual(
+            (second.started_at - first.finished_at).total_seconds(), 0.05
+        )
+        self.assertGreaterEqual(
+            (third.started_at - second.finished_at).total_seconds(), 0.1
+        )
+
+    def test_fallback_executor_takes_over_retries(self) -> None:
+        node = constructors.atomictype2node(fails_on_main_thread)
+        with futures.ThreadPoolExecutor(max_workers=1) as fallback:
+            node.retry = execution.RetryPolicy(fallback_executor=fallback)
+            run = execution.run(node, None, x=42)
+        self.assertEqual(run.outputs.x, 42)
+        self.assertEqual([a.on_fallback for a in run.attempts], [False, True])
+
+    def test_retried_graph_keeps_only_final_attempt_state(self) -> None:
+        wf = workflow_node.Workflow("wf")
+        wf.create_input("x")
+        wf.create_input("y")
+        wf.create_output("z")
+        wf.flaky = flaky_add
+        wf.connect(wf.inputs["x"], wf.flaky.inputs["x"])
+        wf.connect(wf.inputs["y"], wf.flaky.inputs["y"])
+        wf.connect(wf.flaky, wf.outputs["z"])
+        wf.retry = execution.RetryPolicy(max_attempts=3)
+        run = wf.run(x=1, y=2)
+        self.assertEqual(run.outputs.z, 3)
+        self.assertEqual(len(run.attempts), 3)
+        self.assertEqual(
+            [step.status for step in run.steps],
+            [execution.RunStatus.FINISHED],
+            msg="Children of failed attempts are discarded along with the attempt",
+        )
+
+    def test_policy_survives_copy_and_drops_live_fallback_on_pickle(self) -> None:
+        with futures.ThreadPoolExecutor(max_workers=1) as fallback:
+            self.node.retry = execution.RetryPolicy(fallback_executor=fallback)
+            self.assertIs(self.node.copy().retry, self.node.retry)
+            restored = pickle.loads(pickle.dumps(self.node))
+        self.assertEqual(restored.retry.max_attempts, self.node.retry.max_attempts)
+        self.assertIsNone(restored.retry.fallback_executor)
+
+
+# --------------------------------------------------------------------------- #
+# Cancellation                                                                #
+# --------------------------------------------------------------------------- #
+
+
+class TestCancellationScope(unittest.TestCase):
+    def test_cancelling_a_parent_cancels_children_but_not_vice_versa(self) -> None:
+        parent = execution.CancellationScope()
+        child = execution.CancellationScope(parent)
+        child.cancel()
+        self.assertTrue(child.cancelled)
+        self.assertFalse(parent.cancelled)
+        sibling = execution.CancellationScope(parent)
+        parent.cancel()
+        self.assertTrue(sibling.cancelled)
+
+    def test_pickling_keeps_a_snapshot_of_the_flag(self) -> None:
+        parent = execution.CancellationScope()
+        child = execution.CancellationScope(parent)
+        self.assertFalse(pickle.loads(pickle.dumps(child)).cancelled)
+        parent.cancel()
+        restored = pickle.loads(pickle.dumps(child))
+        self.assertTrue(restored.cancelled)
+        self.assertIsNone(restored.parent)
+
+
+class TestRunCancellation(unittest.TestCase):
+    def test_cancelled_scope_skips_evaluation(self) -> None:
+        scope = execution.CancellationScope()
+        scope.cancel()
+        node = _fixtures.atomic_add_node()
+        run = execution.Run(
+            lexical_path=node.lexical_path,
+            result=node.generate_flowrep_live_node(),
+            status=execution.RunStatus.PENDING,
+        )
+        config = execution.RunConfig(_cancellation=scope)
+        with self.assertRaises(execution.RunCancelledError):
+            execution.run(node, config, run, x=1, y=2)
+        self.assertEqual(run.status, execution.RunStatus.CANCELLED)
+        self.assertIs(run.result.output_ports["output_0"].value, fr.schemas.NOT_DATA)
+
+    def test_waiting_on_executor_is_abandoned_and_future_cancelled(self) -> None:
+        scope = execution.CancellationScope()
+        config = execution.RunConfig(_cancellation=scope)
+        node = _fixtures.atomic_add_node()
+        run = execution.Run(
+            lexical_path=node.lexical_path,
+            result=node.generate_flowrep_live_node(),
+            status=execution.RunStatus.PENDING,
+        )
+        release = threading.Event()
+        with futures.ThreadPoolExecutor(max_workers=1) as exe:
+            exe.submit(release.wait)  # Keep our node queued
+            node.executor = exe
+            threading.Timer(0.1, scope.cancel).start()
+            with self.assertRaises(execution.RunCancelledError):
+                execution.run(node, config, run, x=1, y=2)
+            release.set()
+        self.assertEqual(run.status, execution.RunStatus.CANCELLED)
+        self.assertIs(
+            run.result.output_ports["output_0"].value,
+            fr.schemas.NOT_DATA,
+            msg="The queued (same-process) evaluation never ran",
+        )
+
+    def test_cancellation_is_never_retried(self) -> None:
+        scope = execution.CancellationScope()
+        scope.cancel()
+        node = constructors.atomictype2node(flaky_add)
+        node.retry = execution.RetryPolicy(exceptions=(BaseException,))
+        _FLAKY_CALLS.clear()
+        with self.assertRaises(execution.RunCancelledError):
+            execution.run(node, execution.RunConfig(_cancellation=scope), x=1, y=2)
+        self.assertEqual(_FLAKY_CALLS, [])
+
+
+# --------------------------------------------------------------------------- #
+# Timeouts                                                                    #
+# --------------------------------------------------------------------------- #
+
+
+class TestRunTimeouts(unittest.TestCase):
+    def setUp(self) -> None:
+        self.node = constructors.atomictype2node(sleepy)
+
+    def _run_and_capture(self, node, **input_data) -> execution.Run:
+        captured = []
+        config = execution.RunConfig(
+            exception_hooks=[lambda _, failed_run, __: captured.append(failed_run)]
+        )
+        with self.assertRaises(execution.NodeTimeoutError):
+            execution.run(node, config, **input_data)
+        return captured[0]
+
+    def test_in_process_atomic_is_abandoned(self) -> None:
+        self.node.timeout = 0.05
+        start = time.perf_counter()
+        failed = self._run_and_capture(self.node, x=1, seconds=0.3)
+        self.assertLess(time.perf_counter() - start, 0.3)
+        self.assertEqual(failed.status, execution.RunStatus.TIMED_OUT)
+        time.sleep(0.4)  # Let the abandoned thread finish
+        self.assertIs(
+            failed.result.output_ports["x"].value,
+            fr.schemas.NOT_DATA,
+            msg="The abandoned evaluation must not write into the timed-out run",
+        )
+
+    def test_in_process_atomic_within_timeout_finishes(self) -> None:
+        self.node.timeout = 5
+        run = execution.run(self.node, None, x=1, seconds=0)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertEqual(run.outputs.x, 1)
+
+    def test_in_process_composite_stops_starting_children(self) -> None:
+        macro = constructors.recipe2node(sleepy_chain.flowrep_recipe, "chain")
+        macro.timeout = 0.1
+        failed = self._run_and_capture(macro, x=1)
+        self.assertEqual(failed.status, execution.RunStatus.TIMED_OUT)
+        self.assertEqual(
+            [step.status for step in failed.steps],
+            [execution.RunStatus.FINISHED, execution.RunStatus.CANCELLED],
+        )
+
+    def test_executor_backed_node_times_out(self) -> None:
+        self.node.executor = execution.ExecutorInstructions(
+            constructor=futures.ThreadPoolExecutor,
+            kwargs={"max_workers": 1},
+        )
+        self.node.timeout = 0.05
+        failed = self._run_and_capture(self.node, x=1, seconds=0.3)
+        self.assertEqual(failed.status, execution.RunStatus.TIMED_OUT)
+
+    def test_abandoned_process_pool_workers_are_terminated(self) -> None:
+        exe = futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = pathlib.Path(tmp) / "pid"
+            exe.submit(sleepy, 1, 60, str(pid_file))
+            for _ in range(600):
+                if pid_file.exists() and pid_file.read_text():
+                    break
+                time.sleep(0.05)
+            pid = int(pid_file.read_text())
+        execution._abandon(exe)
+        for _ in range(100):
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:  # pragma: no cover
+            self.fail("The abandoned worker process is still alive")
+
+    def test_only_the_timed_out_node_is_marked(self) -> None:
+        wf = workflow_node.Workflow("wf")
+        wf.create_input("x")
+        wf.create_output("y")
+        wf.slow = sleepy
+        wf.slow.timeout = 0.05
+        wf.connect(wf.inputs["x"], wf.slow.inputs["x"])
+        wf.connect(wf.slow, wf.outputs["y"])
+        failed = self._run_and_capture(wf, x=1)
+        self.assertEqual(failed.status, execution.RunStatus.FAILED)
+        self.assertEqual(failed.steps[0].status, execution.RunStatus.TIMED_OUT)
+
+    def test_timeout_is_retryable(self) -> None:
+        self.node.timeout = 0.05
+        self.node.retry = execution.RetryPolicy(
+            max_attempts=2, exceptions=(TimeoutError,)
+        )
+        with self.assertRaises(execution.NodeTimeoutError):
+            execution.run(self.node, None, x=1, seconds=0.3)
+
+    def test_error_pickles(self) -> None:
+        error = execution.NodeTimeoutError(lexical.LexicalPath("a", "b"), 1.5)
+        restored = pickle.loads(pickle.dumps(error))
+        self.assertEqual(
+            (restored.lexical_path, restored.timeout, str(restored)),
+            (error.lexical_path, error.timeout, str(error)),
+        )
+
+
 # --------------------------------------------------------------------------- #
 # run() — progress hooks                                                      #
 # --------------------------------------------------------------------------- #
@@ -734,6 +1333,37 @@ class TestProgressHookDispatch(unittest.TestCase):
             execution._shutdown_hook_pool()  # ensure the worker finished logging
         self.assertTrue(any("kaboom" in line for line in cm.output))
 
+    def test_eta_only_passed_to_hooks_asking_for_it(self) -> None:
+        seen: list[tuple] = []
+        config = execution.RunConfig(
+            progress_hooks=[
+                execution.ProgressHook(lambda *a, **kw: seen.append((a, kw)), True),
+                execution.ProgressHook(
+                    lambda *a, **kw: seen.append((a, kw)), True, eta=True
+                ),
+            ]
+        )
+        self._emit(config)
+        self.assertEqual([kw for _, kw in seen], [{}, {"eta": None}])
+
+    def test_eta_counts_down_to_zero_over_a_run(self) -> None:
+        etas: dict[str, list[float]] = {}
+
+        def record_eta(_, __, lexical_path, status, eta):
+            etas.setdefault(lexical_path, []).append(eta)
+
+        macro = _fixtures.macro_node()
+        with tempfile.TemporaryDirectory() as tmp:
+            durations = history.DurationHistory(tmp)
+            config = execution.RunConfig(
+                dag_layers_multithreaded=False,
+                duration_history=durations,
+                progress_hooks=[execution.ProgressHook(record_eta, True, eta=True)],
+            )
+            macro.run(config, x=1, y=2, z=3)
+        self.assertGreater(etas[macro.lexical_path][0], 0)
+        self.assertEqual(etas[macro.lexical_path][-1], 0)
+
 
 # --------------------------------------------------------------------------- #
 # run() — non-blocking hooks do not stall the run thread                      #
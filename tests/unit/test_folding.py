@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import pickle
+import unittest
+
+from pyiron_workflow import execution, folding, workflow_node
+
+_CALLS: list[str] = []
+
+
+def counted(x, y=1):
+    _CALLS.append("counted")
+    z = x + y
+    return z
+
+
+def _workflow(x: int = 1) -> workflow_node.Workflow:
+    """`const -> a -> b -> c <- wf.y`, with `b` also wired straight to an output."""
+    wf = workflow_node.Workflow("wf")
+    wf.create_input("y")
+    wf.create_output("folded", "live")
+    wf.a = counted
+    wf.a(x=x)
+    wf.b = counted
+    wf.connect(wf.a.outputs["z"], wf.b.inputs["x"])
+    wf.c = counted
+    wf.connect(wf.b.outputs["z"], wf.c.inputs["x"])
+    wf.connect(wf.inputs["y"], wf.c.inputs["y"])
+    wf.connect(wf.b.outputs["z"], wf.outputs["folded"])
+    wf.connect(wf.c.outputs["z"], wf.outputs["live"])
+    return wf
+
+
+def _nested_workflow(x: int = 1) -> workflow_node.Workflow:
+    """:func:`_workflow` as the only child of another workflow."""
+    wf = workflow_node.Workflow("outer")
+    wf.create_input("y")
+    wf.create_output("folded", "live")
+    wf.inner = _workflow(x)
+    wf.connect(wf.inputs["y"], wf.inner.inputs["y"])
+    wf.connect(wf.inner.outputs["folded"], wf.outputs["folded"])
+    wf.connect(wf.inner.outputs["live"], wf.outputs["live"])
+    return wf
+
+
+class TestConstantCache(unittest.TestCase):
+    def test_least_recently_used_entries_are_dropped(self) -> None:
+        cache = folding.ConstantCache(maxsize=2)
+        cache.put("a", {"z": 1})
+        cache.put("b", {"z": 2})
+        cache.get("a")
+        cache.put("c", {"z": 3})
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_pickle_gives_fresh_empty_cache(self) -> None:
+        cache = folding.ConstantCache(maxsize=3)
+        cache.put("a", {"z": 1})
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(len(restored), 0)
+        self.assertEqual(restored.maxsize, 3)
+
+
+class TestConstantKeys(unittest.TestCase):
+    def test_only_constant_dependent_children_get_keys(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        self.assertEqual(
+            sorted(folding.constant_keys(data)), ["a", "a_x_constant_0", "b"]
+        )
+
+    def test_keys_follow_upstream_constants(self) -> None:
+        keys = folding.constant_keys(_workflow(1).generate_flowrep_live_node())
+        same = folding.constant_keys(_workflow(1).generate_flowrep_live_node())
+        other = folding.constant_keys(_workflow(2).generate_flowrep_live_node())
+        self.assertEqual(keys, same)
+        self.assertNotEqual(keys["b"], other["b"])
+
+    def test_keys_follow_defaults(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        keys = folding.constant_keys(data)
+        data.nodes["a"].input_ports["y"].default = 2
+        other = folding.constant_keys(data)
+        self.assertNotEqual(keys["a"], other["a"])
+        self.assertNotEqual(keys["b"], other["b"])
+
+    def test_unpicklable_defaults_are_not_folded(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        data.nodes["a"].input_ports["y"].default = lambda: None
+        self.assertNotIn("a", folding.constant_keys(data))
+
+
+class TestFoldedRun(unittest.TestCase):
+    def setUp(self) -> None:
+        _CALLS.clear()
+        self.config = execution.RunConfig(constant_cache=folding.ConstantCache())
+
+    def test_nothing_folded_by_default(self) -> None:
+        wf = _workflow()
+        wf.run(y=1)
+        run = wf.run(y=1)
+        self.assertEqual(len(_CALLS), 6)
+        self.assertEqual(run.folded, [])
+
+    def test_constant_subgraph_is_evaluated_once(self) -> None:
+        first = _workflow().run(self.config, y=1)
+        self.assertEqual(len(_CALLS), 3)
+        self.assertEqual(first.folded, [])
+
+        second = _workflow().run(self.config, y=10)
+        self.assertEqual(len(_CALLS), 4, msg="Only the live child should rerun")
+        self.assertEqual(second.steps.labels, ["c"])
+        self.assertEqual(sorted(second.folded), ["a", "a_x_constant_0", "b"])
+        self.assertEqual(second.outputs.folded, first.outputs.folded)
+        self.assertEqual(second.outputs.live, 13)
+
+    def test_changed_constants_are_recomputed(self) -> None:
+        _workflow(1).run(self.config, y=1)
+        run = _workflow(2).run(self.config, y=1)
+        self.assertEqual(len(_CALLS), 6)
+        self.assertEqual(run.outputs.folded, 4)
+
+    def test_constants_of_inlined_graphs_are_folded(self) -> None:
+        cache = folding.ConstantCache()
+        config = execution.RunConfig(constant_cache=cache, dag_inline_subgraphs=True)
+        _nested_workflow().run(config, y=1)
+        self.assertEqual(len(_CALLS), 3)
+        self.assertEqual(len(cache), 2, msg="Constants themselves need no caching")
+
+        run = _nested_workflow().run(config, y=10)
+        self.assertEqual(len(_CALLS), 4, msg="Only the live child should rerun")
+        (inner,) = run.steps
+        self.assertEqual(inner.steps.labels, ["c"])
+        self.assertEqual(sorted(inner.folded), ["a", "a_x_constant_0", "b"])
+        self.assertEqual(dict(run.outputs), {"folded": 3, "live": 13})
+
+
+if __name__ == "__main__":
+    unittest.main()
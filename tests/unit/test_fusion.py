@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import unittest
+
+import flowrep as fr
+
+from pyiron_workflow import dag, execution, fusion, resources, workflow_node
+
+
+def double(x):
+    y = 2 * x
+    return y
+
+
+def fail_on_negative(x):
+    if x < 0:
+        raise ValueError("negative")
+    y = x
+    return y
+
+
+def _workflow() -> workflow_node.Workflow:
+    """
+    `x -> a -> b -> c -> out`, plus `c -> d` and `x -> e -> d`: `a-b-c` is a
+    chain, but `c` has two consumers and `d` two sibling sources.
+    """
+    wf = workflow_node.Workflow("wf")
+    wf.create_input("x")
+    wf.create_output("c", "d")
+    for label in "abcde":
+        setattr(wf, label, double)
+    wf.connect(wf.inputs["x"], wf.a.inputs["x"])
+    wf.connect(wf.a.outputs["y"], wf.b.inputs["x"])
+    wf.connect(wf.b.outputs["y"], wf.c.inputs["x"])
+    wf.connect(wf.inputs["x"], wf.e.inputs["x"])
+    wf.connect(wf.c.outputs["y"], wf.d.inputs["x"])
+    wf.connect(wf.c.outputs["y"], wf.outputs["c"])
+    wf.connect(wf.d.outputs["y"], wf.outputs["d"])
+    return wf
+
+
+class TestLinearChains(unittest.TestCase):
+    def test_chains_stop_at_fan_out_and_fan_in(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        self.assertEqual(fusion.linear_chains(data, data.nodes), [["a", "b", "c"]])
+
+    def test_only_candidates_are_chained(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        self.assertEqual(fusion.linear_chains(data, ["b", "c"]), [["b", "c"]])
+        self.assertEqual(fusion.linear_chains(data, ["a", "c"]), [])
+
+
+class TestFusedRun(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = execution.RunConfig(dag_fuse_chains=True)
+
+    def test_nothing_fused_by_default(self) -> None:
+        run = _workflow().run(x=1)
+        self.assertEqual(run.fused, [])
+        self.assertEqual(len(run.steps), 5)
+
+    def test_chains_are_evaluated(self) -> None:
+        for multithreaded in (True, False):
+            with self.subTest(multithreaded=multithreaded):
+                run = _workflow().run(
+                    execution.RunConfig(
+                        dag_fuse_chains=True, dag_layers_multithreaded=multithreaded
+                    ),
+                    x=1,
+                )
+                self.assertEqual(run.fused, [["a", "b", "c"]])
+                self.assertEqual(
+                    sorted(run.steps.labels),
+                    ["d", "e"],
+                    msg="Members are evaluated without steps of their own",
+                )
+                self.assertEqual(dict(run.outputs), {"c": 8, "d": 16})
+
+    def test_chains_are_scheduled_as_one_child(self) -> None:
+        wf = _workflow()
+        data = wf.generate_flowrep_live_node()
+        self.assertEqual(
+            dag.topo_sort_nodes(wf.nodes, data.edges),
+            [["a", "e"], ["b"], ["c"], ["d"]],
+        )
+        self.assertEqual(
+            dag.topo_sort_nodes(wf.nodes, data.edges, merged_into={"b": "a", "c": "a"}),
+            [["a", "e"], ["d"]],
+            msg="The chain's consumers should follow right after it",
+        )
+
+    def test_member_outputs_stay_on_the_live_data(self) -> None:
+        run = _workflow().run(self.config, x=1)
+        self.assertEqual(run.result.nodes["a"].input_ports["x"].value, 1)
+        self.assertEqual(run.result.nodes["b"].output_ports["y"].value, 4)
+
+    def test_member_progress_is_reported(self) -> None:
+        events = []
+        config = execution.RunConfig(
+            dag_fuse_chains=True,
+            progress_hooks=[
+                execution.ProgressHook(
+                    lambda _, __, path, status: events.append((path, status)),
+                    blocking=True,
+                )
+            ],
+        )
+        _workflow().run(config, x=1)
+        self.assertIn(("wf.b", execution.RunStatus.FINISHED), events)
+        self.assertNotIn(
+            ("wf.b", execution.RunStatus.RUNNING),
+            events,
+            msg="Members only report their completion",
+        )
+        self.assertIn(("wf.d", execution.RunStatus.RUNNING), events)
+
+    def test_members_missing_input_end_the_chain(self) -> None:
+        run = _workflow().run(self.config)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertIsInstance(run.outputs.c, fr.schemas.NotData)
+        self.assertIsInstance(
+            run.result.nodes["b"].output_ports["y"].value, fr.schemas.NotData
+        )
+
+    def test_special_nodes_are_not_fused(self) -> None:
+        wf = _workflow()
+        wf.b.resources = resources.Resources()
+        run = wf.run(self.config, x=1)
+        self.assertEqual(run.fused, [])
+
+    def test_failing_member_stops_the_chain(self) -> None:
+        wf = workflow_node.Workflow("wf")
+        wf.create_input("x")
+        wf.a = double
+        wf.b = fail_on_negative
+        wf.c = double
+        wf.connect(wf.inputs["x"], wf.a.inputs["x"])
+        wf.connect(wf.a.outputs["y"], wf.b.inputs["x"])
+        wf.connect(wf.b.outputs["y"], wf.c.inputs["x"])
+        failed = []
+        config = execution.RunConfig(
+            dag_fuse_chains=True,
+            exception_hooks=[lambda _, run, __: failed.append(run)],
+        )
+        with self.assertRaises(ValueError):
+            wf.run(config, x=-1)
+        (run,) = failed
+        self.assertEqual(run.fused, [["a", "b", "c"]])
+        self.assertEqual(run.steps.labels, ["b"])
+        self.assertEqual(run.steps[0].status, execution.RunStatus.FAILED)
+        self.assertIsInstance(run.steps[0].exception, ValueError)
+        self.assertIsInstance(
+            run.result.nodes["c"].output_ports["y"].value, fr.schemas.NotData
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
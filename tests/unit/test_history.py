@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import datetime
+import pickle
+import tempfile
+import unittest
+
+from unit import _fixtures
+
+from pyiron_workflow import history
+
+
+class TestRecipeKey(unittest.TestCase):
+    def test_same_recipe_same_key(self) -> None:
+        self.assertEqual(
+            history.recipe_key(_fixtures.add.flowrep_recipe),
+            history.recipe_key(_fixtures.add.flowrep_recipe.model_copy(deep=True)),
+        )
+
+    def test_different_recipe_different_key(self) -> None:
+        self.assertNotEqual(
+            history.recipe_key(_fixtures.add.flowrep_recipe),
+            history.recipe_key(_fixtures.sub.flowrep_recipe),
+        )
+
+
+class TestInputSize(unittest.TestCase):
+    def test_size_features(self) -> None:
+        class _ArrayLike:
+            nbytes = 800
+
+        self.assertEqual(history.input_size([]), 0)
+        self.assertEqual(history.input_size([1, 2.0]), 2, msg="Scalars count once")
+        self.assertEqual(history.input_size([[1, 2, 3], "ab"]), 5)
+        self.assertEqual(history.input_size([_ArrayLike()]), 800)
+
+
+class TestDurationHistory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = history.DurationHistory(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_unknown_key_has_no_estimate(self) -> None:
+        self.assertIsNone(self.history.estimate("nope"))
+        self.assertFalse(self.history.path.exists(), msg="Reading creates nothing")
+
+    def test_estimate_is_median(self) -> None:
+        for seconds in (1.0, 2.0, 100.0):
+            self.history.record("k", seconds)
+        self.assertEqual(self.history.estimate("k"), 2.0)
+
+    def test_estimate_follows_size_trend(self) -> None:
+        for size in (10, 20, 30):
+            self.history.record("k", size / 10, size)
+        self.assertAlmostEqual(self.history.estimate("k", 100), 10.0)
+        self.assertEqual(self.history.estimate("k"), 2.0, msg="Median without size")
+
+    def test_estimate_needs_distinct_sizes_for_a_trend(self) -> None:
+        self.history.record("k", 1.0, 10)
+        self.history.record("k", 3.0, 10)
+        self.history.record("k", 5.0)
+        self.assertEqual(self.history.estimate("k", 1000), 3.0)
+
+    def test_estimate_is_never_negative(self) -> None:
+        self.history.record("k", 1.0, 10)
+        self.history.record("k", 2.0, 20)
+        self.assertEqual(self.history.estimate("k", 0), 0.0)
+
+    def test_records_persist_across_instances(self) -> None:
+        self.history.record("k", 1.5)
+        self.assertEqual(history.DurationHistory(self.tmp.name).durations("k"), [1.5])
+
+    def test_reload_sees_other_writers(self) -> None:
+        self.assertEqual(self.history.durations("k"), [])
+        history.DurationHistory(self.tmp.name).record("k", 3.0)
+        self.assertEqual(self.history.durations("k"), [], msg="Read once, lazily")
+        self.history.reload()
+        self.assertEqual(self.history.durations("k"), [3.0])
+
+    def test_partial_lines_are_skipped(self) -> None:
+        self.history.record("k", 1.0)
+        with self.history.path.open("a") as f:
+            f.write('{"key": "k", "sec')
+        self.assertEqual(history.DurationHistory(self.tmp.name).durations("k"), [1.0])
+
+    def test_pickle_points_at_same_store(self) -> None:
+        self.history.record("k", 1.0)
+        restored = pickle.loads(pickle.dumps(self.history))
+        self.assertEqual(restored.directory, self.history.directory)
+        self.assertEqual(restored.durations("k"), [1.0])
+
+
+class TestEtaTracker(unittest.TestCase):
+    def setUp(self) -> None:
+        # a (1 s) -> b (2 s), and c (1 s) on its own
+        self.tracker = history.EtaTracker(
+            ranks={"wf.a": 3.0, "wf.b": 2.0, "wf.c": 1.0},
+            durations={"wf.a": 1.0, "wf.b": 2.0, "wf.c": 1.0},
+        )
+        self.t0 = datetime.datetime(2000, 1, 1)
+
+    def _at(self, seconds: float) -> datetime.datetime:
+        return self.t0 + datetime.timedelta(seconds=seconds)
+
+    def test_eta_counts_down_along_the_critical_path(self) -> None:
+        self.assertEqual(self.tracker.update("wf", "running", self._at(0)), 3.0)
+        self.assertEqual(self.tracker.update("wf.a", "running", self._at(0)), 3.0)
+        self.assertEqual(self.tracker.update("wf.a.x", "running", self._at(0.5)), 2.5)
+        self.assertEqual(self.tracker.update("wf.a", "finished", self._at(1)), 2.0)
+        self.assertEqual(self.tracker.update("wf.b", "running", self._at(1)), 2.0)
+        self.assertEqual(
+            self.tracker.update("wf.b.x", "running", self._at(10)),
+            1.0,
+            msg="Overdue b is credited no more than its expected duration, so the "
+            "unstarted c now dominates",
+        )
+        self.tracker.update("wf.b", "finished", self._at(10))
+        self.assertEqual(self.tracker.update("wf.c", "failed", self._at(10)), 0.0)
+
+    def test_pickle_keeps_progress(self) -> None:
+        self.tracker.update("wf.a", "finished", self._at(1))
+        restored = pickle.loads(pickle.dumps(self.tracker))
+        self.assertEqual(restored.update("wf", "running", self._at(1)), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 import unittest
 
 import flowrep as fr
@@ -258,6 +260,197 @@ class TestEvaluateMultipleCases(unittest.TestCase):
         self.assertEqual(run.result.output_edges, {})
 
 
+# --------------------------------------------------------------------------- #
+# evaluate — speculative                                                      #
+# --------------------------------------------------------------------------- #
+
+
+@fr.atomic
+def _always_raises(n):
+    raise RuntimeError("speculative failure")
+    return n  # noqa: F841
+
+
+_RENDEZVOUS = threading.Barrier(2)
+
+
+@fr.atomic
+def _rendezvous_is_positive(n):
+    # Only returns if a second thread reaches the barrier too
+    _RENDEZVOUS.wait(timeout=5)
+    return n > 0
+
+
+@fr.atomic
+def _rendezvous_raises(n):
+    _RENDEZVOUS.wait(timeout=5)
+    raise RuntimeError("speculative failure")
+    return n  # noqa: F841
+
+
+_SLOW_BODY_STARTED = threading.Event()
+
+
+@fr.atomic
+def _is_positive_once_slow_body_started(n):
+    _SLOW_BODY_STARTED.wait(timeout=5)
+    return n > 0
+
+
+@fr.atomic
+def _slow_negate(x):
+    _SLOW_BODY_STARTED.set()
+    time.sleep(2)
+    return -x
+
+
+def _failing_condition_recipe(
+    failing_first: bool, rendezvous: bool = False
+) -> fr.schemas.IfRecipe:
+    """
+    Two cases where one condition always raises and the other is `is_positive`.
+
+    With `rendezvous`, both conditions block until the other one is running too.
+    """
+    good_condition, bad_condition = (
+        (_rendezvous_is_positive, _rendezvous_raises)
+        if rendezvous
+        else (_fixtures.is_positive, _always_raises)
+    )
+    good = fr.schemas.ConditionalCase(
+        condition=fr.schemas.LabeledRecipe(
+            label="cond_good", recipe=good_condition.flowrep_recipe
+        ),
+        body=fr.schemas.LabeledRecipe(
+            label="body_good", recipe=_fixtures.identity.flowrep_recipe
+        ),
+    )
+    bad = fr.schemas.ConditionalCase(
+        condition=fr.schemas.LabeledRecipe(
+            label="cond_bad", recipe=bad_condition.flowrep_recipe
+        ),
+        body=fr.schemas.LabeledRecipe(
+            label="body_bad", recipe=_fixtures.negate.flowrep_recipe
+        ),
+    )
+    return fr.schemas.IfRecipe(
+        inputs=["x"],
+        outputs=["out"],
+        cases=[bad, good] if failing_first else [good, bad],
+        input_edges={
+            fr.schemas.TargetHandle(node=label, port=port): fr.schemas.InputSource(
+                port="x"
+            )
+            for label, port in (
+                ("cond_good", "n"),
+                ("cond_bad", "n"),
+                ("body_good", "x"),
+                ("body_bad", "x"),
+            )
+        },
+        prospective_output_edges={
+            fr.schemas.OutputTarget(port="out"): [
+                fr.schemas.SourceHandle(node="body_good", port="x"),
+                fr.schemas.SourceHandle(node="body_bad", port="output_0"),
+            ],
+        },
+    )
+
+
+class TestEvaluateSpeculative(unittest.TestCase):
+    def setUp(self) -> None:
+        self.conditions_only = execution.RunConfig(if_speculative=True)
+        self.with_bodies = execution.RunConfig(
+            if_speculative=True, if_speculate_bodies=True
+        )
+
+    def _speculative_labels(self, run: execution.Run) -> set[str]:
+        return {step.label for step in run.steps if step.speculative}
+
+    def test_matches_sequential_outputs(self) -> None:
+        for x in (5, -5, 0):
+            for config in (self.conditions_only, self.with_bodies):
+                with self.subTest(x=x, bodies=config.if_speculate_bodies):
+                    sequential = ifflow.If(_two_case_recipe(True), "ifn").run(x=x)
+                    speculative = ifflow.If(_two_case_recipe(True), "ifn").run(
+                        config, x=x
+                    )
+                    self.assertEqual(speculative.status, execution.RunStatus.FINISHED)
+                    self.assertEqual(speculative.outputs.out, sequential.outputs.out)
+                    self.assertEqual(
+                        speculative.result.output_edges,
+                        sequential.result.output_edges,
+                    )
+
+    def test_later_conditions_marked_speculative(self) -> None:
+        run = ifflow.If(_two_case_recipe(True), "ifn").run(self.conditions_only, x=5)
+        self.assertEqual(run.outputs.out, 5)
+        self.assertTrue(
+            self._speculative_labels(run) <= {"cond_neg"},
+            msg="A later condition may be cancelled before it starts, but if it ran "
+            "it must be flagged; the committed path never is",
+        )
+
+    def test_conditions_evaluated_concurrently(self) -> None:
+        _RENDEZVOUS.reset()
+        ifn = ifflow.If(_failing_condition_recipe(False, rendezvous=True), "ifn")
+        run = ifn.run(self.conditions_only, x=5)
+        self.assertEqual(
+            run.outputs.out,
+            5,
+            msg="Sequential evaluation could never pass the two-party barrier",
+        )
+        self.assertEqual(self._speculative_labels(run), {"cond_bad"})
+
+    def test_uncommitted_bodies_marked_speculative(self) -> None:
+        run = ifflow.If(_two_case_recipe(True), "ifn").run(self.with_bodies, x=-5)
+        self.assertEqual(run.outputs.out, 5)
+        committed = {"cond_pos", "cond_neg", "body_neg"}
+        self.assertFalse(committed & self._speculative_labels(run))
+        self.assertTrue(
+            self._speculative_labels(run) <= {"body_pos", "else_body"},
+            msg="Bodies may be cancelled before they start, but any that ran and were "
+            "not committed must be flagged",
+        )
+
+    def test_discarded_bodies_are_not_waited_on(self) -> None:
+        _SLOW_BODY_STARTED.clear()
+        recipe = _two_case_recipe(True)
+        recipe.cases[0].condition = fr.schemas.LabeledRecipe(
+            label="cond_pos", recipe=_is_positive_once_slow_body_started.flowrep_recipe
+        )
+        recipe.cases[1].body = fr.schemas.LabeledRecipe(
+            label="body_neg", recipe=_slow_negate.flowrep_recipe
+        )
+        ifn = ifflow.If(recipe, "ifn")
+        start = time.perf_counter()
+        run = ifn.run(self.with_bodies, x=5)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(run.outputs.out, 5)
+        self.assertIn("body_neg", self._speculative_labels(run))
+        self.assertLess(
+            elapsed, 1, msg="The slow uncommitted body should be left running"
+        )
+
+    def test_no_case_and_no_else_commits_nothing(self) -> None:
+        run = ifflow.If(_two_case_recipe(False), "ifn").run(self.with_bodies, x=0)
+        self.assertIsInstance(run.outputs.out, fr.schemas.NotData)
+        self.assertEqual(run.result.output_edges, {})
+        self.assertTrue(self._speculative_labels(run) <= {"body_pos", "body_neg"})
+
+    def test_failure_after_committed_case_is_discarded(self) -> None:
+        ifn = ifflow.If(_failing_condition_recipe(failing_first=False), "ifn")
+        run = ifn.run(self.conditions_only, x=5)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertEqual(run.outputs.out, 5)
+        self.assertTrue(self._speculative_labels(run) <= {"cond_bad"})
+
+    def test_failure_before_committed_case_raises(self) -> None:
+        ifn = ifflow.If(_failing_condition_recipe(failing_first=True), "ifn")
+        with self.assertRaisesRegex(RuntimeError, "speculative failure"):
+            ifn.run(self.conditions_only, x=5)
+
+
 # --------------------------------------------------------------------------- #
 # Macro wrapping an If — downstream skip when no case fires                   #
 # --------------------------------------------------------------------------- #
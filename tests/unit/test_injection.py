@@ -5,7 +5,7 @@ import unittest
 
 from unit import _fixtures
 
-from pyiron_workflow import constructors, workflow_node
+from pyiron_workflow import constructors, injection, workflow_node
 
 
 def _only(mapping):
@@ -237,6 +237,63 @@ class TestPendingConnectionLifting(unittest.TestCase):
         self.assertEqual(5, outer.run(x=-7).outputs.out)
 
 
+def _expression_workflow():
+    wf = workflow_node.Workflow("expression")
+    for label in "abc":
+        wf.create_input(label)
+    wf.create_output("out")
+    wf.r = 2 - (wf.inputs.a + wf.inputs.b) * wf.inputs.c / 4
+    wf.connect(wf.r, wf.outputs.out)
+    return wf
+
+
+class TestFusedExpressions(unittest.TestCase):
+    def test_operator_tree_becomes_one_node(self):
+        unfused = _expression_workflow()
+        with injection.fused_expressions():
+            fused = _expression_workflow()
+        self.assertEqual(list(fused.r.inputs), list(unfused.r.inputs))
+        self.assertEqual(list(fused.r.outputs), list(unfused.r.outputs))
+        self.assertEqual(
+            len(fused.r.nodes), 2, msg="The expression node and its tree constant"
+        )
+        self.assertEqual(
+            fused.run(a=1, b=2, c=4).outputs.out,
+            unfused.run(a=1, b=2, c=4).outputs.out,
+        )
+
+    def test_unary_and_getitem_are_fused(self):
+        with injection.fused_expressions():
+            wf = workflow_node.Workflow("unary")
+            wf.create_input("a")
+            wf.create_output("out")
+            wf.r = -abs(wf.inputs.a[1])
+            wf.connect(wf.r, wf.outputs.out)
+        self.assertEqual(len(wf.r.nodes), 2)
+        self.assertEqual(-3, wf.run(a=[0, -3]).outputs.out)
+
+    def test_mode_can_be_switched_off_again(self):
+        with injection.fused_expressions(), injection.fused_expressions(False):
+            wf = _expression_workflow()
+        self.assertGreater(len(wf.r.nodes), 2)
+
+    def test_other_nodes_are_not_fused(self):
+        with injection.fused_expressions():
+            chained = (_new_node() * _new_node()) + 1
+        self.assertEqual(len(chained.nodes), 3)
+        self.assertEqual(
+            7,
+            chained.run(
+                plain_increment_mul_plain_increment_0_plain_increment_0_x=1,
+                plain_increment_mul_plain_increment_0_plain_increment_1_x=2,
+            ).outputs[_only(chained.outputs)],
+        )
+
+    def test_evaluate_expression(self):
+        tree = ["call", "sub", [["value", 10], ["call", "mul", [["operand", 0]] * 2]]]
+        self.assertEqual(1, injection.evaluate_expression(tree, 3))
+
+
 class TestInjectionFailures(unittest.TestCase):
     def test_cross_context_binary_direct(self):
         wf = workflow_node.Workflow("ctx_a")
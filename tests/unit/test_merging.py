@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import unittest
+
+from pyiron_workflow import execution, merging, workflow_node
+
+_CALLS: list[str] = []
+
+
+def increment(x, y=1):
+    _CALLS.append("increment")
+    z = x + y
+    return z
+
+
+def decrement(x, y=1):
+    _CALLS.append("decrement")
+    z = x - y
+    return z
+
+
+def _workflow() -> workflow_node.Workflow:
+    """
+    Two identical `increment` chains from the same input, and a look-alike that
+    differs only in its function.
+    """
+    wf = workflow_node.Workflow("wf")
+    wf.create_input("x")
+    wf.create_output("left", "right", "other")
+    for label in ("a", "b", "c", "d"):
+        setattr(wf, label, increment)
+    wf.e = decrement
+    for label in ("a", "b", "e"):
+        wf.connect(wf.inputs["x"], getattr(wf, label).inputs["x"])
+    wf.connect(wf.a.outputs["z"], wf.c.inputs["x"])
+    wf.connect(wf.b.outputs["z"], wf.d.inputs["x"])
+    wf.connect(wf.c.outputs["z"], wf.outputs["left"])
+    wf.connect(wf.d.outputs["z"], wf.outputs["right"])
+    wf.connect(wf.e.outputs["z"], wf.outputs["other"])
+    return wf
+
+
+class TestDuplicateAliases(unittest.TestCase):
+    def test_duplicates_map_to_first_label(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        self.assertEqual(
+            merging.duplicate_aliases(data, data.nodes), {"b": "a", "d": "c"}
+        )
+
+    def test_only_candidates_are_merged(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        self.assertEqual(
+            merging.duplicate_aliases(data, ["b", "c", "d"]),
+            {},
+            msg="Without `a`, `b` is unique, and so then are `c` and `d`",
+        )
+
+    def test_differently_evaluated_children_are_not_merged(self) -> None:
+        data = _workflow().generate_flowrep_live_node()
+        self.assertEqual(
+            merging.duplicate_aliases(data, data.nodes, {"b": "elsewhere"}),
+            {},
+            msg="`b` is evaluated differently to `a`, so `d` differs from `c` too",
+        )
+        self.assertEqual(
+            merging.duplicate_aliases(data, data.nodes, {"c": "x", "d": "x"}),
+            {"b": "a", "d": "c"},
+        )
+
+    def test_identical_constants_are_merged(self) -> None:
+        wf = workflow_node.Workflow("wf")
+        wf.a = increment
+        wf.a(x=1)
+        wf.b = increment
+        wf.b(x=1)
+        wf.c = increment
+        wf.c(x=2)
+        data = wf.generate_flowrep_live_node()
+        self.assertEqual(
+            merging.duplicate_aliases(data, data.nodes),
+            {"b": "a", "b_x_constant_0": "a_x_constant_0"},
+        )
+
+
+class TestMergedRun(unittest.TestCase):
+    def setUp(self) -> None:
+        _CALLS.clear()
+
+    def test_nothing_merged_by_default(self) -> None:
+        run = _workflow().run(x=1)
+        self.assertEqual(len(_CALLS), 5)
+        self.assertEqual(run.aliases, {})
+
+    def test_duplicates_are_evaluated_once(self) -> None:
+        for multithreaded in (True, False):
+            with self.subTest(multithreaded=multithreaded):
+                _CALLS.clear()
+                run = _workflow().run(
+                    execution.RunConfig(
+                        dag_merge_duplicates=True,
+                        dag_layers_multithreaded=multithreaded,
+                    ),
+                    x=1,
+                )
+                self.assertEqual(_CALLS.count("increment"), 2)
+                self.assertEqual(_CALLS.count("decrement"), 1)
+                self.assertEqual(run.aliases, {"b": "a", "d": "c"})
+                self.assertEqual(dict(run.outputs), {"left": 3, "right": 3, "other": 0})
+
+    def test_aliases_remain_addressable(self) -> None:
+        run = _workflow().run(execution.RunConfig(dag_merge_duplicates=True), x=1)
+        self.assertEqual(sorted(run.steps.labels), ["a", "b", "c", "d", "e"])
+        steps = {step.label: step for step in run.steps}
+        self.assertEqual(steps["b"].status, execution.RunStatus.FINISHED)
+        self.assertEqual(steps["b"].outputs.z, steps["a"].outputs.z)
+        self.assertEqual(steps["b"].result.input_ports["x"].value, 1)
+
+    def test_differently_evaluated_duplicates_are_kept(self) -> None:
+        wf = _workflow()
+        wf.b.timeout = 10
+        run = wf.run(execution.RunConfig(dag_merge_duplicates=True), x=1)
+        self.assertEqual(_CALLS.count("increment"), 4)
+        self.assertEqual(run.aliases, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+import unittest
+from concurrent import futures
+
+from unit import _fixtures
+
+from pyiron_workflow import execution, resources, workflow_node
+
+_ACTIVE: dict[str, int] = {}
+_PEAKS: dict[str, int] = {}
+_ACTIVE_LOCK = threading.Lock()
+
+
+def occupy(kind: str, seconds: float = 0.1) -> str:
+    """Track the peak number of concurrently running calls per `kind`."""
+    with _ACTIVE_LOCK:
+        _ACTIVE[kind] = _ACTIVE.get(kind, 0) + 1
+        _PEAKS[kind] = max(_PEAKS.get(kind, 0), _ACTIVE[kind])
+    time.sleep(seconds)
+    with _ACTIVE_LOCK:
+        _ACTIVE[kind] -= 1
+    return kind
+
+
+# --------------------------------------------------------------------------- #
+# Resources                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+class TestResources(unittest.TestCase):
+    def test_rejects_negative_amounts(self) -> None:
+        for kwargs in ({"cores": -1}, {"memory": -1}, {"custom": {"gpus": -1}}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                resources.Resources(**kwargs)
+
+    def test_fits_within(self) -> None:
+        budget = resources.Resources(cores=8, memory=64, custom={"gpus": 1})
+        self.assertTrue(resources.Resources(cores=8, memory=64).fits_within(budget))
+        self.assertTrue(resources.Resources(custom={"gpus": 1}).fits_within(budget))
+        self.assertFalse(resources.Resources(cores=9).fits_within(budget))
+        self.assertFalse(resources.Resources(memory=65).fits_within(budget))
+        self.assertFalse(resources.Resources(custom={"gpus": 2}).fits_within(budget))
+        self.assertFalse(
+            resources.Resources(custom={"licenses": 1}).fits_within(budget),
+            msg="Unlisted custom resources are unavailable",
+        )
+
+    def test_arithmetic(self) -> None:
+        a = resources.Resources(cores=4, memory=10, custom={"gpus": 1})
+        b = resources.Resources(cores=1, memory=2, custom={"licenses": 1})
+        self.assertEqual(
+            (a + b) - b, resources.Resources(4, 10, {"gpus": 1, "licenses": 0})
+        )
+
+
+# --------------------------------------------------------------------------- #
+# ResourcePool                                                                #
+# --------------------------------------------------------------------------- #
+
+
+class TestResourcePool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = resources.ResourcePool(resources.Resources(cores=4, memory=8))
+
+    def test_claim_is_returned_on_exit(self) -> None:
+        with self.pool.claim(resources.Resources(cores=3, memory=8)) as granted:
+            self.assertTrue(granted)
+            self.assertEqual(self.pool.available, resources.Resources(1, 0))
+        self.assertEqual(self.pool.available, self.pool.budget)
+
+    def test_claim_is_returned_on_error(self) -> None:
+        with (
+            self.assertRaises(RuntimeError),
+            self.pool.claim(resources.Resources(cores=4)),
+        ):
+            raise RuntimeError("boom")
+        self.assertEqual(self.pool.available, self.pool.budget)
+
+    def test_oversized_claim_raises_instead_of_waiting_forever(self) -> None:
+        with (
+            self.assertRaises(resources.InsufficientResourcesError),
+            self.pool.claim(resources.Resources(memory=9)),
+        ):
+            pass  # pragma: no cover
+
+    def test_claim_waits_for_release(self) -> None:
+        order = []
+        with self.pool.claim(resources.Resources(cores=4)):
+
+            def second():
+                with self.pool.claim(resources.Resources(cores=1)):
+                    order.append("second")
+
+            thread = threading.Thread(target=second)
+            thread.start()
+            time.sleep(0.1)
+            order.append("first")
+        thread.join()
+        self.assertEqual(order, ["first", "second"])
+
+    def test_waiting_claim_can_be_abandoned(self) -> None:
+        with (
+            self.pool.claim(resources.Resources(cores=4)),
+            self.pool.claim(resources.Resources(cores=1), lambda: True) as granted,
+        ):
+            self.assertFalse(granted)
+        self.assertEqual(self.pool.available, self.pool.budget)
+
+    def test_pickle_gives_fresh_full_pool(self) -> None:
+        with self.pool.claim(resources.Resources(cores=4)):
+            restored = pickle.loads(pickle.dumps(self.pool))
+        self.assertEqual(restored.available, self.pool.budget)
+
+
+# --------------------------------------------------------------------------- #
+# Scheduling against a budget                                                 #
+# --------------------------------------------------------------------------- #
+
+
+class TestResourceAwareRun(unittest.TestCase):
+    def setUp(self) -> None:
+        _ACTIVE.clear()
+        _PEAKS.clear()
+        self.wf = workflow_node.Workflow("wf")
+        for i in range(2):
+            setattr(self.wf, f"big_{i}", occupy)
+            getattr(self.wf, f"big_{i}")(kind="big")
+            getattr(self.wf, f"big_{i}").resources = resources.Resources(
+                cores=4, memory=100
+            )
+        for i in range(4):
+            setattr(self.wf, f"small_{i}", occupy)
+            getattr(self.wf, f"small_{i}")(kind="small")
+
+    def test_big_nodes_are_not_co_scheduled(self) -> None:
+        config = execution.RunConfig(
+            resource_budget=resources.Resources(cores=6, memory=128)
+        )
+        run = self.wf.run(config)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertEqual(_PEAKS["big"], 1)
+        self.assertGreater(_PEAKS["small"], 1, msg="Small nodes fill idle capacity")
+
+    def test_no_budget_means_no_limits(self) -> None:
+        self.wf.run()
+        self.assertEqual(_PEAKS["big"], 2)
+
+    def test_composites_on_thread_pools_leave_claims_to_children(self) -> None:
+        # A claim held by the macro would leave nothing for its children
+        macro = _fixtures.macro_node()
+        macro.executor = futures.ThreadPoolExecutor(max_workers=1)
+        config = execution.RunConfig(resource_budget=resources.Resources(cores=1))
+        try:
+            run = _fixtures.run_or_fail(self, macro, config, x=1, y=2, z=3)
+        finally:
+            macro.executor.shutdown(wait=False)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertDictEqual(
+            dict(run.outputs), dict(_fixtures.macro_node().run(x=1, y=2, z=3).outputs)
+        )
+
+    def test_oversized_node_fails_the_run(self) -> None:
+        config = execution.RunConfig(
+            resource_budget=resources.Resources(cores=2), dag_layers_fail_fast=True
+        )
+        with self.assertRaises(resources.InsufficientResourcesError):
+            self.wf.run(config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import contextlib
+import pickle
+import threading
+import time
+import unittest
+from concurrent import futures
+
+from unit import _fixtures
+
+from pyiron_workflow import execution, scheduling, workflow_node
+
+_ACTIVE: dict[str, int] = {}
+_PEAKS: dict[str, int] = {}
+_ACTIVE_LOCK = threading.Lock()
+
+
+def occupy(kind: str, seconds: float = 0.1) -> str:
+    """Track the peak number of concurrently running calls per `kind`."""
+    with _ACTIVE_LOCK:
+        _ACTIVE[kind] = _ACTIVE.get(kind, 0) + 1
+        _ACTIVE["all"] = _ACTIVE.get("all", 0) + 1
+        _PEAKS[kind] = max(_PEAKS.get(kind, 0), _ACTIVE[kind])
+        _PEAKS["all"] = max(_PEAKS.get("all", 0), _ACTIVE["all"])
+    time.sleep(seconds)
+    with _ACTIVE_LOCK:
+        _ACTIVE[kind] -= 1
+        _ACTIVE["all"] -= 1
+    return kind
+
+
+# --------------------------------------------------------------------------- #
+# RunScheduler                                                                #
+# --------------------------------------------------------------------------- #
+
+
+class TestRunScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.granted: list[str] = []
+        self.release = threading.Event()
+
+    def _request(self, scheduler, tenant, name) -> threading.Thread:
+        def hold() -> None:
+            with scheduler.slot(tenant, poll_interval=0.01):
+                self.granted.append(name)
+                self.release.wait(timeout=10)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        return thread
+
+    def _await_waiting(self, scheduler, n) -> None:
+        deadline = time.monotonic() + 10
+        while scheduler.waiting < n and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_rejects_bad_limits(self) -> None:
+        with self.assertRaises(ValueError):
+            scheduling.RunScheduler(0)
+        for kwargs in ({"share": 0}, {"quota": 0}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                scheduling.Tenant(**kwargs)
+        for kwargs in ({"run_share": 0}, {"run_quota": 0}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                execution.RunConfig(**kwargs)
+
+    def test_priority_goes_first(self) -> None:
+        scheduler = scheduling.RunScheduler(1)
+        low, high = scheduling.Tenant(priority=0), scheduling.Tenant(priority=1)
+        with scheduler.slot(scheduling.Tenant()):
+            threads = [self._request(scheduler, low, "low")]
+            self._await_waiting(scheduler, 1)
+            threads.append(self._request(scheduler, high, "high"))
+            self._await_waiting(scheduler, 2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(self.granted, ["high", "low"])
+
+    def test_fewest_held_goes_first(self) -> None:
+        scheduler = scheduling.RunScheduler(2)
+        busy, idle = scheduling.Tenant(), scheduling.Tenant()
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(scheduler.slot(busy))
+            with scheduler.slot(busy):
+                threads = [self._request(scheduler, busy, "busy")]
+                self._await_waiting(scheduler, 1)
+                threads.append(self._request(scheduler, idle, "idle"))
+                self._await_waiting(scheduler, 2)
+            # One slot is free, and the idle tenant gets it despite arriving later
+            deadline = time.monotonic() + 10
+            while len(self.granted) == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertListEqual(self.granted, ["idle"])
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(self.granted, ["idle", "busy"])
+
+    def test_quota(self) -> None:
+        scheduler = scheduling.RunScheduler(3)
+        tenant = scheduling.Tenant(quota=1)
+        with scheduler.slot(tenant):
+            thread = self._request(scheduler, tenant, "second")
+            time.sleep(0.1)
+            self.assertListEqual(self.granted, [], msg="Free slots, but over quota")
+            self.assertEqual(scheduler.waiting, 1)
+        self.release.set()
+        thread.join(timeout=10)
+        self.assertListEqual(self.granted, ["second"])
+        self.assertEqual(scheduler.running, 0)
+
+    def test_abandon(self) -> None:
+        scheduler = scheduling.RunScheduler(1)
+        with (
+            scheduler.slot(scheduling.Tenant()),
+            scheduler.slot(scheduling.Tenant(), lambda: True) as granted,
+        ):
+            self.assertFalse(granted)
+            self.assertEqual(scheduler.running, 1)
+            self.assertEqual(scheduler.waiting, 0)
+
+    def test_pickles_fresh(self) -> None:
+        scheduler = scheduling.RunScheduler(2)
+        tenant = scheduling.Tenant(priority=3, share=2.0, quota=1)
+        with scheduler.slot(tenant):
+            scheduler_copy = pickle.loads(pickle.dumps(scheduler))
+            tenant_copy = pickle.loads(pickle.dumps(tenant))
+        self.assertEqual(scheduler_copy.max_workers, 2)
+        self.assertEqual(scheduler_copy.running, 0)
+        self.assertEqual(
+            (
+                tenant_copy.priority,
+                tenant_copy.share,
+                tenant_copy.quota,
+                tenant_copy.running,
+            ),
+            (3, 2.0, 1, 0),
+        )
+
+
+# --------------------------------------------------------------------------- #
+# Scheduled runs                                                              #
+# --------------------------------------------------------------------------- #
+
+
+class TestScheduledRuns(unittest.TestCase):
+    def setUp(self) -> None:
+        _ACTIVE.clear()
+        _PEAKS.clear()
+
+    @staticmethod
+    def _workflow(kind: str, n: int) -> workflow_node.Workflow:
+        wf = workflow_node.Workflow(kind)
+        for i in range(n):
+            setattr(wf, f"occupy_{i}", occupy)
+            getattr(wf, f"occupy_{i}")(kind=kind)
+        return wf
+
+    def _run_concurrently(self, *configured) -> list[execution.Run]:
+        runs: list[execution.Run] = []
+
+        def run(wf, config) -> None:
+            runs.append(wf.run(config))
+
+        threads = [threading.Thread(target=run, args=pair) for pair in configured]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return runs
+
+    def test_runs_share_the_worker_limit(self) -> None:
+        scheduler = scheduling.RunScheduler(3)
+        runs = self._run_concurrently(
+            (self._workflow("big", 8), execution.RunConfig(scheduler=scheduler)),
+            (self._workflow("small", 2), execution.RunConfig(scheduler=scheduler)),
+        )
+        self.assertTrue(all(r.status == execution.RunStatus.FINISHED for r in runs))
+        self.assertEqual(_PEAKS["all"], 3)
+        self.assertEqual(scheduler.running, 0)
+
+    def test_run_quota(self) -> None:
+        scheduler = scheduling.RunScheduler(4)
+        self._run_concurrently(
+            (
+                self._workflow("capped", 4),
+                execution.RunConfig(scheduler=scheduler, run_quota=1),
+            ),
+            (self._workflow("free", 4), execution.RunConfig(scheduler=scheduler)),
+        )
+        self.assertEqual(_PEAKS["capped"], 1)
+        self.assertGreater(_PEAKS["free"], 1)
+
+    def test_composites_on_thread_pools_leave_slots_to_children(self) -> None:
+        # A slot held by the macro would leave nothing for its children
+        macro = _fixtures.macro_node()
+        macro.executor = futures.ThreadPoolExecutor(max_workers=1)
+        scheduler = scheduling.RunScheduler(1)
+        try:
+            run = _fixtures.run_or_fail(
+                self, macro, execution.RunConfig(scheduler=scheduler), x=1, y=2, z=3
+            )
+        finally:
+            macro.executor.shutdown(wait=False)
+        self.assertEqual(run.status, execution.RunStatus.FINISHED)
+        self.assertDictEqual(
+            dict(run.outputs), dict(_fixtures.macro_node().run(x=1, y=2, z=3).outputs)
+        )
+        self.assertEqual(scheduler.running, 0)
+
+    def test_no_scheduler_means_no_limits(self) -> None:
+        self._workflow("big", 4).run()
+        self.assertEqual(_PEAKS["big"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import pathlib
+import pickle
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import flowrep as fr
+from unit import _fixtures
+
+from pyiron_workflow import api as wfms
+from pyiron_workflow import singleflight
+
+CALLS = []
+
+
+@fr.atomic
+def slow_square(x):
+    CALLS.append(x)
+    time.sleep(0.2)
+    return x * x
+
+
+@fr.workflow
+def squares(x):
+    a = slow_square(x)
+    b = slow_square(x)
+    return a, b
+
+
+class TestFlightKey(unittest.TestCase):
+    def test_keys(self):
+        recipe = _fixtures.atomic_add_node().recipe
+        key = singleflight.flight_key(recipe, {"x": 1, "y": 2})
+        self.assertEqual(key, singleflight.flight_key(recipe, {"y": 2, "x": 1}))
+        self.assertNotEqual(key, singleflight.flight_key(recipe, {"x": 2, "y": 1}))
+        self.assertNotEqual(
+            key,
+            singleflight.flight_key(
+                _fixtures.atomic_sub_node().recipe, {"x": 1, "y": 2}
+            ),
+        )
+        self.assertIsNone(
+            singleflight.flight_key(recipe, {"x": lambda: None, "y": 2}),
+            msg="Unpicklable input can't be keyed",
+        )
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = pathlib.Path(tempfile.mkdtemp())
+        self.release = threading.Event()
+        self.computed = []
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _compute(self, outputs, fail=False):
+        def compute():
+            self.computed.append(outputs)
+            self.release.wait(timeout=10)
+            if fail:
+                raise RuntimeError("Failed")
+            return outputs
+
+        return compute
+
+    def _share(self, flights, compute, results):
+        def share():
+            try:
+                results.append(flights.share("key", compute))
+            except RuntimeError as e:
+                results.append(e)
+
+        thread = threading.Thread(target=share)
+        thread.start()
+        return thread
+
+    def _await_flight(self, flights):
+        deadline = time.monotonic() + 10
+        while len(self.computed) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_concurrent_callers_share(self):
+        flights = singleflight.SingleFlight(poll_interval=0.01)
+        results = []
+        threads = [self._share(flights, self._compute({"y": 1}), results)]
+        self._await_flight(flights)
+        threads += [
+            self._share(flights, self._compute({"y": 2}), results) for _ in range(3)
+        ]
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(results, [{"y": 1}] * 4)
+        self.assertEqual(len(self.computed), 1)
+        self.assertEqual(flights.shared, 3)
+
+        self.assertDictEqual(
+            flights.share("key", lambda: {"y": 3}),
+            {"y": 3},
+            msg="Later callers compute afresh",
+        )
+
+    def test_failures_are_not_shared(self):
+        flights = singleflight.SingleFlight(poll_interval=0.01)
+        results = []
+        leader = self._share(flights, self._compute({"y": 1}, fail=True), results)
+        self._await_flight(flights)
+        follower = self._share(flights, self._compute({"y": 2}), results)
+        time.sleep(0.1)
+        self.release.set()
+        leader.join()
+        follower.join()
+        self.assertIsInstance(results[0], RuntimeError)
+        self.assertListEqual(results[1:], [{"y": 2}])
+        self.assertEqual(flights.shared, 0)
+
+    def test_processes_share_through_the_directory(self):
+        # Separate instances only share the directory, as separate processes would
+        leading = singleflight.SingleFlight(self.directory, poll_interval=0.01)
+        following = pickle.loads(pickle.dumps(leading))
+        self.assertEqual(following.directory, self.directory)
+        results = []
+        leader = self._share(leading, self._compute({"y": 1}), results)
+        self._await_flight(leading)
+        follower = self._share(following, self._compute({"y": 2}), results)
+        time.sleep(0.1)
+        self.release.set()
+        leader.join()
+        follower.join()
+        self.assertListEqual(results, [{"y": 1}] * 2)
+        self.assertEqual(len(self.computed), 1)
+        self.assertEqual(following.shared, 1)
+        self.assertListEqual(
+            list(self.directory.iterdir()),
+            [],
+            msg="Once read, the shared outputs are removed along with the lock",
+        )
+
+    def test_unawaited_outputs_are_removed(self):
+        flights = singleflight.SingleFlight(self.directory, poll_interval=0.01)
+        self.assertDictEqual(flights.share("key", lambda: {"y": 1}), {"y": 1})
+        self.assertListEqual(list(self.directory.iterdir()), [])
+
+    def test_abandoned_locks_are_broken(self):
+        finished = subprocess.run(
+            [sys.executable, "-c", "import os; print(os.getpid())"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        dead_pid = finished.stdout.strip()
+        (self.directory / "key.lock").write_text(f"{socket.gethostname()} {dead_pid}\n")
+        flights = singleflight.SingleFlight(self.directory, poll_interval=0.01)
+        self.assertDictEqual(flights.share("key", lambda: {"y": 1}), {"y": 1})
+
+
+class TestRunSingleFlight(unittest.TestCase):
+    def setUp(self) -> None:
+        CALLS.clear()
+
+    def test_siblings_share(self):
+        flights = singleflight.SingleFlight(poll_interval=0.01)
+        run = wfms.node(squares).run(wfms.RunConfig(single_flight=flights), x=3)
+        self.assertDictEqual(dict(run.outputs), {"a": 9, "b": 9})
+        self.assertListEqual(CALLS, [3])
+        self.assertEqual(flights.shared, 1)
+        self.assertTrue(
+            all(step.status == "finished" for step in run.steps),
+            msg="Sharing runs finish just like computing ones",
+        )
+
+    def test_off_by_default(self):
+        run = wfms.node(squares).run(x=3)
+        self.assertDictEqual(dict(run.outputs), {"a": 9, "b": 9})
+        self.assertListEqual(CALLS, [3, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
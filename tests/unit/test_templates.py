@@ -0,0 +1,51 @@
+import pickle
+import unittest
+
+import flowrep as fr
+from unit import _fixtures
+
+from pyiron_workflow import history, templates
+
+
+class TestTemplateCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.recipe = _fixtures.atomic_add_node().recipe
+        self.key = history.recipe_key(self.recipe)
+
+    def test_miss_without_recipe(self) -> None:
+        cache = templates.TemplateCache()
+        with self.assertRaises(templates.TemplateMissError):
+            cache.instantiate(self.key)
+        self.assertNotIn(self.key, cache)
+
+    def test_instances_are_fresh(self) -> None:
+        cache = templates.TemplateCache()
+        first = cache.instantiate(self.key, self.recipe)
+        first.input_ports["x"].value = 1
+        second = cache.instantiate(self.key)
+        self.assertIn(self.key, cache)
+        self.assertIsNot(first, second)
+        self.assertIsInstance(second.input_ports["x"].value, fr.schemas.NotData)
+        self.assertIs(first.function, second.function)
+
+    def test_least_recently_used_are_discarded(self) -> None:
+        cache = templates.TemplateCache(maxsize=1)
+        other = _fixtures.atomic_sub_node().recipe
+        cache.instantiate(self.key, self.recipe)
+        cache.instantiate(history.recipe_key(other), other)
+        self.assertEqual(len(cache), 1)
+        self.assertNotIn(self.key, cache)
+
+    def test_pickles_empty(self) -> None:
+        cache = templates.TemplateCache(maxsize=3)
+        cache.instantiate(self.key, self.recipe)
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(restored.maxsize, 3)
+        self.assertEqual(len(restored), 0)
+
+    def test_resident_is_per_process(self) -> None:
+        self.assertIs(templates.resident(), templates.resident())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import pickle
+import unittest
+from multiprocessing import shared_memory
+
+from unit import _fixtures
+
+from pyiron_workflow import transfer
+
+
+class TestTransfer(unittest.TestCase):
+    def test_without_threshold_everything_is_in_band(self) -> None:
+        data = _fixtures.Blob(4096)
+        packed, segments = transfer.pack(data, None)
+        self.assertEqual(segments, [])
+        self.assertEqual(packed.shared, 0)
+        self.assertEqual(pickle.loads(packed.payload), data)
+
+    def test_round_trip(self) -> None:
+        large, small = _fixtures.Blob(b"x" * 4096), _fixtures.Blob(b"y" * 16)
+        packed, sent = transfer.pack({"large": large, "small": small}, 1024)
+        self.assertEqual(packed.pid, os.getpid())
+        self.assertEqual(packed.threshold, 1024)
+        self.assertEqual(packed.shared, len(large))
+        self.assertLess(len(packed.payload), len(large))
+        try:
+            unpacked, received = transfer.unpack(packed)
+            transfer.release(received, unlink=False)
+        finally:
+            transfer.release(sent, unlink=True)
+        self.assertEqual(unpacked, {"large": large, "small": small})
+
+    def test_release_unlinks(self) -> None:
+        packed, sent = transfer.pack(_fixtures.Blob(4096), 1024)
+        transfer.release(sent, unlink=True)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(packed.segments[0].name)
+
+    def test_shares_tracker_with_itself(self) -> None:
+        self.assertTrue(transfer.shares_tracker(os.getpid()))
+        self.assertFalse(transfer.shares_tracker(-1))
+
+
+if __name__ == "__main__":
+    unittest.main()
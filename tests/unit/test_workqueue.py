@@ -0,0 +1,117 @@
+import pathlib
+import shutil
+import tempfile
+import threading
+import unittest
+
+from unit import _fixtures
+
+from pyiron_workflow import api as wfms
+from pyiron_workflow import executorlib, workqueue
+
+
+def fail(x):
+    raise ValueError(f"Failed on {x}")
+
+
+class TestQueueExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = pathlib.Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _worker(self, directory, max_tasks) -> threading.Thread:
+        worker = threading.Thread(
+            target=workqueue.serve,
+            args=(directory,),
+            kwargs={"poll_interval": 0.01, "max_tasks": max_tasks},
+            daemon=True,
+        )
+        worker.start()
+        return worker
+
+    def test_round_trip(self):
+        with workqueue.QueueExecutor(self.directory, poll_interval=0.01) as exe:
+            futures_ = [exe.submit(_fixtures.plain_increment, i) for i in range(3)]
+            failing = exe.submit(fail, 42)
+            worker = self._worker(self.directory, max_tasks=4)
+            self.assertListEqual([f.result(timeout=10) for f in futures_], [1, 2, 3])
+            with self.assertRaises(ValueError):
+                failing.result(timeout=10)
+        worker.join(timeout=10)
+        self.assertListEqual(
+            list(self.directory.iterdir()), [], msg="Nothing should be left behind"
+        )
+
+    def test_cancel_withdraws_unclaimed_tasks(self):
+        exe = workqueue.QueueExecutor(self.directory, poll_interval=0.01)
+        future = exe.submit(_fixtures.plain_increment, 1)
+        self.assertTrue(future.cancel())
+        exe.shutdown(wait=True)
+        self.assertListEqual(list(self.directory.iterdir()), [])
+        self.assertEqual(workqueue.serve(self.directory, idle_timeout=0), 0)
+
+    def test_tasks_are_claimed_once(self):
+        exe = workqueue.QueueExecutor(self.directory)
+        future = exe.submit(_fixtures.plain_increment, 1)
+        (task_file,) = self.directory.glob("*.task")
+        self.assertTrue(workqueue._claim(task_file))
+        self.assertFalse(workqueue._claim(task_file))
+        self.assertFalse(workqueue.work(task_file), msg="Another worker has it")
+        # Releasing the claim offers the task again, here to be withdrawn
+        task_file.with_suffix(".lock").unlink()
+        future.cancel()
+        exe.shutdown(wait=True)
+        self.assertListEqual(list(self.directory.iterdir()), [])
+
+    def test_run_dir_queue(self):
+        node = _fixtures.macro_node()
+        node.add_0.executor = workqueue.QueueExecutor(poll_interval=0.01)
+        worker = self._worker(
+            self.directory / workqueue.QueueExecutor.queue_directory, max_tasks=1
+        )
+        run = node.run(wfms.RunConfig(run_dir=self.directory), x=1, y=2, z=3)
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive(), msg="The worker should have done a task")
+        self.assertDictEqual(
+            run.outputs, _fixtures.macro_node().run(x=1, y=2, z=3).outputs
+        )
+
+    def test_run_dir_queue_is_dedicated(self):
+        with (
+            workqueue.QueueExecutor() as exe,
+            self.assertRaises(executorlib.DedicatedExecutorError),
+        ):
+            exe.submit(_fixtures.plain_increment, 1)
+
+    def test_submit_after_shutdown(self):
+        exe = workqueue.QueueExecutor(self.directory)
+        exe.shutdown()
+        with self.assertRaises(RuntimeError):
+            exe.submit(_fixtures.plain_increment, 1)
+        self.assertListEqual(list(self.directory.iterdir()), [])
+        dedicated = workqueue.QueueExecutor()
+        dedicated.shutdown()
+        with self.assertRaises(RuntimeError, msg="Shutdown is checked first"):
+            dedicated.submit(_fixtures.plain_increment, 1)
+
+    def test_poller_stops_when_idle(self):
+        exe = workqueue.QueueExecutor(self.directory, poll_interval=0.01)
+        worker = self._worker(self.directory, max_tasks=2)
+        self.assertEqual(exe.submit(_fixtures.plain_increment, 1).result(10), 2)
+        poller = exe._poller
+        if poller is not None:
+            poller.join(timeout=10)
+            self.assertFalse(poller.is_alive(), msg="Nothing is pending")
+        self.assertEqual(
+            exe.submit(_fixtures.plain_increment, 2).result(10),
+            3,
+            msg="The next submission starts polling again",
+        )
+        exe.shutdown()
+        worker.join(timeout=10)
+
+
+if __name__ == "__main__":
+    unittest.main()